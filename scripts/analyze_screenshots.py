@@ -1,13 +1,32 @@
 #!/usr/bin/env python3
 """
 截图分析和筛选脚本
-分析截图内容，筛选适合作为文档配图的图片
+分析截图内容，筛选适合作为文档配图的图片。
+逐张审阅之前先按图像指标（拉普拉斯方差、亮度均值/方差、边缘密度）自动预评分，
+明显不可用的黑屏、空白截图直接移出；模糊或内容很少的截图（低分辨率下与简洁的标题页难以区分）
+保留在审阅集中并附带提示
 """
+import argparse
 import os
 import sys
 import json
 import shutil
 
+import numpy as np
+
+from image_metrics import (cached_metrics, edge_density, laplacian_variance, load_info, luminance_stats, move_aside,
+                           resolve_info_path, save_info)
+
+# 自动预评分阈值（图片缩放为 256x144 灰度后计算）
+BLANK_STD = 6.0         # 亮度标准差低于该值：纯色 / 黑屏 / 白屏
+DARK_MEAN = 20.0        # 亮度均值低于该值且几乎没有边缘：黑屏 / 过暗
+BLUR_VAR = 30.0         # 拉普拉斯方差低于该值：模糊
+SHARP_VAR = 200.0       # 拉普拉斯方差高于该值：清晰
+EDGE_LOW = 0.01         # 边缘密度低于该值：几乎没有内容
+EDGE_HIGH = 0.06        # 边缘密度高于该值：信息量大（代码、文字、界面）
+REJECT_SCORE = 1        # 预评分不高于该值的截图直接移出，不进入逐张审阅（默认只移出空白/黑屏）
+REJECTED_DIR = 'rejected'
+
 # 图片分析标准
 ANALYSIS_CRITERIA = """
 ## 截图分析标准
@@ -34,13 +53,74 @@ ANALYSIS_CRITERIA = """
 - 1分：不适合，应删除
 """
 
+def prescore(laplacian_var, luma_mean, luma_var, edges):
+    """按图像指标给出 1-5 分预评分（数组输入），返回 (分数数组, 原因列表)"""
+    luma_std = np.sqrt(luma_var)
+    conditions = [
+        luma_std < BLANK_STD,
+        (luma_mean < DARK_MEAN) & (edges < EDGE_LOW),
+        (laplacian_var < BLUR_VAR) | (edges < EDGE_LOW),
+        (laplacian_var >= SHARP_VAR) & (edges >= EDGE_HIGH),
+        laplacian_var >= SHARP_VAR,
+    ]
+    scores = np.select(conditions, [1, 1, 2, 5, 4], default=3)
+    reasons = np.select(conditions, ['空白/纯色画面', '黑屏/过暗', '可能模糊或内容很少（简洁的标题页也会如此），需确认', '清晰且信息量大', '清晰'],
+                        default='需要人工判断')
+    return scores, reasons.tolist()
+
+def quality_records(images):
+    """一批灰度图的图像指标与预评分"""
+    lap = laplacian_variance(images)
+    luma_mean, luma_var = luminance_stats(images)
+    edges = edge_density(images)
+    scores, reasons = prescore(lap, luma_mean, luma_var, edges)
+    return [{
+        'laplacian_var': round(float(lap[k]), 2),
+        'luma_mean': round(float(luma_mean[k]), 2),
+        'luma_var': round(float(luma_var[k]), 2),
+        'edge_density': round(float(edges[k]), 4),
+        'prescore': int(scores[k]),
+        'reason': reasons[k],
+    } for k in range(len(images))]
+
+def compute_quality(screenshots):
+    """为每张截图补全 'quality'（图像指标 + 预评分 + stamp），返回新计算的数量"""
+    return cached_metrics(screenshots, 'quality', quality_records)
+
+def prefilter_screenshots(info_path, move=True, reject_score=REJECT_SCORE):
+    """对 screenshots_info.json 中的截图预评分，不高于 reject_score 的移入 rejected/ 并记录，返回 (待审阅列表, 移出列表)"""
+    info, screenshots = load_info(info_path)
+    computed = compute_quality(screenshots)
+    print(f"计算图像指标 {computed} 张，复用缓存 {len(screenshots) - computed} 张")
+
+    remaining = []
+    rejected = []
+    rejected_dir = os.path.join(os.path.dirname(info_path), REJECTED_DIR)
+    for shot in screenshots:
+        quality = shot['quality']
+        if not move or quality['prescore'] > reject_score:
+            remaining.append(shot)
+            continue
+        move_aside(shot, rejected_dir, 'quality')
+        rejected.append(shot)
+        print(f"  移出: {shot['filename']}（{quality['prescore']} 分，{quality['reason']}）")
+
+    save_info(info_path, info, remaining, 'rejected', rejected)
+    return remaining, rejected
+
 def generate_analysis_prompt(screenshot_info, doc_outline=None):
     """生成图片分析提示词"""
+    quality_line = ''
+    quality = screenshot_info.get('quality')
+    if quality:
+        quality_line = (f"\n- 自动预评分: {quality['prescore']} 分（{quality['reason']}；"
+                        f"清晰度 {quality['laplacian_var']:.0f}，亮度 {quality['luma_mean']:.0f}，"
+                        f"边缘密度 {quality['edge_density']:.3f}）")
     prompt = f"""请分析以下截图，判断其是否适合作为文档配图。
 
 ## 截图信息：
 - 文件名: {screenshot_info['filename']}
-- 时间点: {screenshot_info.get('timestamp_str', 'N/A')}
+- 时间点: {screenshot_info.get('timestamp_str', 'N/A')}{quality_line}
 
 {ANALYSIS_CRITERIA}
 
@@ -145,15 +225,39 @@ def generate_markdown_images(kept_screenshots):
 
     return markdown_snippets
 
+def parse_args(argv):
+    """解析命令行参数"""
+    parser = argparse.ArgumentParser(description='截图自动预评分：移出黑屏、空白截图')
+    parser.add_argument('info_path', help='extract_frames.py 输出的 screenshots_info.json（或其所在目录）')
+    parser.add_argument('--no-move', action='store_true', help='只评分并写入 JSON，不移动截图')
+    parser.add_argument('--reject-score', type=int, default=REJECT_SCORE, choices=range(0, 5),
+                        help=f'预评分不高于该值的截图移出（默认 {REJECT_SCORE}：空白/黑屏；2 时同时移出模糊截图）')
+    return parser.parse_args(argv)
+
 def main():
-    print("截图分析和筛选工具")
-    print("=" * 50)
-    print(ANALYSIS_CRITERIA)
-    print("\n使用方法：")
-    print("1. 运行 extract_frames.py 提取截图")
-    print("2. 使用 Claude 的 Read 工具逐张分析截图")
-    print("3. 根据分析结果筛选和重命名截图")
-    print("4. 将保留的截图插入到 Markdown 文档中")
+    if len(sys.argv) < 2:
+        print("截图分析和筛选工具")
+        print("=" * 50)
+        print(ANALYSIS_CRITERIA)
+        print("\n使用方法：")
+        print("1. 运行 extract_frames.py 提取截图")
+        print("2. 运行 python analyze_screenshots.py <截图目录> 自动预评分，移出黑屏/空白截图")
+        print("3. 使用 Claude 的 Read 工具逐张分析剩余截图")
+        print("4. 根据分析结果筛选和重命名截图")
+        print("5. 将保留的截图插入到 Markdown 文档中")
+        return
+
+    args = parse_args(sys.argv[1:])
+    info_path = resolve_info_path(args.info_path)
+    if info_path is None:
+        print(f"错误: 找不到 {args.info_path}（或其中的 screenshots_info.json）")
+        sys.exit(1)
+
+    remaining, rejected = prefilter_screenshots(info_path, move=not args.no_move, reject_score=args.reject_score)
+    print(f"\n预评分完成！移出 {len(rejected)} 张（{REJECTED_DIR}/），待逐张审阅 {len(remaining)} 张：")
+    for shot in remaining:
+        quality = shot['quality']
+        print(f"  [{quality['prescore']}分] {shot['filename']} - {quality['reason']}")
 
 if __name__ == '__main__':
     main()
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+纯音频剪辑快速通道
+没有视频流（或只有封面图）的素材不走视频管线：
+- 默认用 atrim/atempo/concat 滤镜图一次输出 m4a / opus
+- --pcm 时先解码为原始 PCM，再用 NumPy 按采样点精确切片写出，速度最快（仅限无变速方案）
+"""
+import os
+import wave
+
+import numpy as np
+
+from ffmpeg_runner import run_ffmpeg
+
+# 输出格式 -> 音频编码参数
+AUDIO_CODECS = {
+    'm4a': ['-c:a', 'aac', '-b:a', '192k'],
+    'opus': ['-c:a', 'libopus', '-b:a', '96k'],
+    'wav': ['-c:a', 'pcm_s16le'],
+}
+
+def is_audio_only(streams):
+    """没有真正的视频流：无视频流，或视频流只是封面图 / 单帧静态图"""
+    has_audio = any(s.get('codec_type') == 'audio' for s in streams)
+    for s in streams:
+        if s.get('codec_type') != 'video':
+            continue
+        if s.get('disposition', {}).get('attached_pic'):
+            continue
+        if str(s.get('nb_frames', '')).isdigit() and int(s['nb_frames']) <= 1:
+            continue
+        return False
+    return has_audio
+
+def audio_stream(streams):
+    """第一条音频流的参数"""
+    for s in streams:
+        if s.get('codec_type') == 'audio':
+            return s
+    return None
+
+def build_audio_graph(segments):
+    """纯音频的 atrim/atempo/concat 滤镜图（每段一行，写入滤镜脚本）"""
+    parts = []
+    labels = []
+    for i, seg in enumerate(segments):
+        chain = f"[0:a]atrim=start={seg['start_sec']:.6f}:end={seg['end_sec']:.6f},asetpts=PTS-STARTPTS"
+        speed = seg.get('speed', 1.0)
+        if speed != 1.0:
+            chain += f",atempo={speed:.3f}"
+        parts.append(chain + f"[a{i}]")
+        labels.append(f"[a{i}]")
+    parts.append(f"{''.join(labels)}concat=n={len(segments)}:v=0:a=1[outa]")
+    return ';\n'.join(parts)
+
+def render_audio(segments, input_path, output_path, temp_dir, audio_format='m4a', metrics=None):
+    """滤镜图方式：一次解码、一次编码输出音频，返回是否成功"""
+    script_path = os.path.join(temp_dir, 'audio_graph.txt')
+    with open(script_path, 'w', encoding='utf-8') as f:
+        f.write(build_audio_graph(segments))
+
+    cmd = [
+        'ffmpeg', '-y', '-i', input_path, '-vn',
+        '-filter_complex_script', script_path,
+        '-map', '[outa]',
+    ] + AUDIO_CODECS[audio_format] + [output_path]
+    expected = sum((seg['end_sec'] - seg['start_sec']) / seg.get('speed', 1.0) for seg in segments)
+    job = run_ffmpeg(cmd, expected, label='音频剪辑')
+    if metrics is not None:
+        metrics.append(job)
+    if job['returncode'] != 0:
+        print(f"  音频剪辑失败: {job['error']}")
+    return job['returncode'] == 0
+
+def slice_pcm(segments, input_path, output_path, temp_dir, sample_rate, channels,
+              audio_format='m4a', metrics=None):
+    """PCM 方式：解码为原始 s16le 后按采样点切片拼接（仅限无变速），返回是否成功"""
+    raw_path = os.path.join(temp_dir, 'source.pcm')
+    cmd = [
+        'ffmpeg', '-y', '-i', input_path, '-vn',
+        '-ac', str(channels), '-ar', str(sample_rate),
+        '-f', 's16le', '-acodec', 'pcm_s16le', raw_path
+    ]
+    job = run_ffmpeg(cmd, None, label='解码 PCM')
+    if metrics is not None:
+        metrics.append(job)
+    if job['returncode'] != 0:
+        print(f"  解码 PCM 失败: {job['error']}")
+        return False
+
+    samples = np.memmap(raw_path, dtype='<i2', mode='r')
+    frames = samples[:len(samples) // channels * channels].reshape(-1, channels)
+
+    wav_path = output_path if audio_format == 'wav' else os.path.join(temp_dir, 'cut.wav')
+    with wave.open(wav_path, 'wb') as out:
+        out.setnchannels(channels)
+        out.setsampwidth(2)
+        out.setframerate(sample_rate)
+        for seg in segments:
+            lo = min(len(frames), int(round(seg['start_sec'] * sample_rate)))
+            hi = min(len(frames), int(round(seg['end_sec'] * sample_rate)))
+            out.writeframes(np.ascontiguousarray(frames[lo:hi]).tobytes())
+    del frames, samples
+    os.remove(raw_path)
+
+    if audio_format == 'wav':
+        return True
+    cmd = ['ffmpeg', '-y', '-i', wav_path] + AUDIO_CODECS[audio_format] + [output_path]
+    job = run_ffmpeg(cmd, None, label='编码音频')
+    if metrics is not None:
+        metrics.append(job)
+    os.remove(wav_path)
+    if job['returncode'] != 0:
+        print(f"  编码音频失败: {job['error']}")
+    return job['returncode'] == 0
+
+def cut_audio(segments, input_path, output_path, temp_dir, stream, audio_format='m4a', use_pcm=False,
+              metrics=None):
+    """纯音频剪辑入口：use_pcm 且方案无变速时走 PCM 切片，否则走滤镜图，返回是否成功"""
+    if use_pcm and any(seg.get('speed', 1.0) != 1.0 for seg in segments):
+        print("  方案包含变速片段，PCM 切片无法变速，改用滤镜图")
+        use_pcm = False
+
+    if use_pcm:
+        sample_rate = int(stream.get('sample_rate') or 48000)
+        channels = int(stream.get('channels') or 2)
+        print(f"纯音频剪辑（PCM 切片）: {len(segments)} 个片段，{sample_rate}Hz {channels} 声道 -> {audio_format}")
+        return slice_pcm(segments, input_path, output_path, temp_dir, sample_rate, channels,
+                         audio_format, metrics)
+
+    print(f"纯音频剪辑（滤镜图）: {len(segments)} 个片段 -> {audio_format}")
+    return render_audio(segments, input_path, output_path, temp_dir, audio_format, metrics)
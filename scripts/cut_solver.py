@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+目标压缩比求解器 - 分桶背包
+在时长预算内最大化保留内容的「重要性 × 时长」，取代按重要性贪心剪除。
+所有重要性等级一起求解；时长按桶量化，相同（重要性, 时长桶）的片段合并为一组并做二进制拆分，
+万级片段也只需毫秒级求解
+"""
+import numpy as np
+
+RESOLUTION = 0.05   # 时长桶最小宽度（秒）
+MAX_CELLS = 4000    # 动态规划最大状态数，超过时自动加宽时长桶
+
+def _binary_parts(count):
+    """把数量拆成 1, 2, 4, ... 的组合，使任意 0..count 都能由部分组合得到"""
+    parts = []
+    k = 1
+    while count > 0:
+        take = min(k, count)
+        parts.append(take)
+        count -= take
+        k <<= 1
+    return parts
+
+def _knapsack(rows, durations, importance, need, resolution, max_cells):
+    """分桶覆盖型背包：在 rows 中选出剪除时长至少 need、代价最小的片段，返回选中的行号"""
+    step = max(resolution, need / max_cells)
+    cap = int(np.ceil(need / step))
+    weight = np.maximum(1, np.rint(durations[rows] / step).astype(np.int64))
+    imp = importance[rows]
+
+    # 相同（重要性, 时长桶）的片段可互换，合并成组；组内短文本优先剪除
+    groups = {}
+    for k in np.lexsort((durations[rows], weight, imp)).tolist():
+        groups.setdefault((int(imp[k]), int(weight[k])), []).append(int(rows[k]))
+
+    items = []  # (组键, 件数, 权重, 代价)
+    for (level, w), members in groups.items():
+        for part in _binary_parts(len(members)):
+            items.append(((level, w), part, part * w, part * level * w))
+
+    # dp[c] = 剪除至少 c 个时长桶的最小代价（c 封顶为 cap）
+    inf = np.iinfo(np.int64).max // 4
+    dp = np.full(cap + 1, inf, dtype=np.int64)
+    dp[0] = 0
+    taken = np.zeros((len(items), cap + 1), dtype=bool)
+    cap_from = np.zeros(len(items), dtype=np.int64)
+
+    for k, (_, _, w, c) in enumerate(items):
+        new = dp.copy()
+        if w < cap:
+            shifted = dp[:cap - w] + c
+            better = shifted < new[w:cap]
+            new[w:cap][better] = shifted[better]
+            taken[k, w:cap] = better
+        # 所有 c' >= cap - w 的状态选中本件后都落到封顶状态 cap
+        lo = max(0, cap - w)
+        origin = lo + int(np.argmin(dp[lo:]))
+        if dp[origin] + c < new[cap]:
+            new[cap] = dp[origin] + c
+            taken[k, cap] = True
+            cap_from[k] = origin
+        dp = new
+
+    # 回溯
+    counts = {}
+    state = cap
+    for k in range(len(items) - 1, -1, -1):
+        if not taken[k, state]:
+            continue
+        key, part, w, _ = items[k]
+        counts[key] = counts.get(key, 0) + part
+        state = int(cap_from[k]) if state == cap else state - w
+        if state == 0:
+            break
+
+    chosen = []
+    for key, count in counts.items():
+        chosen.extend(groups[key][:count])
+    return chosen, step
+
+def solve_cut(durations, importance, need, forced=None, resolution=RESOLUTION, max_cells=MAX_CELLS):
+    """求解需要剪除的片段
+
+    durations  -- 每个候选片段的（加速后）时长，秒
+    importance -- 每个候选片段的重要性
+    need       -- 至少需要剪除的时长，秒
+    forced     -- 必须保留的布尔掩码（硬约束），可为 None
+
+    剪除代价为 重要性 × 时长，即「剪够 need 秒且损失的重要性时长最小」的覆盖型背包，
+    对全部候选片段（所有重要性等级）一起做分桶动态规划：低等级的长片段不会因为等级低就被整段剪除，
+    剪几个稍高等级的短片段代价更小时选后者。
+    返回 (remove_mask, info)，info 包含 removed / shortfall / step，
+    limited 为 True 表示可剪内容（排除硬约束后）不足以达到 need。
+    """
+    durations = np.asarray(durations, dtype=np.float64)
+    importance = np.asarray(importance, dtype=np.int64)
+    n = len(durations)
+    remove = np.zeros(n, dtype=bool)
+    info = {'removed': 0.0, 'shortfall': max(0.0, float(need)), 'step': 0.0, 'limited': False}
+    if n == 0 or need <= 0:
+        return remove, info
+
+    candidates = np.ones(n, dtype=bool) if forced is None else ~np.asarray(forced, dtype=bool)
+    candidates &= durations > 0
+    rows = np.flatnonzero(candidates)
+
+    # 可剪的全部剪掉也不够：直接全剪并报告差额
+    available = float(durations[rows].sum())
+    if available <= need:
+        remove[rows] = True
+        info['removed'] = available
+        info['shortfall'] = float(need) - available
+        info['limited'] = True
+        return remove, info
+
+    chosen, step = _knapsack(rows, durations, importance, float(need), resolution, max_cells)
+    remove[chosen] = True
+
+    # 分桶取整可能导致略微不足：用能补齐缺口、代价最小的片段补上
+    deficit = float(need) - float(durations[remove].sum())
+    while deficit > 1e-6:
+        spare = rows[~remove[rows]]
+        if len(spare) == 0:
+            break
+        enough = spare[durations[spare] >= deficit]
+        if len(enough):
+            pick = enough[np.argmin(importance[enough] * durations[enough])]
+        else:
+            pick = spare[np.argmax(durations[spare])]
+        remove[pick] = True
+        deficit -= durations[pick]
+
+    info['removed'] = float(durations[remove].sum())
+    info['shortfall'] = max(0.0, float(need) - info['removed'])
+    info['step'] = float(step)
+    return remove, info
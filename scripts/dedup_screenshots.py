@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+截图去重 - 在人工/模型逐张审阅之前合并近似重复的截图
+对 screenshots_info.json 中的每张截图计算 dHash / pHash，两种哈希的汉明距离都不超过阈值的视为重复，
+以最清晰（拉普拉斯方差最大）的截图为代表帧聚类，每组只保留代表帧；
+其余移入 duplicates/ 并记录在 JSON 中。哈希按文件大小和修改时间缓存在 JSON 里，重新运行直接复用
+"""
+import argparse
+import os
+import sys
+
+import numpy as np
+
+from image_metrics import (bits_to_hex, cached_metrics, dhash, hamming_matrix, hex_to_bits, laplacian_variance,
+                           load_info, move_aside, phash, resolve_info_path, save_info)
+
+DHASH_THRESHOLD = 8     # dHash 汉明距离不超过该值视为相似
+PHASH_THRESHOLD = 8     # pHash 汉明距离不超过该值视为相似
+DUPLICATE_DIR = 'duplicates'
+
+def hash_records(images):
+    """一批灰度图的 dhash / phash / sharpness"""
+    d_bits = dhash(images)
+    p_bits = phash(images)
+    sharpness = laplacian_variance(images)
+    return [{'dhash': bits_to_hex(d_bits[k]), 'phash': bits_to_hex(p_bits[k]),
+             'sharpness': round(float(sharpness[k]), 2)} for k in range(len(images))]
+
+def compute_hashes(screenshots):
+    """为每张截图补全 'hashes'（dhash / phash / sharpness / stamp），返回新计算的数量"""
+    return cached_metrics(screenshots, 'hashes', hash_records)
+
+def cluster(screenshots, dhash_threshold=DHASH_THRESHOLD, phash_threshold=PHASH_THRESHOLD):
+    """代表帧聚类，返回 (组列表, dHash 距离矩阵)，每组第一个元素为代表帧
+
+    按清晰度从高到低遍历，每张截图只与已有各组的代表帧比较，相似则并入，否则自成一组。
+    不取相似关系的传递闭包：逐渐变化的画面（终端输出不断增长）不会因为相邻两张相似而连成一串。
+    """
+    if not screenshots:
+        return [], np.zeros((0, 0), dtype=int)
+    d_bits = np.array([hex_to_bits(shot['hashes']['dhash']) for shot in screenshots])
+    p_bits = np.array([hex_to_bits(shot['hashes']['phash']) for shot in screenshots])
+    d_dist = hamming_matrix(d_bits)
+    similar = (d_dist <= dhash_threshold) & (hamming_matrix(p_bits) <= phash_threshold)
+
+    order = sorted(range(len(screenshots)), key=lambda i: -screenshots[i]['hashes']['sharpness'])
+    groups = []
+    for i in order:
+        for group in groups:
+            if similar[i, group[0]]:
+                group.append(i)
+                break
+        else:
+            groups.append([i])
+    return groups, d_dist
+
+def dedup(info_path, dhash_threshold=DHASH_THRESHOLD, phash_threshold=PHASH_THRESHOLD):
+    """对 screenshots_info.json 去重并写回，返回 (保留数, 本次移除数)"""
+    info, screenshots = load_info(info_path)
+    computed = compute_hashes(screenshots)
+    print(f"计算哈希 {computed} 张，复用缓存 {len(screenshots) - computed} 张")
+
+    groups, d_dist = cluster(screenshots, dhash_threshold, phash_threshold)
+    duplicate_dir = os.path.join(os.path.dirname(info_path), DUPLICATE_DIR)
+    kept = []
+    dropped = []
+    for group in groups:
+        best = group[0]
+        kept.append(best)
+        for i in group:
+            if i == best:
+                continue
+            shot = screenshots[i]
+            move_aside(shot, duplicate_dir, 'hashes')
+            shot['duplicate_of'] = screenshots[best]['filename']
+            shot['distance'] = int(d_dist[i, best])
+            dropped.append(shot)
+            print(f"  重复: {shot['filename']} -> 保留 {screenshots[best]['filename']}（dHash 距离 {shot['distance']}）")
+
+    save_info(info_path, info, [screenshots[i] for i in sorted(kept)], 'duplicates', dropped)
+    return len(kept), len(dropped)
+
+def parse_args(argv):
+    """解析命令行参数"""
+    parser = argparse.ArgumentParser(description='截图去重（dHash/pHash 聚类，每组保留最清晰的一张）')
+    parser.add_argument('info_path', help='extract_frames.py 输出的 screenshots_info.json（或其所在目录）')
+    parser.add_argument('--dhash-threshold', type=int, default=DHASH_THRESHOLD,
+                        help=f'dHash 汉明距离阈值（默认 {DHASH_THRESHOLD}）')
+    parser.add_argument('--phash-threshold', type=int, default=PHASH_THRESHOLD,
+                        help=f'pHash 汉明距离阈值（默认 {PHASH_THRESHOLD}）')
+    return parser.parse_args(argv)
+
+def main():
+    if len(sys.argv) < 2:
+        print("用法: python dedup_screenshots.py <screenshots_info.json 或截图目录> [--dhash-threshold 8] [--phash-threshold 8]")
+        sys.exit(1)
+
+    args = parse_args(sys.argv[1:])
+    info_path = resolve_info_path(args.info_path)
+    if info_path is None:
+        print(f"错误: 找不到 {args.info_path}（或其中的 screenshots_info.json）")
+        sys.exit(1)
+
+    kept, dropped = dedup(info_path, args.dhash_threshold, args.phash_threshold)
+    print(f"\n去重完成！保留 {kept} 张，移除重复 {dropped} 张（移入 {DUPLICATE_DIR}/）")
+    print(f"结果已写回: {info_path}")
+
+if __name__ == '__main__':
+    main()
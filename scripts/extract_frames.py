@@ -3,44 +3,30 @@
 视频关键帧提取脚本
 从视频中提取关键帧截图，用于文档配图
 """
+import argparse
+import glob
+import math
 import subprocess
 import os
 import sys
 import json
-import re
-
-def timestamp_to_seconds(ts):
-    """将时间戳转换为秒数"""
-    if ',' in ts:
-        ts = ts.replace(',', '.')
-    parts = ts.split(':')
-    if len(parts) == 3:
-        h, m, s = parts
-        return int(h) * 3600 + int(m) * 60 + float(s)
-    elif len(parts) == 2:
-        m, s = parts
-        return int(m) * 60 + float(s)
-    else:
-        return float(ts)
-
-def parse_srt(srt_path):
-    """解析 SRT 文件"""
-    with open(srt_path, 'r', encoding='utf-8') as f:
-        content = f.read()
-
-    pattern = r'(\d+)\n(\d{2}:\d{2}:\d{2},\d{3}) --> (\d{2}:\d{2}:\d{2},\d{3})\n(.*?)(?=\n\n|\Z)'
-    segments = []
-    for match in re.finditer(pattern, content, re.DOTALL):
-        idx, start, end, text = match.groups()
-        segments.append({
-            'index': int(idx),
-            'start': start,
-            'end': end,
-            'start_sec': timestamp_to_seconds(start),
-            'end_sec': timestamp_to_seconds(end),
-            'text': text.strip()
-        })
-    return segments
+import time
+
+from ffmpeg_runner import run_ffmpeg, run_parallel
+from proxy_cache import get_proxy
+from scene_detect import detect_scene_changes
+from srt import parse_srt
+
+FRAMES_PER_CALL = 16    # 每次 FFmpeg 调用提取的截图数（一次调用顺序解码这些截图所跨的区间）
+WORKERS = 2             # 同时运行的 FFmpeg 进程数
+MAX_FRAMES = 12
+MIN_INTERVAL = 60       # 截图之间的最小间隔（秒）
+
+# 联系表：所有截图缩小后拼成网格，一次看完全部候选
+CONTACT_COLUMNS = 4
+CONTACT_ROWS = 5        # 每张联系表最多的行数，截图更多时输出多张
+THUMB_WIDTH = 480
+CONTACT_PREFIX = 'contact_sheet'
 
 def get_video_duration(video_path):
     """获取视频时长"""
@@ -55,19 +41,67 @@ def get_video_duration(video_path):
         return float(result.stdout.strip())
     return None
 
-def extract_frames(video_path, output_dir, timestamps):
-    """提取指定时间点的帧"""
+def frame_path(output_dir, i, ts):
+    """第 i 张截图的文件路径"""
+    return os.path.join(output_dir, f"{i+1:02d}_frame_{int(ts)}s.jpg")
+
+def frames_command(video_path, frames):
+    """一次调用提取多张截图：只打开一次输入、定位一次，顺序解码整个区间
+
+    frames 为按时间排序的 [(输出文件, 时间点)]。输入端定位到第一个时间点并用 -t 限定到最后一个时间点，
+    解码后的帧经 split 分给每个时间点一个 select 分支，各取时间点处（或之后）的第一帧输出。
+    """
+    first = frames[0][1]
+    span = frames[-1][1] - first + 1.0
+    cmd = ['ffmpeg', '-y', '-ss', f'{first:.3f}', '-t', f'{span:.3f}', '-i', video_path]
+    chains = [f"[0:v]split={len(frames)}" + ''.join(f"[s{k}]" for k in range(len(frames)))]
+    for k, (_, ts) in enumerate(frames):
+        chains.append(f"[s{k}]select='gte(t,{ts - first:.3f})'[f{k}]")
+    cmd += ['-filter_complex', ';'.join(chains)]
+    for k, (output_file, _) in enumerate(frames):
+        cmd += ['-map', f'[f{k}]', '-frames:v', '1', '-q:v', '2', output_file]
+    return cmd
+
+def extract_frames(video_path, output_dir, timestamps, frames_per_call=FRAMES_PER_CALL, workers=WORKERS):
+    """提取指定时间点的帧
+
+    时间点排序后按连续区间分给 workers 个并发的 FFmpeg 调用（每次最多 frames_per_call 张），
+    每次调用只打开一次容器、定位一次、用一个解码器顺序解码自己的区间，
+    省去每张截图单独启动进程、打开容器、定位和初始化解码器的开销。
+    先删除同名的旧截图；某次调用失败时报告其时间范围并删除它可能写出的不完整截图，
+    结果中只包含本次成功提取的截图。
+    """
     os.makedirs(output_dir, exist_ok=True)
     screenshots = []
 
-    for i, ts in enumerate(timestamps):
-        output_file = os.path.join(output_dir, f"{i+1:02d}_frame_{int(ts)}s.jpg")
-        cmd = [
-            'ffmpeg', '-ss', str(ts), '-i', video_path,
-            '-vframes', '1', '-q:v', '2', output_file, '-y'
-        ]
-        subprocess.run(cmd, capture_output=True)
+    order = sorted(range(len(timestamps)), key=lambda i: timestamps[i])
+    frames = [(frame_path(output_dir, i, timestamps[i]), timestamps[i]) for i in order]
+    per_call = max(1, min(frames_per_call, -(-len(frames) // max(1, workers))))
+    for output_file, _ in frames:
+        if os.path.exists(output_file):
+            os.remove(output_file)
+
+    tasks = []
+    chunks = {}
+    for offset in range(0, len(frames), per_call):
+        chunk = frames[offset:offset + per_call]
+        name = f"截图 {offset + 1}-{offset + len(chunk)}"
+        tasks.append((name, frames_command(video_path, chunk), None))
+        chunks[name] = chunk
 
+    began = time.time()
+    failures = run_parallel(tasks, workers)
+    elapsed = time.time() - began
+
+    for name, error in failures:
+        chunk = chunks[name]
+        print(f"  {name} 提取失败（{chunk[0][1]:.1f}-{chunk[-1][1]:.1f}秒，{len(chunk)} 张）: {error}")
+        for output_file, _ in chunk:
+            if os.path.exists(output_file):
+                os.remove(output_file)
+
+    for i, ts in enumerate(timestamps):
+        output_file = frame_path(output_dir, i, ts)
         if os.path.exists(output_file):
             screenshots.append({
                 'path': output_file,
@@ -77,17 +111,75 @@ def extract_frames(video_path, output_dir, timestamps):
             })
             print(f"  提取截图 {i+1}: {output_file} (时间: {int(ts//60):02d}:{int(ts%60):02d})")
 
+    if screenshots:
+        print(f"  {len(screenshots)} 张截图用时 {elapsed:.1f}秒（{len(screenshots) / max(elapsed, 1e-6):.1f} 张/秒，"
+              f"{len(tasks)} 次 FFmpeg 调用）")
     return screenshots
 
-def calculate_timestamps(duration, srt_segments=None, max_frames=12, min_interval=60):
-    """计算截图时间点"""
+def contact_sheet_command(screenshots, output_pattern, columns, rows, labels=True):
+    """联系表命令：每张截图缩小并标注序号和时间，concat 成一路后用 tile 拼成 columns x rows 网格
+
+    截图超过一张网格的容量时 tile 依次输出多张（output_pattern 含 %02d）。
+    """
+    cmd = ['ffmpeg', '-y']
+    for shot in screenshots:
+        cmd += ['-i', shot['path']]
+    chains = []
+    for k, shot in enumerate(screenshots):
+        chain = f"[{k}:v]scale={THUMB_WIDTH}:-2,setsar=1"
+        if labels:
+            label = f"{shot['filename'].split('_')[0]}  {shot['timestamp_str']}".replace(':', r'\:')
+            chain += (f",drawtext=text='{label}':x=10:y=10:fontsize=28:fontcolor=white"
+                      f":box=1:boxcolor=black@0.6:boxborderw=6")
+        chains.append(chain + f"[t{k}]")
+    inputs = ''.join(f"[t{k}]" for k in range(len(screenshots)))
+    graph = ';'.join(chains) + (f";{inputs}concat=n={len(screenshots)}:v=1:a=0,"
+                                f"tile={columns}x{rows}:padding=6:margin=6:color=black[sheet]")
+    cmd += ['-filter_complex', graph, '-map', '[sheet]', '-q:v', '3', output_pattern]
+    return cmd
+
+def build_contact_sheet(screenshots, output_dir, columns=CONTACT_COLUMNS, max_rows=CONTACT_ROWS):
+    """把截图拼成带序号和时间标注的联系表，返回联系表文件名列表
+
+    只读取已提取的截图，不再解码视频。当前 FFmpeg 不支持 drawtext（未编译 freetype）时输出不带标注的联系表。
+    """
+    for old in glob.glob(os.path.join(output_dir, f'{CONTACT_PREFIX}_*.jpg')):
+        os.remove(old)
+    if not screenshots:
+        return []
+
+    rows = min(max_rows, math.ceil(len(screenshots) / columns))
+    output_pattern = os.path.join(output_dir, f'{CONTACT_PREFIX}_%02d.jpg')
+    job = run_ffmpeg(contact_sheet_command(screenshots, output_pattern, columns, rows), label='联系表')
+    if job['returncode'] != 0:
+        print("  带标注的联系表生成失败，改为不带标注")
+        job = run_ffmpeg(contact_sheet_command(screenshots, output_pattern, columns, rows, labels=False),
+                         label='联系表')
+    if job['returncode'] != 0:
+        print(f"  联系表生成失败: {job['error']}")
+        return []
+
+    sheets = sorted(os.path.basename(path) for path in glob.glob(os.path.join(output_dir, f'{CONTACT_PREFIX}_*.jpg')))
+    print(f"  联系表: {', '.join(sheets)}（{columns} 列 x 最多 {rows} 行）")
+    return sheets
+
+def calculate_timestamps(duration, srt_segments=None, max_frames=MAX_FRAMES, min_interval=MIN_INTERVAL,
+                         scene_points=None):
+    """计算截图时间点
+
+    scene_points 为画面变化检测得到的候选时间点，提供时取代字幕停顿，不足部分仍均匀补充。
+    """
     timestamps = []
 
     if duration <= 0:
         return timestamps
 
+    # 方法0：画面变化点（已满足最小间隔）
+    if scene_points:
+        timestamps.extend(scene_points[:max_frames])
+
     # 方法1：基于字幕内容的关键点（如果有字幕）
-    if srt_segments and len(srt_segments) > 0:
+    elif srt_segments and len(srt_segments) > 0:
         # 找到内容变化的关键点
         # 简单策略：在长停顿后的位置截图（可能是新话题开始）
         for i in range(1, len(srt_segments)):
@@ -111,15 +203,37 @@ def calculate_timestamps(duration, srt_segments=None, max_frames=12, min_interva
 
     return timestamps
 
+def parse_args(argv):
+    """解析命令行参数"""
+    parser = argparse.ArgumentParser(description='从视频中提取关键帧截图')
+    parser.add_argument('video_path', help='视频文件')
+    parser.add_argument('output_dir', help='截图输出目录')
+    parser.add_argument('srt_path', nargs='?', default=None, help='字幕文件（可选，用于选取话题切换点）')
+    parser.add_argument('--proxy', action='store_true',
+                        help='从 540p 代理截图（代理按源文件哈希缓存），适合快速预览')
+    parser.add_argument('--scenes', action='store_true',
+                        help='先以低分辨率解码一遍检测画面变化（换页、终端输出），只在变化点截图')
+    parser.add_argument('--max-frames', type=int, default=MAX_FRAMES, help=f'最多提取的截图数（默认 {MAX_FRAMES}）')
+    parser.add_argument('--min-interval', type=float, default=MIN_INTERVAL,
+                        help=f'截图之间的最小间隔秒数（默认 {MIN_INTERVAL}）')
+    parser.add_argument('--no-contact-sheet', action='store_true', help='不生成联系表')
+    parser.add_argument('--contact-columns', type=int, default=CONTACT_COLUMNS,
+                        help=f'联系表列数（默认 {CONTACT_COLUMNS}）')
+    parser.add_argument('--workers', type=int, default=WORKERS, help=f'同时运行的 FFmpeg 进程数（默认 {WORKERS}）')
+    parser.add_argument('--frames-per-call', type=int, default=FRAMES_PER_CALL,
+                        help=f'每次 FFmpeg 调用提取的截图数（默认 {FRAMES_PER_CALL}）')
+    return parser.parse_args(argv)
+
 def main():
     if len(sys.argv) < 3:
-        print("用法: python extract_frames.py <video_path> <output_dir> [srt_path]")
+        print("用法: python extract_frames.py <video_path> <output_dir> [srt_path] [--proxy] [--scenes] [--max-frames 12] [--min-interval 60] [--no-contact-sheet] [--workers N] [--frames-per-call N]")
         print("例如: python extract_frames.py video.mp4 ./images video.srt")
         sys.exit(1)
 
-    video_path = sys.argv[1]
-    output_dir = sys.argv[2]
-    srt_path = sys.argv[3] if len(sys.argv) > 3 else None
+    args = parse_args(sys.argv[1:])
+    video_path = args.video_path
+    output_dir = args.output_dir
+    srt_path = args.srt_path
 
     # 检查视频文件
     if not os.path.exists(video_path):
@@ -140,12 +254,27 @@ def main():
         srt_segments = parse_srt(srt_path)
         print(f"字幕片段数: {len(srt_segments)}")
 
+    # 预览模式从代理截图，时间点不变
+    source_path = get_proxy(video_path) if args.proxy else video_path
+
+    # 画面变化候选点：低分辨率、低帧率解码一遍，全分辨率只提取这些时间点
+    scene_points = None
+    if args.scenes:
+        try:
+            scene_points = detect_scene_changes(source_path, count=args.max_frames,
+                                                min_interval=args.min_interval, duration=duration)
+        except RuntimeError as e:
+            print(f"错误: {e}")
+            sys.exit(1)
+        print(f"画面变化候选点: {len(scene_points)} 个")
+
     # 计算截图时间点
-    timestamps = calculate_timestamps(duration, srt_segments)
+    timestamps = calculate_timestamps(duration, srt_segments, args.max_frames, args.min_interval,
+                                      scene_points=scene_points)
     print(f"计划提取 {len(timestamps)} 张截图")
 
     # 提取截图
-    screenshots = extract_frames(video_path, output_dir, timestamps)
+    screenshots = extract_frames(source_path, output_dir, timestamps, args.frames_per_call, args.workers)
 
     # 保存结果
     result = {
@@ -153,6 +282,12 @@ def main():
         'duration': duration,
         'screenshots': screenshots
     }
+    if args.proxy:
+        result['proxy_path'] = source_path
+
+    # 联系表：一张图浏览全部候选截图，只对入选的截图再看原图
+    if not args.no_contact_sheet:
+        result['contact_sheets'] = build_contact_sheet(screenshots, output_dir, args.contact_columns)
 
     result_path = os.path.join(output_dir, 'screenshots_info.json')
     with open(result_path, 'w', encoding='utf-8') as f:
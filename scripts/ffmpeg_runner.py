@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+FFmpeg 任务执行与调度
+- run_ffmpeg：通过 -progress pipe:1 实时读取进度，打印进度/速度/剩余时间，结束后返回耗时指标
+- run_parallel：按 CPU 预算（并发数 × 每任务线程数）同时运行多个 FFmpeg 进程，逐个报告成败
+"""
+import collections
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+PROGRESS_INTERVAL = 5.0   # 进度打印间隔（秒）
+
+def thread_args(threads):
+    """每个 FFmpeg 任务的线程数参数（0 表示由 FFmpeg 自动决定）"""
+    return ['-threads', str(threads)] if threads else []
+
+def check_budget(jobs, threads):
+    """并发数 × 线程数超过 CPU 核数时给出提示"""
+    cpus = os.cpu_count() or 1
+    if threads and jobs * threads > cpus:
+        print(f"  提示: {jobs} 个任务 × {threads} 线程 超过 CPU 核数 {cpus}，可能互相争抢")
+
+def format_eta(seconds):
+    """剩余时间的可读形式"""
+    seconds = int(max(0, seconds))
+    if seconds >= 3600:
+        return f"{seconds // 3600}小时{seconds % 3600 // 60:02d}分"
+    return f"{seconds // 60}分{seconds % 60:02d}秒"
+
+def _progress_seconds(values):
+    """从 -progress 输出中取已输出的媒体时长（秒）"""
+    for key in ('out_time_us', 'out_time_ms'):   # 两者单位都是微秒（out_time_ms 为历史命名）
+        try:
+            return int(values[key]) / 1e6
+        except (KeyError, ValueError):
+            pass
+    return 0.0
+
+def _drain(stream, tail):
+    """后台读取 stderr，只保留末尾若干行，避免管道写满阻塞 FFmpeg"""
+    for line in stream:
+        tail.append(line)
+
+def run_ffmpeg(cmd, duration=None, label='FFmpeg', interval=PROGRESS_INTERVAL):
+    """执行 FFmpeg 命令并实时报告进度
+
+    duration 为预计输出时长（秒），用于计算百分比和剩余时间。
+    返回指标字典：returncode / wall_time / cpu_time / max_rss_mb / output_duration /
+    realtime_factor / fps / bitrate / error。
+    """
+    full_cmd = [cmd[0], '-hide_banner', '-nostats', '-progress', 'pipe:1'] + list(cmd[1:])
+    started_at = time.strftime('%Y-%m-%d %H:%M:%S')
+    began = time.time()
+    proc = subprocess.Popen(full_cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+
+    tail = collections.deque(maxlen=20)
+    reader = threading.Thread(target=_drain, args=(proc.stderr, tail), daemon=True)
+    reader.start()
+
+    values = {}
+    last_report = began
+    for line in proc.stdout:
+        key, _, value = line.strip().partition('=')
+        values[key] = value
+        if key != 'progress':
+            continue
+        now = time.time()
+        if value == 'end' or now - last_report < interval:
+            continue
+        last_report = now
+        done = _progress_seconds(values)
+        message = f"  {label}: {done:.0f}s"
+        if duration:
+            rate = done / max(now - began, 1e-6)
+            message += f" / {duration:.0f}s ({min(done / duration, 1) * 100:.1f}%)"
+            if rate > 0:
+                message += f" 剩余 {format_eta((duration - done) / rate)}"
+        message += f" 速度 {values.get('speed', 'N/A').strip()} {values.get('fps', '0')}fps 码率 {values.get('bitrate', 'N/A')}"
+        print(message, flush=True)
+
+    # wait4 同时取得该进程自身的 CPU 时间和峰值内存
+    _, status, usage = os.wait4(proc.pid, 0)
+    proc.returncode = os.waitstatus_to_exitcode(status)
+    reader.join()
+
+    wall = time.time() - began
+    output_duration = _progress_seconds(values)
+    # ru_maxrss 在 Linux 上单位为 KB，macOS 上为字节
+    rss_mb = usage.ru_maxrss / (1024 * 1024 if sys.platform == 'darwin' else 1024)
+    return {
+        'label': label,
+        'started_at': started_at,
+        'returncode': proc.returncode,
+        'wall_time': round(wall, 3),
+        'cpu_time': round(usage.ru_utime + usage.ru_stime, 3),
+        'max_rss_mb': round(rss_mb, 1),
+        'output_duration': round(output_duration, 3),
+        'realtime_factor': round(output_duration / wall, 3) if wall > 0 else None,
+        'fps': values.get('fps'),
+        'bitrate': values.get('bitrate'),
+        'cmd': full_cmd,
+        'error': ''.join(tail)[-500:] if proc.returncode != 0 else '',
+    }
+
+def run_parallel(tasks, jobs=1, on_success=None, metrics=None):
+    """并发执行任务 [(名称, cmd, 预计输出时长)]，完成一个打印一个
+
+    on_success(名称) 在主线程中对每个成功的任务调用（如写入续跑清单）；
+    metrics 为列表时追加每个任务的耗时指标。
+    返回失败列表 [(名称, 错误信息)]，按任务顺序排列；jobs <= 1 时顺序执行。
+    """
+    jobs = max(1, min(jobs, len(tasks))) if tasks else 1
+    failures = {}
+    order = {name: k for k, (name, _, _) in enumerate(tasks)}
+
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        futures = {pool.submit(run_ffmpeg, cmd, duration, name): name for name, cmd, duration in tasks}
+        for done, future in enumerate(as_completed(futures), 1):
+            name = futures[future]
+            job = future.result()
+            if metrics is not None:
+                metrics.append(job)
+            if job['returncode'] == 0:
+                if on_success:
+                    on_success(name)
+                print(f"  [{done}/{len(tasks)}] {name} 完成，用时 {job['wall_time']:.1f}秒（{job['realtime_factor'] or 0:.2f}x 实时）")
+            else:
+                failures[name] = job['error']
+                print(f"  [{done}/{len(tasks)}] {name} 失败")
+
+    return sorted(failures.items(), key=lambda item: order[item[0]])
+
+def write_metrics(metrics, path, elapsed=None):
+    """保存本次运行全部 FFmpeg 任务的耗时指标，附带汇总，便于跨版本对比渲染吞吐
+
+    elapsed 为整个运行的实际耗时（并发时小于各任务耗时之和），用于计算整体实时倍率。
+    """
+    job_wall = sum(job['wall_time'] for job in metrics)
+    output = sum(job['output_duration'] for job in metrics)
+    elapsed = elapsed if elapsed is not None else job_wall
+    report = {
+        'jobs': metrics,
+        'total': {
+            'jobs': len(metrics),
+            'elapsed': round(elapsed, 3),
+            'job_wall_time': round(job_wall, 3),
+            'cpu_time': round(sum(job['cpu_time'] for job in metrics), 3),
+            'output_duration': round(output, 3),
+            'realtime_factor': round(output / elapsed, 3) if elapsed > 0 else None,
+            'max_rss_mb': max((job['max_rss_mb'] for job in metrics), default=0),
+        }
+    }
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    return path
@@ -3,27 +3,11 @@
 视频总结文档生成脚本
 从字幕内容生成结构化的 Markdown 总结文档
 """
-import re
 import os
 import sys
 import json
 
-def parse_srt(srt_path):
-    """解析 SRT 文件"""
-    with open(srt_path, 'r', encoding='utf-8') as f:
-        content = f.read()
-
-    pattern = r'(\d+)\n(\d{2}:\d{2}:\d{2},\d{3}) --> (\d{2}:\d{2}:\d{2},\d{3})\n(.*?)(?=\n\n|\Z)'
-    segments = []
-    for match in re.finditer(pattern, content, re.DOTALL):
-        idx, start, end, text = match.groups()
-        segments.append({
-            'index': int(idx),
-            'start': start,
-            'end': end,
-            'text': text.strip()
-        })
-    return segments
+from srt import parse_srt
 
 def extract_full_text(segments):
     """提取完整文本"""
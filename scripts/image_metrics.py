@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+截图图像指标 - 感知哈希、清晰度与亮度
+图片统一由 FFmpeg 缩放为 256x144 灰度后经 rawvideo 管道读入 NumPy（每次调用解码一批），
+之后的 dHash / pHash / 拉普拉斯方差 / 亮度 / 边缘密度都在整批数组上向量化计算。
+另提供 screenshots_info.json 的读写、按文件标识缓存指标、把截图移入子目录等截图整理脚本共用的工具
+"""
+import json
+import os
+import shutil
+import subprocess
+
+import numpy as np
+
+GRAY_WIDTH = 256
+GRAY_HEIGHT = 144
+IMAGES_PER_CALL = 64    # 每次 FFmpeg 调用解码的图片数
+EDGE_THRESHOLD = 24     # 梯度幅值超过该值的像素计为边缘
+
+def file_stamp(path):
+    """缓存校验用的文件标识：[大小, 修改时间]"""
+    stat = os.stat(path)
+    return [stat.st_size, stat.st_mtime_ns]
+
+def resolve_info_path(path):
+    """命令行参数（screenshots_info.json 或其所在目录）-> JSON 路径，不存在时返回 None"""
+    if os.path.isdir(path):
+        path = os.path.join(path, 'screenshots_info.json')
+    return path if os.path.exists(path) else None
+
+def load_info(info_path):
+    """读取 screenshots_info.json，返回 (info, 文件仍存在的截图列表)"""
+    with open(info_path, 'r', encoding='utf-8') as f:
+        info = json.load(f)
+    return info, [shot for shot in info.get('screenshots', []) if os.path.exists(shot['path'])]
+
+def save_info(info_path, info, remaining, moved_key, moved):
+    """写回 screenshots_info.json：screenshots 替换为 remaining，moved 追加到 info[moved_key]"""
+    info['screenshots'] = remaining
+    info[moved_key] = info.get(moved_key, []) + moved
+    with open(info_path, 'w', encoding='utf-8') as f:
+        json.dump(info, f, ensure_ascii=False, indent=2)
+
+def cached_metrics(screenshots, key, compute):
+    """为每张截图补全 shot[key]，返回新计算的数量
+
+    shot[key]['stamp'] 与文件当前标识一致时直接复用；其余截图一次读入灰度数组，
+    compute(images) 返回与之对应的字典列表。
+    """
+    stale = [shot for shot in screenshots if shot.get(key, {}).get('stamp') != file_stamp(shot['path'])]
+    if stale:
+        records = compute(load_gray([shot['path'] for shot in stale]))
+        for shot, record in zip(stale, records):
+            shot[key] = dict(record, stamp=file_stamp(shot['path']))
+    return len(stale)
+
+def move_aside(shot, target_dir, key):
+    """把截图移入 target_dir，更新 shot['path'] 和 shot[key] 中缓存的文件标识"""
+    os.makedirs(target_dir, exist_ok=True)
+    new_path = os.path.join(target_dir, shot['filename'])
+    shutil.move(shot['path'], new_path)
+    shot['path'] = new_path
+    shot[key]['stamp'] = file_stamp(new_path)
+
+def _decode_batch(paths, width, height):
+    """一次 FFmpeg 调用解码多张图片：各自缩放为灰度后 concat 成一路，返回 (n, height, width) uint8"""
+    cmd = ['ffmpeg', '-v', 'error']
+    for path in paths:
+        cmd += ['-i', path]
+    chains = [f"[{k}:v]scale={width}:{height},setsar=1,format=gray[s{k}]" for k in range(len(paths))]
+    labels = ''.join(f"[s{k}]" for k in range(len(paths)))
+    graph = ';'.join(chains) + f";{labels}concat=n={len(paths)}:v=1:a=0[out]"
+    cmd += ['-filter_complex', graph, '-map', '[out]', '-f', 'rawvideo', '-pix_fmt', 'gray', 'pipe:1']
+    result = subprocess.run(cmd, capture_output=True)
+    frame_size = width * height
+    if result.returncode != 0 or len(result.stdout) < frame_size * len(paths):
+        raise RuntimeError(f"解码图片失败: {result.stderr.decode('utf-8', 'replace')[-300:]}")
+    return np.frombuffer(result.stdout[:frame_size * len(paths)], dtype=np.uint8).reshape(len(paths), height, width)
+
+def load_gray(paths, width=GRAY_WIDTH, height=GRAY_HEIGHT, per_call=IMAGES_PER_CALL):
+    """读取图片为灰度数组 (n, height, width)，float32"""
+    if not paths:
+        return np.zeros((0, height, width), dtype=np.float32)
+    batches = [_decode_batch(paths[k:k + per_call], width, height) for k in range(0, len(paths), per_call)]
+    return np.concatenate(batches).astype(np.float32)
+
+def resize_area(images, height, width):
+    """按面积平均缩小 (n, H, W) -> (n, height, width)"""
+    rows = np.linspace(0, images.shape[1], height + 1).astype(np.int64)
+    cols = np.linspace(0, images.shape[2], width + 1).astype(np.int64)
+    summed = np.add.reduceat(np.add.reduceat(images, rows[:-1], axis=1), cols[:-1], axis=2)
+    return summed / np.outer(np.diff(rows), np.diff(cols))
+
+def dhash(images):
+    """差值哈希：缩小到 8x9，比较水平相邻像素，返回 (n, 64) 布尔数组"""
+    small = resize_area(images, 8, 9)
+    return (small[:, :, 1:] > small[:, :, :-1]).reshape(len(images), 64)
+
+def _dct_matrix(size):
+    """DCT-II 变换矩阵"""
+    k = np.arange(size)[:, None]
+    n = np.arange(size)[None, :]
+    return np.cos(np.pi * (2 * n + 1) * k / (2 * size))
+
+def phash(images):
+    """感知哈希：缩小到 32x32 做二维 DCT，取左上 8x8 低频系数（去掉直流分量）与中位数比较，返回 (n, 64) 布尔数组"""
+    small = resize_area(images, 32, 32)
+    dct = _dct_matrix(32)
+    coeffs = dct @ small @ dct.T
+    low = coeffs[:, :8, :8].reshape(len(images), 64)[:, 1:]
+    bits = low > np.median(low, axis=1, keepdims=True)
+    return np.concatenate((bits, np.zeros((len(images), 1), dtype=bool)), axis=1)
+
+def hamming_matrix(bits):
+    """两两汉明距离 (n, n)"""
+    bits = np.asarray(bits, dtype=bool)
+    return (bits[:, None, :] != bits[None, :, :]).sum(axis=2)
+
+def bits_to_hex(bits):
+    """64 位布尔数组 -> 16 位十六进制字符串"""
+    return np.packbits(bits).tobytes().hex()
+
+def hex_to_bits(value):
+    """16 位十六进制字符串 -> 64 位布尔数组"""
+    return np.unpackbits(np.frombuffer(bytes.fromhex(value), dtype=np.uint8)).astype(bool)
+
+def laplacian_variance(images):
+    """拉普拉斯算子响应的方差（越大越清晰），返回 (n,) 数组"""
+    center = images[:, 1:-1, 1:-1]
+    lap = 4 * center - images[:, :-2, 1:-1] - images[:, 2:, 1:-1] - images[:, 1:-1, :-2] - images[:, 1:-1, 2:]
+    return lap.reshape(len(images), -1).var(axis=1)
+
+def luminance_stats(images):
+    """亮度均值与方差，返回 ((n,), (n,))"""
+    flat = images.reshape(len(images), -1)
+    return flat.mean(axis=1), flat.var(axis=1)
+
+def edge_density(images, threshold=EDGE_THRESHOLD):
+    """边缘像素比例（水平/垂直差分的梯度幅值超过阈值），返回 (n,) 数组"""
+    gx = images[:, 1:-1, 2:] - images[:, 1:-1, :-2]
+    gy = images[:, 2:, 1:-1] - images[:, :-2, 1:-1]
+    magnitude = np.sqrt(gx * gx + gy * gy) / 2
+    return (magnitude > threshold).reshape(len(images), -1).mean(axis=1)
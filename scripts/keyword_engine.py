@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+多模式关键词引擎 - Aho-Corasick 自动机
+由中英文词表一次性构建，单次扫描即可报告语气词、重要关键词和口误纠正的全部命中，
+词表可以从外部 JSON 文件加载，便于按讲者调整而无需改代码
+"""
+import json
+import os
+import re
+
+DEFAULT_LEXICON_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'smart_cut_lexicon.json')
+
+WORD_PATTERN = re.compile(r'\S+')
+
+def load_lexicon(path=None):
+    """加载词表，返回 {类别: [词, ...]}
+
+    先读取内置默认词表；再用 path 指定的外部文件覆盖其中出现的 类别/语言，
+    未出现的部分沿用默认值。文件格式：{"filler": {"zh": [...], "en": [...]}, ...}
+    """
+    with open(DEFAULT_LEXICON_PATH, 'r', encoding='utf-8') as f:
+        lexicon = json.load(f)
+
+    if path:
+        with open(path, 'r', encoding='utf-8') as f:
+            custom = json.load(f)
+        for category, languages in custom.items():
+            if isinstance(languages, list):
+                languages = {'custom': languages}
+                lexicon[category] = {}
+            lexicon.setdefault(category, {}).update(languages)
+
+    merged = {}
+    for category, languages in lexicon.items():
+        words = []
+        for lang_words in languages.values():
+            for w in lang_words:
+                if w and w not in words:
+                    words.append(w)
+        merged[category] = words
+    return merged
+
+class KeywordEngine:
+    """Aho-Corasick 自动机：scan(text) 一次扫描返回所有类别的命中"""
+
+    def __init__(self, lexicon):
+        self.categories = list(lexicon)
+        self._goto = [{}]      # 状态转移
+        self._fail = [0]       # 失配指针
+        self._output = [[]]    # 每个状态的输出 [(词长, 类别, 词)]
+
+        for category, words in lexicon.items():
+            for word in words:
+                self._add(word, category)
+        self._build()
+
+    def _add(self, word, category):
+        state = 0
+        for ch in word:
+            nxt = self._goto[state].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            state = nxt
+        self._output[state].append((len(word), category, word))
+
+    def _build(self):
+        """广度优先计算失配指针，并沿失配链合并输出"""
+        queue = list(self._goto[0].values())
+        head = 0
+        while head < len(queue):
+            state = queue[head]
+            head += 1
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                f = self._fail[state]
+                while f and ch not in self._goto[f]:
+                    f = self._fail[f]
+                target = self._goto[f].get(ch, 0)
+                self._fail[nxt] = target if target != nxt else 0
+                self._output[nxt] = self._output[nxt] + self._output[self._fail[nxt]]
+
+    def scan(self, text):
+        """扫描文本，返回命中列表 [(start, end, 类别, 词)]（可重叠）"""
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        hits = []
+        state = 0
+        for pos, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            for length, category, word in output[state]:
+                hits.append((pos + 1 - length, pos + 1, category, word))
+        return hits
+
+    def profile(self, text):
+        """单次扫描后汇总：各类别命中的词，以及是否整句只由语气词构成"""
+        hits = self.scan(text)
+        found = {category: [] for category in self.categories}
+        filler_spans = set()
+        for start, end, category, word in hits:
+            found[category].append(word)
+            if category == 'filler':
+                filler_spans.add((start, end))
+
+        # 纯语气词，或按空白切分后每个词都恰好是语气词（如"嗯 那个 就是"）
+        only_filler = (0, len(text)) in filler_spans or all(
+            (m.start(), m.end()) in filler_spans for m in WORD_PATTERN.finditer(text)
+        )
+        return found, only_filler
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+媒体探测 - ffprobe 的公共封装
+时长、视频流参数和关键帧索引，供剪辑执行脚本共用
+"""
+import json
+import subprocess
+
+def probe_duration(path):
+    """获取文件时长（秒），失败返回 None"""
+    cmd = [
+        'ffprobe', '-v', 'error',
+        '-show_entries', 'format=duration',
+        '-of', 'default=noprint_wrappers=1:nokey=1',
+        path
+    ]
+    result = subprocess.run(cmd, capture_output=True, text=True)
+    try:
+        return float(result.stdout.strip())
+    except ValueError:
+        return None
+
+def probe_streams(path):
+    """获取全部流的参数列表（ffprobe -show_streams），失败返回空列表"""
+    cmd = ['ffprobe', '-v', 'error', '-show_streams', '-of', 'json', path]
+    result = subprocess.run(cmd, capture_output=True, text=True)
+    if result.returncode != 0:
+        return []
+    return json.loads(result.stdout or '{}').get('streams', [])
+
+def probe_video_stream(path):
+    """获取第一条视频流的参数（编码、profile、像素格式、分辨率、帧率、时间基），没有视频流返回 None"""
+    for stream in probe_streams(path):
+        if stream.get('codec_type') == 'video' and not stream.get('disposition', {}).get('attached_pic'):
+            return stream
+    return None
+
+def parse_rate(rate):
+    """把 ffprobe 的 '30000/1001' 形式帧率转换为浮点数"""
+    num, _, den = str(rate).partition('/')
+    try:
+        return float(num) / float(den or 1)
+    except (ValueError, ZeroDivisionError):
+        return 0.0
+
+def probe_keyframes(path):
+    """读取视频流的关键帧时间（秒，升序）
+
+    只读取数据包标志，不解码画面，长视频也能很快完成。
+    """
+    cmd = [
+        'ffprobe', '-v', 'error', '-select_streams', 'v:0',
+        '-show_entries', 'packet=pts_time,flags',
+        '-of', 'csv=p=0', path
+    ]
+    result = subprocess.run(cmd, capture_output=True, text=True)
+    keyframes = []
+    for line in result.stdout.splitlines():
+        pts, _, flags = line.partition(',')
+        if 'K' in flags and pts not in ('', 'N/A'):
+            keyframes.append(float(pts))
+    keyframes.sort()
+    return keyframes
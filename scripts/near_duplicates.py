@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+全局近似重复检测 - MinHash + LSH 分桶
+对字符 n-gram 计算 MinHash 签名，通过 LSH 分桶找出候选对，
+再用精确 Jaccard 复核，整体接近线性复杂度，可在整篇字幕范围内查找重复表述
+"""
+import zlib
+
+import numpy as np
+
+NGRAM = 2             # 字符 n-gram 长度（中文以双字为宜）
+NUM_PERM = 64         # MinHash 排列数
+BANDS = 16            # LSH 分带数（每带 NUM_PERM // BANDS 行）
+THRESHOLD = 0.7       # n-gram Jaccard 判重阈值
+CHUNK_SHINGLES = 1 << 16  # 每批参与哈希计算的 n-gram 数，控制内存峰值
+
+def shingle_hashes(text, ngram=NGRAM):
+    """将文本切成字符 n-gram 并哈希为去重后的 uint64 数组（忽略空白和大小写）"""
+    text = ''.join(text.split()).lower()
+    if not text:
+        return np.empty(0, dtype=np.uint64)
+    if len(text) <= ngram:
+        grams = {text}
+    else:
+        grams = {text[k:k + ngram] for k in range(len(text) - ngram + 1)}
+    # crc32 与进程无关，保证多次运行结果一致
+    return np.unique(np.fromiter(
+        (zlib.crc32(g.encode('utf-8')) for g in grams), dtype=np.uint64, count=len(grams)
+    ))
+
+def minhash_signatures(shingles, num_perm=NUM_PERM, seed=1):
+    """批量计算 MinHash 签名，返回 (len(shingles), num_perm) 的 uint64 矩阵
+
+    使用 multiply-add-shift 哈希族 h(x) = ((a*x + b) mod 2^64) >> 32，
+    按批把所有 n-gram 展平后一次性计算，再用 reduceat 按片段取最小值。
+    """
+    rng = np.random.default_rng(seed)
+    a = rng.integers(1, 1 << 32, num_perm, dtype=np.uint64) | np.uint64(1)
+    b = rng.integers(0, 1 << 32, num_perm, dtype=np.uint64)
+    shift = np.uint64(32)
+
+    signatures = np.full((len(shingles), num_perm), np.iinfo(np.uint64).max, dtype=np.uint64)
+    rows = [r for r, s in enumerate(shingles) if len(s)]
+
+    pos = 0
+    while pos < len(rows):
+        batch = []
+        total = 0
+        while pos < len(rows) and (not batch or total + len(shingles[rows[pos]]) <= CHUNK_SHINGLES):
+            batch.append(rows[pos])
+            total += len(shingles[rows[pos]])
+            pos += 1
+
+        flat = np.concatenate([shingles[r] for r in batch])
+        starts = np.cumsum([0] + [len(shingles[r]) for r in batch[:-1]])
+        hashed = (flat[:, None] * a[None, :] + b[None, :]) >> shift
+        signatures[batch] = np.minimum.reduceat(hashed, starts, axis=0)
+
+    return signatures
+
+def lsh_candidate_pairs(signatures, positions, window=None, bands=BANDS):
+    """LSH 分桶，返回候选对集合 {(i, j)}，i < j
+
+    positions 为每行的时间位置（秒），window 不为 None 时只配对时间差不超过 window 的行。
+    """
+    n, num_perm = signatures.shape
+    rows_per_band = num_perm // bands
+    positions = np.asarray(positions, dtype=np.float64)
+    valid = signatures[:, 0] != np.iinfo(np.uint64).max
+    pairs = set()
+
+    for band in range(bands):
+        block = np.ascontiguousarray(signatures[:, band * rows_per_band:(band + 1) * rows_per_band])
+        keys = block.view(np.dtype((np.void, block.dtype.itemsize * rows_per_band))).ravel()
+        _, inverse, counts = np.unique(keys, return_inverse=True, return_counts=True)
+
+        shared = valid & (counts[inverse] > 1)
+        members = np.flatnonzero(shared)
+        if len(members) == 0:
+            continue
+
+        # 按 (桶, 时间) 排序后逐桶配对
+        order = np.lexsort((positions[members], inverse[members]))
+        members = members[order]
+        bucket_ids = inverse[members]
+        bounds = np.flatnonzero(np.diff(bucket_ids)) + 1
+        for bucket in np.split(members, bounds):
+            bucket_pos = positions[bucket]
+            for k, i in enumerate(bucket.tolist()):
+                stop = len(bucket)
+                if window is not None:
+                    stop = int(np.searchsorted(bucket_pos, bucket_pos[k] + window, side='right'))
+                for j in bucket[k + 1:stop].tolist():
+                    pairs.add((i, j) if i < j else (j, i))
+
+    return pairs
+
+def jaccard(a, b):
+    """两个已排序去重的哈希数组的精确 Jaccard 相似度"""
+    if len(a) == 0 or len(b) == 0:
+        return 0.0
+    inter = len(np.intersect1d(a, b, assume_unique=True))
+    return inter / (len(a) + len(b) - inter)
+
+def find_near_duplicates(texts, positions, window=None, threshold=THRESHOLD,
+                         ngram=NGRAM, num_perm=NUM_PERM, bands=BANDS):
+    """在整篇文本中查找近似重复对
+
+    返回 [(i, j, score)]，i < j 为 texts 中的下标，按 (j, i) 升序排列，
+    便于调用方像顺序扫描一样逐对处理。
+    """
+    shingles = [shingle_hashes(t, ngram) for t in texts]
+    if not shingles:
+        return []
+    signatures = minhash_signatures(shingles, num_perm)
+    candidates = lsh_candidate_pairs(signatures, positions, window, bands)
+
+    found = []
+    for i, j in candidates:
+        score = jaccard(shingles[i], shingles[j])
+        if score >= threshold:
+            found.append((i, j, score))
+    found.sort(key=lambda p: (p[1], p[0]))
+    return found
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+低分辨率代理媒体 - 快速预览渲染
+源视频只转码一次为 540p 短 GOP 代理，按源文件内容哈希缓存，超出容量时按最近使用（LRU）淘汰。
+代理与源视频时间轴一致，剪辑方案可直接在代理上预览，最终成片仍用同一方案渲染源视频
+"""
+import hashlib
+import os
+import time
+
+from ffmpeg_runner import run_ffmpeg
+from media_probe import probe_duration
+
+PROXY_DIR = os.environ.get('VIDEOMAKER_PROXY_DIR', os.path.expanduser('~/.cache/videomaker/proxy'))
+PROXY_HEIGHT = 540
+PROXY_GOP = 12              # 短 GOP，定位和逐段剪辑都很快
+PROXY_PRESET = 'veryfast'
+PROXY_CRF = 23
+CACHE_LIMIT_GB = 20.0       # 代理缓存容量上限
+SAMPLE_BYTES = 4 << 20      # 计算源文件哈希时每处采样的字节数
+PART_SUFFIX = '.part.mp4'   # 正在转码的代理临时文件
+PART_STALE_HOURS = 24.0     # 临时文件超过该时间未更新视为中断残留
+
+# 在代理上预览时使用的快速编码参数
+PREVIEW_PRESET = 'veryfast'
+PREVIEW_CRF = 28
+PREVIEW_VIDEO_ARGS = ['-c:v', 'libx264', '-preset', PREVIEW_PRESET, '-crf', str(PREVIEW_CRF)]
+
+def source_hash(path, sample_bytes=SAMPLE_BYTES):
+    """源文件内容哈希：文件大小 + 开头/中间/结尾各 sample_bytes 字节
+
+    几十 GB 的 4K 素材也只读取十几 MB，文件被替换或重新导出后哈希随之改变。
+    """
+    size = os.path.getsize(path)
+    digest = hashlib.sha1(str(size).encode('utf-8'))
+    with open(path, 'rb') as f:
+        for offset in (0, max(0, size // 2 - sample_bytes // 2), max(0, size - sample_bytes)):
+            f.seek(offset)
+            digest.update(f.read(sample_bytes))
+    return digest.hexdigest()[:20]
+
+def evict(cache_dir=PROXY_DIR, limit_gb=CACHE_LIMIT_GB, keep=None):
+    """按最近使用时间淘汰代理文件，直到总大小不超过 limit_gb（keep 指定的文件不淘汰）
+
+    *.part.mp4 可能是其他进程正在转码的代理，不计入也不淘汰；超过 PART_STALE_HOURS 未更新的视为中断残留，直接删除。
+    """
+    entries = []
+    now = time.time()
+    for name in os.listdir(cache_dir):
+        path = os.path.join(cache_dir, name)
+        if not name.endswith('.mp4') or not os.path.isfile(path):
+            continue
+        stat = os.stat(path)
+        if name.endswith(PART_SUFFIX):
+            if now - stat.st_mtime > PART_STALE_HOURS * 3600:
+                os.remove(path)
+                print(f"  删除中断残留: {name} ({stat.st_size / (1 << 20):.0f} MB)")
+            continue
+        entries.append((stat.st_mtime, stat.st_size, path))
+
+    total = sum(size for _, size, _ in entries)
+    limit = limit_gb * (1 << 30)
+    for _, size, path in sorted(entries):
+        if total <= limit:
+            break
+        if keep and os.path.abspath(path) == os.path.abspath(keep):
+            continue
+        os.remove(path)
+        total -= size
+        print(f"  淘汰代理: {os.path.basename(path)} ({size / (1 << 20):.0f} MB)")
+
+def proxy_path_for(source_path, height=PROXY_HEIGHT, cache_dir=PROXY_DIR):
+    """源视频对应的代理文件路径（不检查是否已生成）"""
+    return os.path.join(cache_dir, f"{source_hash(source_path)}_{height}p.mp4")
+
+def get_proxy(source_path, height=PROXY_HEIGHT, cache_dir=PROXY_DIR, limit_gb=CACHE_LIMIT_GB):
+    """返回源视频对应的代理文件路径，缓存中没有时先转码生成"""
+    os.makedirs(cache_dir, exist_ok=True)
+    proxy_path = proxy_path_for(source_path, height, cache_dir)
+
+    if os.path.exists(proxy_path):
+        # 更新修改时间作为最近使用时间
+        os.utime(proxy_path)
+        print(f"使用缓存代理: {proxy_path}")
+        return proxy_path
+
+    print(f"生成 {height}p 代理: {source_path}")
+    temp_path = proxy_path + PART_SUFFIX
+    cmd = [
+        'ffmpeg', '-y', '-i', source_path,
+        '-vf', f'scale=-2:{height}',
+        '-c:v', 'libx264', '-preset', PROXY_PRESET, '-crf', str(PROXY_CRF),
+        '-g', str(PROXY_GOP), '-keyint_min', str(PROXY_GOP), '-sc_threshold', '0',
+        '-pix_fmt', 'yuv420p',
+        '-c:a', 'aac', '-b:a', '128k',
+        '-movflags', '+faststart', temp_path
+    ]
+    job = run_ffmpeg(cmd, probe_duration(source_path), label='生成代理')
+    if job['returncode'] != 0:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise RuntimeError(f"生成代理失败: {job['error']}")
+    os.replace(temp_path, proxy_path)
+
+    evict(cache_dir, limit_gb, keep=proxy_path)
+    return proxy_path
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+可续跑的渲染缓存 - 批次按内容哈希命名
+批次文件名由（源文件标识, 片段列表/滤镜图, 编码参数）的哈希决定，完成一个批次就写入清单；
+重新运行时跳过已完成且时长校验通过的批次，剪辑方案只改动局部时也只重渲染受影响的批次；
+渲染完成后删除当前方案不再引用的缓存文件和清单条目
+"""
+import hashlib
+import json
+import os
+import re
+
+from media_probe import probe_duration
+
+MANIFEST_NAME = 'manifest.json'
+DURATION_TOLERANCE = 0.5   # 缓存文件时长与预期的最大偏差（秒）
+# 按内容哈希命名的缓存文件：批次 / 智能渲染小段与音轨 / 逐段片段
+CACHE_FILE = re.compile(r'(?:batch|piece|audio|audio_graph|seg)_([0-9a-f]{16})\.\w+')
+
+def source_identity(path):
+    """源文件标识：绝对路径 + 大小 + 修改时间（源文件被替换后缓存自动失效）"""
+    stat = os.stat(path)
+    return [os.path.abspath(path), stat.st_size, stat.st_mtime_ns]
+
+def task_key(identity, cmd):
+    """渲染任务的内容哈希（cmd 不含输出路径和线程数等不影响结果的参数）"""
+    payload = json.dumps([identity, cmd], ensure_ascii=False)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()[:16]
+
+def split_batches(segments, batch_size=20, min_size=5):
+    """按内容切分批次：在片段内容哈希满足条件处断开
+
+    与固定每 batch_size 个一批不同，插入或删除一个片段只会改变所在批次，
+    后面的批次边界不受影响，缓存仍能命中。平均批次大小约为 batch_size，最大 2 * batch_size。
+    """
+    batches = []
+    current = []
+    for seg in segments:
+        current.append(seg)
+        digest = hashlib.sha1(
+            f"{seg['start_sec']:.3f}:{seg['end_sec']:.3f}:{seg.get('speed', 1.0):.3f}".encode('utf-8')
+        ).digest()
+        cut = int.from_bytes(digest[:4], 'big') % max(1, batch_size - min_size) == 0
+        if (len(current) >= min_size and cut) or len(current) >= 2 * batch_size:
+            batches.append(current)
+            current = []
+    if current:
+        batches.append(current)
+    return batches
+
+class RenderManifest:
+    """temp 目录下的批次清单：{key: {'file', 'duration'}}，每完成一个批次立即落盘"""
+
+    def __init__(self, temp_dir):
+        self.path = os.path.join(temp_dir, MANIFEST_NAME)
+        self.entries = {}
+        if os.path.exists(self.path):
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    self.entries = json.load(f)
+            except ValueError:
+                self.entries = {}
+
+    def is_complete(self, key, output_file, expected_duration, tolerance=DURATION_TOLERANCE):
+        """批次已记录、文件存在且时长与预期一致"""
+        entry = self.entries.get(key)
+        if not entry or not os.path.exists(output_file) or os.path.getsize(output_file) == 0:
+            return False
+        duration = probe_duration(output_file)
+        return duration is not None and abs(duration - expected_duration) <= tolerance
+
+    def record(self, key, output_file, expected_duration):
+        """记录完成的批次"""
+        self.entries[key] = {'file': os.path.basename(output_file), 'duration': expected_duration}
+        self._save()
+
+    def prune(self, current_files):
+        """删除当前方案（current_files）不再引用的缓存文件和清单条目，返回 (删除文件数, 释放字节数)
+
+        缓存键取自文件名中的内容哈希，同一键的附属文件（如音轨的滤镜脚本）一并保留。
+        """
+        keys = set()
+        for path in current_files:
+            match = CACHE_FILE.fullmatch(os.path.basename(path))
+            if match:
+                keys.add(match.group(1))
+
+        temp_dir = os.path.dirname(self.path)
+        removed = 0
+        freed = 0
+        for name in os.listdir(temp_dir):
+            match = CACHE_FILE.fullmatch(name)
+            if not match or match.group(1) in keys:
+                continue
+            path = os.path.join(temp_dir, name)
+            freed += os.path.getsize(path)
+            os.remove(path)
+            removed += 1
+
+        stale = [key for key in self.entries if key not in keys]
+        for key in stale:
+            del self.entries[key]
+        if stale:
+            self._save()
+        return removed, freed
+
+    def _save(self):
+        """写入清单（先写临时文件再替换，中断时清单不会损坏）"""
+        temp_path = self.path + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.entries, f, ensure_ascii=False, indent=2)
+        os.replace(temp_path, self.path)
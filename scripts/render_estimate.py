@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+渲染耗时预估 - --dry-run 的公共部分
+按（分辨率, preset, CRF）记录本机实际编码吞吐（输出秒数 / 墙钟秒数），
+预估时优先使用历史吞吐，没有历史时使用 x264 各 preset 的经验值按像素数换算
+"""
+import json
+import os
+
+from ffmpeg_runner import format_eta
+
+HISTORY_PATH = os.environ.get('VIDEOMAKER_RENDER_HISTORY',
+                              os.path.expanduser('~/.cache/videomaker/render_history.json'))
+
+# 没有历史记录时 1080p 的编码速度（实时倍率，x264 经验值，仅作粗略估计）
+DEFAULT_SPEED = {
+    'ultrafast': 8.0, 'superfast': 6.0, 'veryfast': 4.0, 'faster': 3.0, 'fast': 2.5,
+    'medium': 1.8, 'slow': 0.9, 'slower': 0.45, 'veryslow': 0.2,
+}
+COPY_SPEED = 100.0      # 流复制 / 拼接，主要受磁盘速度限制
+AUDIO_SPEED = 60.0      # 纯音频剪辑
+SLOW_PRESETS = ('slow', 'slower', 'veryslow', 'placebo')
+RESOLUTIONS = (540, 720, 1080, 1440, 2160)
+
+def resolution_bucket(height):
+    """把输出高度归入常见档位（540p / 720p / 1080p / 1440p / 2160p）"""
+    for bucket in RESOLUTIONS:
+        if height <= bucket * 1.05:
+            return f"{bucket}p"
+    return f"{height}p"
+
+def profile_key(height, preset, crf):
+    """吞吐历史的分组键，例如 2160p/slow/crf18"""
+    return f"{resolution_bucket(height)}/{preset}/crf{crf}"
+
+def is_encode(cmd):
+    """命令是否重编码视频（-c:v 不是 copy）"""
+    for i, arg in enumerate(cmd[:-1]):
+        if arg in ('-c:v', '-vcodec') and cmd[i + 1] != 'copy':
+            return True
+    return False
+
+def load_history(path=HISTORY_PATH):
+    """读取吞吐历史 {分组键: {'output_duration', 'wall_time', 'jobs'}}"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def record_history(metrics, key, path=HISTORY_PATH):
+    """把本次运行中成功的视频编码任务累加到吞吐历史（流复制、拼接任务不计入）"""
+    jobs = [job for job in metrics
+            if job['returncode'] == 0 and job['output_duration'] > 0 and is_encode(job['cmd'])]
+    if not jobs:
+        return
+    history = load_history(path)
+    entry = history.setdefault(key, {'output_duration': 0.0, 'wall_time': 0.0, 'jobs': 0})
+    entry['output_duration'] = round(entry['output_duration'] + sum(job['output_duration'] for job in jobs), 3)
+    entry['wall_time'] = round(entry['wall_time'] + sum(job['wall_time'] for job in jobs), 3)
+    entry['jobs'] += len(jobs)
+
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    temp_path = path + '.tmp'
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        json.dump(history, f, ensure_ascii=False, indent=2)
+    os.replace(temp_path, path)
+
+def encode_speed(height, preset, crf, history):
+    """预计编码速度（实时倍率）及来源：本机历史或经验值"""
+    entry = history.get(profile_key(height, preset, crf))
+    if entry and entry['wall_time'] > 0:
+        return entry['output_duration'] / entry['wall_time'], '本机历史'
+    return DEFAULT_SPEED.get(preset, 1.0) * (1080 / max(height, 1)) ** 2, '经验值'
+
+def encode_job(name, duration, height, preset, crf, source_range=None):
+    """一个重编码任务的计划"""
+    return {'name': name, 'mode': 'encode', 'range': source_range, 'duration': duration,
+            'height': height, 'preset': preset, 'crf': crf}
+
+def copy_job(name, duration, source_range=None):
+    """一个流复制任务的计划（source_range 为 None 表示拼接等收尾任务）"""
+    return {'name': name, 'mode': 'copy', 'range': source_range, 'duration': duration}
+
+def audio_job(name, duration, source_range=None):
+    """一个纯音频任务的计划"""
+    return {'name': name, 'mode': 'audio', 'range': source_range, 'duration': duration}
+
+def job_seconds(job, history):
+    """预计单个任务的墙钟耗时（秒）"""
+    if job['mode'] == 'encode':
+        speed, _ = encode_speed(job['height'], job['preset'], job['crf'], history)
+    elif job['mode'] == 'audio':
+        speed = AUDIO_SPEED
+    else:
+        speed = COPY_SPEED
+    return job['duration'] / max(speed, 1e-6)
+
+def preset_warnings(height, preset):
+    """编码参数本身的高成本提示"""
+    if preset in SLOW_PRESETS and height >= 2000:
+        return [f"4K 使用 -preset {preset} 编码非常慢，预览阶段建议 --proxy 或改用 medium"]
+    return []
+
+def print_plan(jobs, parallel=1, warnings=(), history=None, limit=12):
+    """打印计划中的 FFmpeg 任务、预计耗时和高成本提示，返回预计总耗时（秒）
+
+    parallel 个任务并发时，编码部分的耗时按并发数摊分（拼接等收尾任务串行）。
+    """
+    history = load_history() if history is None else history
+    print(f"\n=== 渲染计划（--dry-run，不实际执行）===")
+    print(f"{'任务':<24} {'输入范围':>19} {'输出时长':>9}  编码参数")
+    for k, job in enumerate(jobs):
+        if len(jobs) > limit and limit // 2 <= k < len(jobs) - limit // 2:
+            if k == limit // 2:
+                print(f"  ...（省略 {len(jobs) - limit} 个任务）")
+            continue
+        span = f"{job['range'][0]:.2f}-{job['range'][1]:.2f}s" if job['range'] else '-'
+        if job['mode'] == 'encode':
+            speed, source = encode_speed(job['height'], job['preset'], job['crf'], history)
+            settings = f"{profile_key(job['height'], job['preset'], job['crf'])} 约 {speed:.2f}x（{source}）"
+        else:
+            settings = {'copy': '流复制', 'audio': '纯音频'}[job['mode']]
+        print(f"{job['name']:<24} {span:>19} {job['duration']:>8.1f}s  {settings}")
+
+    seconds = [job_seconds(job, history) for job in jobs]
+    rendering = sum(s for job, s in zip(jobs, seconds) if job['range'] is not None)
+    finishing = sum(seconds) - rendering
+    total = rendering / max(1, min(parallel, len(jobs))) + finishing
+    encoded = sum(job['duration'] for job in jobs if job['mode'] == 'encode')
+    copied = sum(job['duration'] for job in jobs if job['mode'] == 'copy' and job['range'] is not None)
+    print(f"\n任务数: {len(jobs)}（重编码 {encoded:.1f}秒，流复制 {copied:.1f}秒，并发 {parallel}）")
+    print(f"预计耗时: {format_eta(total)}")
+
+    for warning in warnings:
+        print(f"  ⚠ {warning}")
+    return total
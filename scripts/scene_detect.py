@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+画面变化检测 - 为截图挑选候选时间点
+视频只解码一次：缩小到 160x90 灰度、每秒 2 帧，经 rawvideo 管道读入 NumPy，
+按相邻帧的像素变化比例打分，取变化最大且互相间隔足够的前 N 个时间点。
+录屏中换页、终端输出等变化常发生在句子中间，字幕停顿找不到这些位置
+"""
+import subprocess
+import tempfile
+
+import numpy as np
+
+SCAN_FPS = 2.0          # 分析帧率
+SCAN_WIDTH = 160
+SCAN_HEIGHT = 90
+PIXEL_DELTA = 12        # 灰度差超过该值的像素视为变化
+MIN_SCORE = 0.02        # 变化像素比例低于该值不算画面变化（光标闪烁、时钟等）
+SETTLE = 0.5            # 截图时间相对变化点后移（秒），等待切换动画结束
+CHUNK_FRAMES = 256      # 每次从管道读取的帧数
+
+def change_scores(video_path, fps=SCAN_FPS, width=SCAN_WIDTH, height=SCAN_HEIGHT, pixel_delta=PIXEL_DELTA):
+    """逐帧计算与前一帧相比变化像素的比例，返回 (分数数组, 对应时间数组)
+
+    第 k 个分数对应第 k+1 帧（变化之后的画面）。FFmpeg 失败时抛出 RuntimeError（附 stderr 末尾）。
+    """
+    cmd = [
+        'ffmpeg', '-v', 'error', '-i', video_path, '-an',
+        '-vf', f'fps={fps},scale={width}:{height},format=gray',
+        '-f', 'rawvideo', '-pix_fmt', 'gray', 'pipe:1'
+    ]
+    frame_size = width * height
+    # stderr 写入临时文件，避免边读 stdout 边积压 stderr 管道导致死锁
+    errors = tempfile.TemporaryFile()
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=errors)
+
+    scores = []
+    previous = None
+    while True:
+        data = proc.stdout.read(frame_size * CHUNK_FRAMES)
+        count = len(data) // frame_size
+        if count == 0:
+            break
+        frames = np.frombuffer(data[:count * frame_size], dtype=np.uint8).reshape(count, frame_size)
+        frames = frames.astype(np.int16)
+        if previous is not None:
+            frames = np.concatenate((previous, frames))
+        changed = np.abs(np.diff(frames, axis=0)) > pixel_delta
+        scores.append(changed.mean(axis=1))
+        previous = frames[-1:]
+    proc.stdout.close()
+    proc.wait()
+    errors.seek(0)
+    stderr = errors.read().decode('utf-8', 'replace')
+    errors.close()
+    if proc.returncode != 0:
+        raise RuntimeError(f"画面变化检测失败（FFmpeg 返回 {proc.returncode}）: {stderr[-500:].strip()}")
+
+    scores = np.concatenate(scores) if scores else np.zeros(0)
+    times = (np.arange(len(scores)) + 1) / fps
+    return scores, times
+
+def pick_changes(scores, times, count, min_interval, min_score=MIN_SCORE, margin=30.0, duration=None):
+    """按分数从高到低挑选变化点，彼此间隔不小于 min_interval，返回升序时间列表
+
+    与 calculate_timestamps 一致，跳过开头和结尾 margin 秒。
+    """
+    valid = (scores >= min_score) & (times > margin)
+    if duration:
+        valid &= times < duration - margin
+    candidates = np.flatnonzero(valid)
+    order = candidates[np.argsort(-scores[candidates], kind='stable')]
+
+    picked = []
+    for k in order.tolist():
+        if len(picked) >= count:
+            break
+        if all(abs(times[k] - times[j]) >= min_interval for j in picked):
+            picked.append(k)
+    return sorted(float(times[k]) for k in picked)
+
+def detect_scene_changes(video_path, count=12, min_interval=60, duration=None, settle=SETTLE):
+    """返回画面变化最大的 count 个截图时间点（已后移 settle 秒）"""
+    scores, times = change_scores(video_path)
+    return [round(t + settle, 2) for t in pick_changes(scores, times, count, min_interval, duration=duration)]
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+列式片段表 - 智能剪辑分析的数据底座
+用 NumPy 数组保存起止时间、保留标记、原因码、重要性和速度，
+文本统一放在一个去重（驻留）的字符串缓冲区中，通过偏移量访问
+"""
+import copy
+
+import numpy as np
+
+from srt import iter_srt, seconds_to_timestamp
+
+# 原因码（0 表示保留 / 无原因）
+REASONS = (
+    None,
+    'empty',
+    'filler',
+    'repetitive',
+    'too_short',
+    'duplicate',
+    'correction',
+    'target_reduction',
+)
+REASON_CODES = {reason: code for code, reason in enumerate(REASONS)}
+
+class SegmentTable:
+    """片段表：每列一个数组，行号即片段下标"""
+
+    def __init__(self, indices, start, end, text_buffer, text_offsets):
+        n = len(start)
+        self.index = np.asarray(indices, dtype=np.int64)
+        self.start = np.asarray(start, dtype=np.float64)
+        self.end = np.asarray(end, dtype=np.float64)
+        self.keep = np.ones(n, dtype=bool)
+        self.reason = np.zeros(n, dtype=np.int8)
+        self.priority = np.full(n, 10, dtype=np.int8)   # 默认优先级（数字越小越优先移除）
+        self.importance = np.full(n, 5, dtype=np.int8)  # 内容重要性（1-10，越高越重要）
+        self.speed = np.ones(n, dtype=np.float64)       # 播放速度（1.0=正常，1.5=加速）
+        self.duplicate_of = np.full(n, -1, dtype=np.int64)  # 重复片段所对应的保留片段行号
+
+        # 文本缓冲区：offsets 形状为 (n, 2)，每行是 [起, 止)
+        self._buffer = text_buffer
+        self._offsets = np.asarray(text_offsets, dtype=np.int64).reshape(n, 2)
+        self.duration = self.end - self.start
+        self.text_len = self._offsets[:, 1] - self._offsets[:, 0]
+
+    @classmethod
+    def from_cues(cls, cues):
+        """从片段迭代器（如 srt.iter_srt）逐条构建，不保留中间字典"""
+        indices, starts, ends, offsets = [], [], [], []
+        chunks = []
+        interned = {}
+        cursor = 0
+        for cue in cues:
+            text = cue['text'].strip()
+            span = interned.get(text)
+            if span is None:
+                span = (cursor, cursor + len(text))
+                interned[text] = span
+                chunks.append(text)
+                cursor += len(text)
+            indices.append(cue['index'])
+            starts.append(cue['start_sec'])
+            ends.append(cue['end_sec'])
+            offsets.extend(span)
+        return cls(indices, starts, ends, ''.join(chunks), offsets)
+
+    @classmethod
+    def from_srt(cls, srt_path):
+        """解析 SRT 文件并构建片段表"""
+        return cls.from_cues(iter_srt(srt_path))
+
+    def copy(self):
+        """复制一份可独立修改的片段表（时间与文本列只读共享，状态列深拷贝）"""
+        other = copy.copy(self)
+        for column in ('keep', 'reason', 'priority', 'importance', 'speed', 'duplicate_of'):
+            setattr(other, column, getattr(self, column).copy())
+        return other
+
+    def __len__(self):
+        return len(self.start)
+
+    def text(self, i):
+        """第 i 个片段的文本"""
+        lo, hi = self._offsets[i]
+        return self._buffer[lo:hi]
+
+    def texts(self, rows=None):
+        """按顺序迭代文本（rows 为 None 时遍历全部）"""
+        spans = self._offsets if rows is None else self._offsets[rows]
+        buffer = self._buffer
+        for lo, hi in spans.tolist():
+            yield buffer[lo:hi]
+
+    def start_ts(self, i):
+        """第 i 个片段的 SRT 起始时间戳"""
+        return seconds_to_timestamp(self.start[i])
+
+    def mark(self, rows, reason, priority=None, importance=None):
+        """将指定行标记为移除（rows 可以是下标、下标数组或布尔掩码）"""
+        self.keep[rows] = False
+        self.reason[rows] = REASON_CODES[reason]
+        if priority is not None:
+            self.priority[rows] = priority
+        if importance is not None:
+            self.importance[rows] = importance
+
+    def retime(self, start, end):
+        """替换起止时间列（如静音修剪后），同步更新时长；不修改原数组，已有副本不受影响"""
+        self.start = np.asarray(start, dtype=np.float64)
+        self.end = np.asarray(end, dtype=np.float64)
+        self.duration = self.end - self.start
+
+    def kept_rows(self):
+        """保留片段的行号"""
+        return np.flatnonzero(self.keep)
+
+    def kept_duration(self, with_speed=False):
+        """保留片段的总时长（with_speed=True 时按播放速度折算）"""
+        if with_speed:
+            return float(np.sum(self.duration[self.keep] / self.speed[self.keep]))
+        return float(np.sum(self.duration[self.keep]))
+
+    def reason_counts(self):
+        """按原因统计移除数量（按各原因首次出现的顺序）"""
+        codes = self.reason[~self.keep]
+        uniq, first, counts = np.unique(codes, return_index=True, return_counts=True)
+        order = np.argsort(first)
+        return {REASONS[uniq[k]]: int(counts[k]) for k in order}
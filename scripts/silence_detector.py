@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+音频能量静音检测 - 修剪保留片段首尾的静音
+从源视频抽取 16kHz 单声道 PCM，内存映射后按块计算窗口 RMS（dBFS），
+只处理字幕时间轴内的首尾停顿，修剪结果直接体现为新的 start_sec / end_sec
+"""
+import os
+
+import numpy as np
+
+from ffmpeg_runner import run_ffmpeg
+from media_probe import probe_duration
+
+SAMPLE_RATE = 16000     # 抽取的 PCM 采样率
+WINDOW = 0.02           # RMS 窗口（秒）
+THRESHOLD_DB = -40.0    # 低于该能量（dBFS）视为静音
+PAD = 0.15              # 修剪后在语音前后保留的余量（秒），避免切到字头字尾
+MIN_TRIM = 0.3          # 单个片段可节省的时长低于该值时不修剪，避免碎片化
+CHUNK_SECONDS = 60      # 每次从内存映射读取的时长（秒），控制内存峰值
+
+def extract_pcm(video_path, pcm_path=None, sample_rate=SAMPLE_RATE):
+    """用 FFmpeg 抽取单声道 s16le PCM；已有且比源文件新时直接复用，返回 PCM 路径"""
+    if pcm_path is None:
+        pcm_path = os.path.splitext(video_path)[0] + f'_{sample_rate // 1000}k.pcm'
+    if os.path.exists(pcm_path) and os.path.getmtime(pcm_path) >= os.path.getmtime(video_path):
+        return pcm_path
+
+    cmd = [
+        'ffmpeg', '-y', '-i', video_path,
+        '-vn', '-ac', '1', '-ar', str(sample_rate),
+        '-f', 's16le', '-acodec', 'pcm_s16le', pcm_path
+    ]
+    job = run_ffmpeg(cmd, probe_duration(video_path), label='抽取音频')
+    if job['returncode'] != 0:
+        raise RuntimeError(f"抽取音频失败: {job['error']}")
+    return pcm_path
+
+def load_pcm(pcm_path):
+    """以只读内存映射方式打开 s16le PCM，不把整段音频读入内存"""
+    return np.memmap(pcm_path, dtype='<i2', mode='r')
+
+def window_rms_db(samples, sample_rate=SAMPLE_RATE, window=WINDOW, chunk_seconds=CHUNK_SECONDS):
+    """按块计算每个窗口的 RMS 能量（dBFS），返回 float32 数组"""
+    win = max(1, int(round(window * sample_rate)))
+    count = len(samples) // win
+    levels = np.empty(count, dtype=np.float32)
+    chunk = max(1, int(chunk_seconds * sample_rate) // win) * win
+
+    for offset in range(0, count * win, chunk):
+        block = np.asarray(samples[offset:min(offset + chunk, count * win)], dtype=np.float32)
+        block = block.reshape(-1, win) / 32768.0
+        rms = np.sqrt(np.mean(block * block, axis=1))
+        levels[offset // win:offset // win + len(rms)] = 20 * np.log10(np.maximum(rms, 1e-6))
+    return levels
+
+def trim_silence(start, end, voiced, window=WINDOW, pad=PAD, min_trim=MIN_TRIM):
+    """修剪每个片段首尾的静音
+
+    voiced 为每个窗口是否有声的布尔数组。片段内完全没有检测到声音时保持不变
+    （有字幕说明确实有内容，可能只是音量低）。返回 (new_start, new_end)。
+    """
+    start = np.asarray(start, dtype=np.float64)
+    end = np.asarray(end, dtype=np.float64)
+    n = len(voiced)
+    if n == 0 or len(start) == 0:
+        return start.copy(), end.copy()
+
+    # 每个窗口向后/向前最近的有声窗口
+    idx = np.arange(n)
+    prev_voiced = np.maximum.accumulate(np.where(voiced, idx, -1))
+    next_voiced = np.minimum.accumulate(np.where(voiced, idx, n)[::-1])[::-1]
+
+    lo = np.clip(np.floor(start / window).astype(np.int64), 0, n - 1)
+    hi = np.clip(np.ceil(end / window).astype(np.int64) - 1, 0, n - 1)
+    first = next_voiced[lo]
+    last = prev_voiced[hi]
+    has_voice = (first <= hi) & (last >= lo) & (start < n * window)
+
+    new_start = np.where(has_voice, np.maximum(start, first * window - pad), start)
+    new_end = np.where(has_voice, np.minimum(end, (last + 1) * window + pad), end)
+
+    # 节省太少的片段保持原样
+    small = (new_start - start) + (end - new_end) < min_trim
+    new_start[small] = start[small]
+    new_end[small] = end[small]
+    return new_start, new_end
+
+def detect_trims(pcm_path, start, end, threshold_db=THRESHOLD_DB, sample_rate=SAMPLE_RATE,
+                 window=WINDOW, pad=PAD, min_trim=MIN_TRIM):
+    """读取 PCM 并计算修剪后的起止时间，返回 (new_start, new_end)"""
+    levels = window_rms_db(load_pcm(pcm_path), sample_rate, window)
+    return trim_silence(start, end, levels > threshold_db, window, pad, min_trim)
@@ -1,39 +1,17 @@
 #!/usr/bin/env python3
 """智能视频剪辑分析脚本 - 通用版本"""
-import re
 import json
 import sys
 import os
 
-def timestamp_to_seconds(ts):
-    """将时间戳转换为秒数"""
-    h, m, s = ts.replace(',', '.').split(':')
-    return int(h) * 3600 + int(m) * 60 + float(s)
-
-def seconds_to_timestamp(seconds):
-    """将秒数转换为 SRT 时间戳"""
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
-    secs = int(seconds % 60)
-    millis = int((seconds - int(seconds)) * 1000)
-    return f"{hours:02d}:{minutes:02d}:{secs:02d},{millis:03d}"
+from srt import iter_srt
 
 def parse_srt(srt_path):
     """解析 SRT 文件，返回片段列表"""
-    with open(srt_path, 'r', encoding='utf-8') as f:
-        content = f.read()
-
-    pattern = r'(\d+)\n(\d{2}:\d{2}:\d{2},\d{3}) --> (\d{2}:\d{2}:\d{2},\d{3})\n(.*?)(?=\n\n|\Z)'
     segments = []
-    for match in re.finditer(pattern, content, re.DOTALL):
-        idx, start, end, text = match.groups()
+    for cue in iter_srt(srt_path):
         segments.append({
-            'index': int(idx),
-            'start': start,
-            'end': end,
-            'start_sec': timestamp_to_seconds(start),
-            'end_sec': timestamp_to_seconds(end),
-            'text': text.strip(),
+            **cue,
             'keep': True,
             'reason': None,
             'priority': 10
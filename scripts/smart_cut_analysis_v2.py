@@ -3,49 +3,35 @@
 改进点：
 1. 更智能的语气词识别和剪除
 2. 全局扫描策略，避免剪辑不均衡
-3. 优先使用加速播放（最多1.5倍），其次才剪除内容
+3. 优先使用分段加速播放（速度档位由 --speed-tiers 配置，最多为最高档），其次才剪除内容
+4. 片段数据使用列式 SegmentTable（NumPy），时长统计与筛选全部向量化
 """
-import re
+import argparse
+import csv
 import json
 import sys
 import os
 
-def timestamp_to_seconds(ts):
-    """将时间戳转换为秒数"""
-    h, m, s = ts.replace(',', '.').split(':')
-    return int(h) * 3600 + int(m) * 60 + float(s)
+import numpy as np
 
-def seconds_to_timestamp(seconds):
-    """将秒数转换为 SRT 时间戳"""
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
-    secs = int(seconds % 60)
-    millis = int((seconds - int(seconds)) * 1000)
-    return f"{hours:02d}:{minutes:02d}:{secs:02d},{millis:03d}"
+from keyword_engine import KeywordEngine, load_lexicon
+from near_duplicates import find_near_duplicates
+from cut_solver import solve_cut
+from segment_table import SegmentTable
+from silence_detector import THRESHOLD_DB, detect_trims, extract_pcm
+from speed_planner import SPEED_TIERS, plan_speeds
+
+QUESTION_PREFIXES = ('为什么', '怎么', '如何', 'why', 'how', 'what')
+
+# 高价值片段的重要性门槛（扫描汇总中统计其保留数量）
+HIGH_IMPORTANCE = 7
+
+# 近似重复检测的默认时间窗口（秒），None 表示全篇范围
+DUPLICATE_WINDOW = 300
 
 def parse_srt(srt_path):
-    """解析 SRT 文件，返回片段列表"""
-    with open(srt_path, 'r', encoding='utf-8') as f:
-        content = f.read()
-
-    pattern = r'(\d+)\n(\d{2}:\d{2}:\d{2},\d{3}) --> (\d{2}:\d{2}:\d{2},\d{3})\n(.*?)(?=\n\n|\Z)'
-    segments = []
-    for match in re.finditer(pattern, content, re.DOTALL):
-        idx, start, end, text = match.groups()
-        segments.append({
-            'index': int(idx),
-            'start': start,
-            'end': end,
-            'start_sec': timestamp_to_seconds(start),
-            'end_sec': timestamp_to_seconds(end),
-            'text': text.strip(),
-            'keep': True,
-            'reason': None,
-            'priority': 10,  # 默认优先级（数字越小越优先移除）
-            'importance': 5,  # 内容重要性（1-10，越高越重要）
-            'speed': 1.0  # 播放速度（1.0=正常，1.5=加速）
-        })
-    return segments
+    """解析 SRT 文件，返回列式片段表"""
+    return SegmentTable.from_srt(srt_path)
 
 def similarity(text1, text2):
     """简单的文本相似度计算"""
@@ -54,205 +40,200 @@ def similarity(text1, text2):
         return 0
     return len(set1 & set2) / len(set1 | set2)
 
-def is_filler_phrase(text):
-    """判断是否为语气词短语"""
-    # 扩展的语气词列表
-    filler_words = {
-        # 中文语气词
-        '嗯', '啊', '呃', '哦', '喔', '唔', '額', '嗯哼', '嗯嗯', '啊啊', '呃呃',
-        # 填充词
-        '那个', '就是', '然后', '这个', '那么', '所以说', '对吧', '你知道',
-        '怎么说呢', '就是说', '我觉得', '我认为', '应该说', '可以说',
-        # 单字
-        '那', '对', '就', '这', '是', '不', '可以', '好', '行', '嗯',
-        # 英文
-        'um', 'uh', 'er', 'ah', 'like', 'you know', 'I mean', 'OK', 'ok', 'yeah', 'well'
+def scan_lexicon(table, engine):
+    """用关键词自动机对每个片段做单次扫描，返回各类命中的布尔数组"""
+    n = len(table)
+    hits = {
+        'filler_only': np.zeros(n, dtype=bool),   # 整句只由语气词构成
+        'keyword': np.zeros(n, dtype=bool),       # 含重要关键词
+        'correction': np.zeros(n, dtype=bool),    # 含口误纠正词
     }
-
-    # 纯语气词
-    if text in filler_words:
-        return True
-
-    # 只包含语气词的组合（如"嗯 那个 就是"）
-    words = text.split()
-    if all(w in filler_words for w in words):
-        return True
-
-    # 重复的语气词（如"那个那个那个"）
-    if len(set(words)) == 1 and words[0] in filler_words:
-        return True
-
-    return False
-
-def calculate_importance(seg, all_segments, index):
-    """计算片段的内容重要性（1-10分）"""
-    text = seg['text'].strip()
-    importance = 5  # 基础分
+    for i, text in enumerate(table.texts()):
+        found, only_filler = engine.profile(text)
+        hits['filler_only'][i] = only_filler
+        hits['keyword'][i] = bool(found.get('keyword'))
+        hits['correction'][i] = bool(found.get('correction'))
+    return hits
+
+def calculate_importance(table, has_keyword):
+    """计算所有片段的内容重要性（1-10分），返回数组"""
+    n = len(table)
+    text_len = table.text_len
+    importance = np.full(n, 5, dtype=np.int16)  # 基础分
 
     # 1. 长度因素（长文本通常更重要）
-    text_len = len(text)
-    if text_len > 30:
-        importance += 3
-    elif text_len > 15:
-        importance += 2
-    elif text_len > 8:
-        importance += 1
-    elif text_len <= 3:
-        importance -= 2
+    importance += np.select(
+        [text_len > 30, text_len > 15, text_len > 8, text_len <= 3],
+        [3, 2, 1, -2],
+        default=0
+    ).astype(np.int16)
 
     # 2. 关键词因素（包含重要概念的片段）
-    important_keywords = [
-        # 技术关键词
-        '实现', '原理', '方法', '步骤', '流程', '架构', '设计', '算法', '优化',
-        '问题', '解决', '关键', '重要', '核心', '本质', '总结', '结论',
-        # 逻辑连接词
-        '首先', '其次', '最后', '因此', '所以', '但是', '然而', '不过',
-        '第一', '第二', '第三', '总之', '综上',
-        # 英文关键词
-        'implement', 'solution', 'key', 'important', 'core', 'main', 'first', 'second',
-        'finally', 'therefore', 'however', 'but', 'so', 'because'
-    ]
-
-    if any(kw in text for kw in important_keywords):
-        importance += 2
-
     # 3. 问句（通常引出重要内容）
-    if '?' in text or '？' in text or text.startswith(('为什么', '怎么', '如何', 'why', 'how', 'what')):
-        importance += 1
+    is_question = np.fromiter(
+        ('?' in text or '？' in text or text.startswith(QUESTION_PREFIXES) for text in table.texts()),
+        dtype=bool, count=n
+    )
+    importance += 2 * has_keyword
+    importance += is_question
 
     # 4. 位置因素（开头和结尾的片段通常更重要）
-    total_segments = len(all_segments)
-    if index < total_segments * 0.1:  # 前10%
-        importance += 1
-    elif index > total_segments * 0.9:  # 后10%
-        importance += 1
-
-    # 5. 与前后文的连贯性
-    if index > 0:
-        prev_text = all_segments[index - 1]['text']
-        if similarity(text, prev_text) < 0.3:  # 与前文差异大，可能是新话题
-            importance += 1
+    position = np.arange(n)
+    importance += (position < n * 0.1) | (position > n * 0.9)
+
+    # 5. 与前后文的连贯性（与前文差异大，可能是新话题）
+    if n > 1:
+        texts = table.texts()
+        prev_text = next(texts)
+        new_topic = np.zeros(n, dtype=bool)
+        for i, text in enumerate(texts, 1):
+            new_topic[i] = similarity(text, prev_text) < 0.3
+            prev_text = text
+        importance += new_topic
 
     # 限制在1-10范围内
-    return max(1, min(10, importance))
+    return np.clip(importance, 1, 10).astype(np.int8)
 
-def analyze_segments(segments):
+def analyze_segments(table, engine=None, dup_window=DUPLICATE_WINDOW):
     """分析并标记冗余片段 - 分层策略
     第1层：裁剪没声音部分（空白片段）
     第2层：剪语气词和填充词
-    第3层：剪重复语义内容
+    第3层：剪重复语义内容（MinHash/LSH 全篇检测，dup_window 秒内的重复）
+    engine 为关键词自动机，None 时使用内置默认词表
     """
+    if engine is None:
+        engine = KeywordEngine(load_lexicon())
 
-    # 第一遍：计算所有片段的重要性
-    for i, seg in enumerate(segments):
-        seg['importance'] = calculate_importance(seg, segments, i)
+    # 第一遍：单次扫描词表命中，并计算所有片段的重要性
+    hits = scan_lexicon(table, engine)
+    table.importance[:] = calculate_importance(table, hits['keyword'])
 
     # 第1层：空白片段（没声音）
     print("  第1层：检测空白片段（无声音）")
-    empty_count = 0
-    for seg in segments:
-        text = seg['text'].strip()
-        if not text:
-            seg['keep'] = False
-            seg['reason'] = 'empty'
-            seg['priority'] = 1
-            seg['importance'] = 0
-            empty_count += 1
-    print(f"    找到 {empty_count} 个空白片段")
+    empty = table.text_len == 0
+    table.mark(empty, 'empty', 1, importance=0)
+    print(f"    找到 {int(empty.sum())} 个空白片段")
 
     # 第2层：语气词和填充词
     print("  第2层：检测语气词和填充词")
-    filler_count = 0
-    for seg in segments:
-        if not seg['keep']:
-            continue
-        text = seg['text'].strip()
-
-        # 纯语气词或填充词
-        if is_filler_phrase(text):
-            seg['keep'] = False
-            seg['reason'] = 'filler'
-            seg['priority'] = 1
-            seg['importance'] = 0
-            filler_count += 1
-            continue
-
-        # 重复的单字（如 "选择选择选择"）
-        if len(set(text)) <= 3 and len(text) > 2:
-            seg['keep'] = False
-            seg['reason'] = 'repetitive'
-            seg['priority'] = 1
-            seg['importance'] = 0
-            filler_count += 1
-            continue
-
-        # 非常短的片段（少于3个字符）
-        if len(text) <= 2:
-            seg['keep'] = False
-            seg['reason'] = 'too_short'
-            seg['priority'] = 1
-            seg['importance'] = 0
-            filler_count += 1
-            continue
+    kept = table.kept_rows()
+    # 纯语气词或填充词
+    filler = table.keep & hits['filler_only']
+    # 重复的单字（如 "选择选择选择"）
+    repetitive = np.zeros(len(table), dtype=bool)
+    for i, text in zip(kept.tolist(), table.texts(kept)):
+        if not filler[i] and len(text) > 2 and len(set(text)) <= 3:
+            repetitive[i] = True
+    table.mark(filler, 'filler', 1, importance=0)
+    table.mark(repetitive, 'repetitive', 1, importance=0)
+
+    # 非常短的片段（少于3个字符）
+    too_short = table.keep & (table.text_len <= 2)
+    table.mark(too_short, 'too_short', 1, importance=0)
+
+    filler_count = int(filler.sum() + repetitive.sum() + too_short.sum())
     print(f"    找到 {filler_count} 个语气词/填充词片段")
 
     # 第3层：重复语义内容
     print("  第3层：检测重复语义内容")
     duplicate_count = 0
 
-    # 检测相邻重复内容（保留重要性更高的）
-    for i in range(1, len(segments)):
-        if not segments[i]['keep'] or not segments[i-1]['keep']:
+    # 检测全篇近似重复内容（保留重要性更高的，同分保留较早的）
+    keep = table.keep
+    importance = table.importance
+    kept = table.kept_rows()
+    pairs = find_near_duplicates(list(table.texts(kept)), table.start[kept], window=dup_window)
+    for a, b, _ in pairs:
+        i, j = int(kept[a]), int(kept[b])
+        if not keep[i] or not keep[j]:
             continue
+        # 比较重要性，移除较低的
+        loser, winner = (j, i) if importance[j] <= importance[i] else (i, j)
+        table.mark(loser, 'duplicate', 2)
+        table.duplicate_of[loser] = winner
+        duplicate_count += 1
 
-        if similarity(segments[i]['text'], segments[i-1]['text']) > 0.8:
-            # 比较重要性，移除较低的
-            if segments[i]['importance'] <= segments[i-1]['importance']:
-                segments[i]['keep'] = False
-                segments[i]['reason'] = 'duplicate'
-                segments[i]['priority'] = 2
-                duplicate_count += 1
-            else:
-                segments[i-1]['keep'] = False
-                segments[i-1]['reason'] = 'duplicate'
-                segments[i-1]['priority'] = 2
-                duplicate_count += 1
-
-    # 检测口误/自我纠正（也属于重复/冗余）
-    correction_patterns = ['不是', '我是说', '不对', '应该是', '错了', '重来', '不是不是']
-    for seg in segments:
-        if not seg['keep']:
-            continue
-        if any(p in seg['text'] for p in correction_patterns):
-            # 只标记短的纠正片段
-            if len(seg['text']) < 10:
-                seg['keep'] = False
-                seg['reason'] = 'correction'
-                seg['priority'] = 3
-                duplicate_count += 1
+    # 检测口误/自我纠正（也属于重复/冗余），只标记短的纠正片段
+    corrections = table.keep & hits['correction'] & (table.text_len < 10)
+    table.mark(corrections, 'correction', 3)
+    duplicate_count += int(corrections.sum())
+
+    restored = resolve_duplicates(table)
+    if restored:
+        print(f"    {restored} 个重复片段对应的保留片段被判为口误，改为保留重复片段")
 
     print(f"    找到 {duplicate_count} 个重复/纠正片段")
 
-    return segments
+    return table
 
-def adjust_to_target_v2(segments, original_duration, target_reduction):
+def trim_silence_layer(table, audio_path, threshold_db=THRESHOLD_DB):
+    """第1层补充：按音频能量修剪保留片段首尾的静音
+
+    audio_path 可以是视频/音频文件（自动抽取 16kHz PCM 并缓存），也可以是已抽取的 .pcm。
+    修剪直接写回片段的起止时间，执行脚本无需改动。返回 {'segments', 'saved'}。
+    """
+    if audio_path.endswith('.pcm'):
+        pcm_path = audio_path
+    else:
+        print(f"抽取音频: {audio_path}")
+        pcm_path = extract_pcm(audio_path)
+
+    kept = table.kept_rows()
+    new_start, new_end = detect_trims(
+        pcm_path, table.start[kept], table.end[kept], threshold_db=threshold_db
+    )
+    start = table.start.copy()
+    end = table.end.copy()
+    start[kept] = new_start
+    end[kept] = new_end
+    saved = float(np.sum(table.duration[kept]) - np.sum(new_end - new_start))
+    trimmed = int(np.count_nonzero((new_start != table.start[kept]) | (new_end != table.end[kept])))
+    table.retime(start, end)
+    return {'segments': trimmed, 'saved': saved}
+
+def resolve_duplicates(table):
+    """复核重复记录，返回恢复的重复片段数
+
+    顺着链条把每个重复片段指向最终保留的片段；若该片段已被口误纠正层移除，
+    同一内容会被剪两次，此时恢复第一个重复片段代替它（沿用其播放速度），其余重复片段改为指向恢复的片段。
+    """
+    restored = {}
+    for i in np.flatnonzero(table.duplicate_of >= 0).tolist():
+        target = int(table.duplicate_of[i])
+        while not table.keep[target] and table.duplicate_of[target] >= 0:
+            target = int(table.duplicate_of[target])
+        if not table.keep[target]:
+            if target not in restored:
+                table.keep[i] = True
+                table.reason[i] = 0
+                table.duplicate_of[i] = -1
+                table.speed[i] = table.speed[target]
+                restored[target] = i
+                continue
+            target = restored[target]
+        table.duplicate_of[i] = target
+    return len(restored)
+
+def adjust_to_target_v2(table, original_duration, target_reduction,
+                        keep_head=0.0, keep_tail=0.0, protect_importance=None,
+                        speed_tiers=SPEED_TIERS):
     """改进的目标调整策略：
     1. 优先裁剪没声音部分（已在analyze_segments中处理）
     2. 然后剪语气词（已在analyze_segments中处理）
     3. 再剪重复语义内容（已在analyze_segments中处理）
-    4. 然后使用加速播放（最多1.5倍）
-    5. 最后还不够才剪除有价值内容
+    4. 然后按速度档位分段加速（低重要性段落更快，最多 max(speed_tiers) 倍）
+    5. 最后还不够才剪除有价值内容（分桶背包求解）
+    返回 (片段表, 时长加权的平均速度)
+    硬约束：开头 keep_head 秒、结尾 keep_tail 秒内的片段、重要性 >= protect_importance 的片段
+    以及重复内容保留的那一份（duplicate_of 指向的片段）不剪
     """
     if target_reduction is None:
-        return segments, 1.0  # 返回片段和全局速度
+        return table, 1.0  # 返回片段表和全局速度
 
     target_duration = original_duration * (1 - target_reduction)
 
     # 计算当前保留时长
-    current_duration = sum(
-        seg['end_sec'] - seg['start_sec']
-        for seg in segments if seg['keep']
-    )
+    current_duration = table.kept_duration()
 
     print(f"\n目标调整策略（分层处理）：")
     print(f"  原始时长: {original_duration:.1f}秒")
@@ -263,38 +244,40 @@ def adjust_to_target_v2(segments, original_duration, target_reduction):
     # 如果已经达到目标
     if current_duration <= target_duration:
         print(f"  ✓ 已达到目标，无需进一步调整")
-        return segments, 1.0
+        return table, 1.0
 
     # 计算需要减少的比例
     reduction_needed = (current_duration - target_duration) / current_duration
 
-    max_speed = 1.5
-    max_speed_reduction = 1 - (1 / max_speed)  # 1.5倍速可以减少33%的时长
+    max_speed = max(speed_tiers)
+    max_speed_reduction = 1 - (1 / max_speed)  # 最高档加速能减少的时长比例（如 1.5倍速可以减少33%）
 
-    # 策略4: 优先使用加速播放（最多1.5倍）
+    # 策略4: 优先使用分段加速播放（速度档位，最多 max_speed 倍）
     if reduction_needed <= max_speed_reduction:
-        # 计算需要的播放速度
-        speed = 1 / (1 - reduction_needed)
-        speed = min(speed, max_speed)  # 限制最大1.5倍
-
-        print(f"  第4层策略: 使用 {speed:.2f}x 加速播放")
-        print(f"  预计时长: {current_duration / speed:.1f}秒")
-
-        # 标记所有保留片段使用加速
-        for seg in segments:
-            if seg['keep']:
-                seg['speed'] = speed
-
-        return segments, speed
-
-    # 策略5: 如果加速还不够，先用1.5倍加速，再剪除低价值内容
+        kept = table.kept_rows()
+        speeds, info = plan_speeds(
+            table.importance[kept], table.duration[kept], target_duration, tiers=speed_tiers
+        )
+        table.speed[kept] = speeds
+        planned_duration = table.kept_duration(with_speed=True)
+        speed = current_duration / planned_duration
+
+        print(f"  第4层策略: 分段加速（档位 {', '.join(f'{t:g}x' for t in sorted(speed_tiers))}）")
+        for tier in sorted(speed_tiers):
+            tier_duration = float(table.duration[kept][speeds == tier].sum())
+            if tier_duration > 0:
+                print(f"    {tier:g}x: {tier_duration:.1f}秒")
+        print(f"  速度切换: {info['transitions']} 次，平均 {speed:.2f}x")
+        print(f"  预计时长: {planned_duration:.1f}秒")
+
+        return table, speed
+
+    # 策略5: 如果加速还不够，先用最高档加速，再剪除低价值内容
     else:
-        print(f"  第4层策略: 使用 1.5x 加速播放")
+        print(f"  第4层策略: 使用 {max_speed:g}x 加速播放")
 
-        # 先应用1.5倍加速
-        for seg in segments:
-            if seg['keep']:
-                seg['speed'] = max_speed
+        # 先应用最高档加速
+        table.speed[table.keep] = max_speed
 
         # 加速后的时长
         duration_after_speed = current_duration / max_speed
@@ -306,97 +289,228 @@ def adjust_to_target_v2(segments, original_duration, target_reduction):
             print(f"\n  第5层策略: 剪除低价值内容")
             print(f"  还需剪除: {need_to_remove:.1f}秒")
 
-            # 按重要性排序（低重要性优先移除）
-            kept_segments = [s for s in segments if s['keep']]
-            candidates = sorted(kept_segments, key=lambda x: (x['importance'], len(x['text'])))
+            # 分桶背包求解：剪够时长的同时尽量少损失重要内容
+            kept = table.kept_rows()
+            forced = np.zeros(len(kept), dtype=bool)
+            if keep_head > 0:
+                forced |= table.start[kept] < keep_head
+            if keep_tail > 0:
+                forced |= table.end[kept] > original_duration - keep_tail
+            if protect_importance is not None:
+                forced |= table.importance[kept] >= protect_importance
+            # 重复内容只剩这一份，剪掉它会把同一内容剪两次
+            winners = np.zeros(len(table), dtype=bool)
+            winners[table.duplicate_of[table.duplicate_of >= 0]] = True
+            forced |= winners[kept]
+            if forced.any():
+                print(f"  硬约束保留: {int(forced.sum())} 个片段")
+
+            remove, info = solve_cut(
+                table.duration[kept] / max_speed, table.importance[kept], need_to_remove, forced=forced
+            )
+            table.mark(kept[remove], 'target_reduction')
 
-            removed_duration = 0
-            removed_count = 0
+            print(f"  剪除片段: {int(remove.sum())} 个")
+            print(f"  剪除时长: {info['removed']:.1f}秒")
+            if remove.any():
+                levels, counts = np.unique(table.importance[kept[remove]], return_counts=True)
+                print("  剪除重要性分布: " + ", ".join(f"{l}分×{c}" for l, c in zip(levels.tolist(), counts.tolist())))
+            if info['limited']:
+                print(f"  ⚠ 受硬约束限制，可剪内容不足，仍比目标多 {info['shortfall']:.1f}秒")
 
-            for seg in candidates:
-                if removed_duration >= need_to_remove:
-                    break
+            # 重新计算最终时长
+            final_duration = table.kept_duration(with_speed=True)
+            print(f"  最终时长: {final_duration:.1f}秒")
 
-                seg_duration = (seg['end_sec'] - seg['start_sec']) / max_speed
+        return table, max_speed
 
-                # 避免移除高重要性内容（importance >= 7）
-                if seg['importance'] >= 7:
-                    print(f"    跳过高价值内容 (重要性{seg['importance']}): {seg['text'][:30]}...")
-                    continue
+def merge_adjacent_segments(table, max_gap=0.5):
+    """合并相邻的保留片段（间隔小于max_gap秒且速度相同）"""
+    kept = table.kept_rows()
+    if len(kept) == 0:
+        return []
 
-                seg['keep'] = False
-                seg['reason'] = 'target_reduction'
-                removed_duration += seg_duration
-                removed_count += 1
+    start = table.start[kept]
+    end = table.end[kept]
+    speed = table.speed[kept]
 
-            print(f"  剪除片段: {removed_count} 个")
-            print(f"  剪除时长: {removed_duration:.1f}秒")
+    # 考虑播放速度的影响；速度不同的片段不合并
+    effective_gap = (start[1:] - end[:-1]) / speed[:-1]
+    breaks = (effective_gap > max_gap) | (speed[1:] != speed[:-1])
 
-            # 重新计算最终时长
-            final_duration = sum(
-                (seg['end_sec'] - seg['start_sec']) / seg['speed']
-                for seg in segments if seg['keep']
-            )
-            print(f"  最终时长: {final_duration:.1f}秒")
+    group_starts = np.concatenate(([0], np.flatnonzero(breaks) + 1))
+    group_ends = np.concatenate((group_starts[1:], [len(kept)]))
+    texts = list(table.texts(kept))
 
-        return segments, max_speed
+    merged = []
+    for lo, hi in zip(group_starts.tolist(), group_ends.tolist()):
+        merged.append({
+            'start_sec': float(start[lo]),
+            'end_sec': float(end[hi - 1]),
+            'text': ' '.join(texts[lo:hi]),
+            'speed': float(speed[lo])
+        })
+    return merged
 
-def merge_adjacent_segments(segments, max_gap=0.5):
-    """合并相邻的保留片段（间隔小于max_gap秒）"""
-    kept = [s for s in segments if s['keep']]
-    if not kept:
-        return []
+def parse_sweep(spec):
+    """解析 start:stop:step 形式的压缩比扫描范围（包含终点）"""
+    start, stop, step = (float(x) for x in spec.split(':'))
+    if step <= 0 or stop < start:
+        raise ValueError(f"无效的扫描范围: {spec}")
+    count = int(np.floor((stop - start) / step + 1e-9)) + 1
+    return [round(start + k * step, 4) for k in range(count)]
+
+def parse_args(argv):
+    """解析命令行参数"""
+    parser = argparse.ArgumentParser(
+        description='智能视频剪辑分析 V2',
+        epilog='例如: python smart_cut_analysis_v2.py video.srt 0.6\n'
+               '      python smart_cut_analysis_v2.py video.srt  # 智能分析，不指定压缩比\n'
+               '      python smart_cut_analysis_v2.py video.srt --sweep 0.2:0.7:0.05',
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument('srt_path', help='字幕文件路径')
+    parser.add_argument('target_reduction', nargs='?', type=float, default=None,
+                        help='目标压缩比（0-1），不指定则只做第1-3层分析')
+    parser.add_argument('--sweep', default=None, metavar='START:STOP:STEP',
+                        help='一次计算多个压缩比的剪辑方案，第1-3层只运行一次')
+    parser.add_argument('--lexicon', default=None,
+                        help='自定义词表 JSON（覆盖内置词表中出现的类别/语言，可按讲者调整）')
+    parser.add_argument('--keep-head', type=float, default=0.0,
+                        help='开头多少秒内的内容不剪（第5层硬约束）')
+    parser.add_argument('--keep-tail', type=float, default=0.0,
+                        help='结尾多少秒内的内容不剪（第5层硬约束）')
+    parser.add_argument('--protect-importance', type=int, default=None,
+                        help='重要性不低于该值的片段不剪（第5层硬约束）')
+    parser.add_argument('--speed-tiers', default=','.join(f'{t:g}' for t in SPEED_TIERS),
+                        help='第4层可用的速度档位，逗号分隔（默认 %(default)s）')
+    parser.add_argument('--audio', default=None,
+                        help='源视频/音频或 16kHz s16le .pcm，用于修剪保留片段首尾的静音')
+    parser.add_argument('--silence-db', type=float, default=THRESHOLD_DB,
+                        help='静音能量门限（dBFS，默认 %(default)s）')
+    parser.add_argument('--dup-window', type=float, default=DUPLICATE_WINDOW,
+                        help=f'重复内容检测的时间窗口（秒，默认 {DUPLICATE_WINDOW}，0 表示全篇）')
+    args = parser.parse_args(argv)
+    if args.sweep and args.target_reduction is not None:
+        parser.error('--sweep 与 target_reduction 不能同时指定')
+    return args
+
+def apply_target(table, original_duration, target_reduction, args):
+    """在片段表上执行第4-5层（按目标压缩比加速/剪除），返回全局速度"""
+    if not target_reduction:
+        return 1.0
+    _, global_speed = adjust_to_target_v2(
+        table, original_duration, target_reduction,
+        keep_head=args.keep_head, keep_tail=args.keep_tail,
+        protect_importance=args.protect_importance,
+        speed_tiers=tuple(float(t) for t in args.speed_tiers.split(','))
+    )
+    return global_speed
 
-    merged = []
-    current = {
-        'start_sec': kept[0]['start_sec'],
-        'end_sec': kept[0]['end_sec'],
-        'text': kept[0]['text'],
-        'speed': kept[0].get('speed', 1.0)
+def build_result(table, original_duration, target_reduction, global_speed, silence=None):
+    """汇总最终结果（合并片段、重复记录等），返回可写入 JSON 的字典"""
+    final_kept_count = int(np.count_nonzero(table.keep))
+    final_kept_duration = table.kept_duration(with_speed=True)
+    target_duration = None
+    if target_reduction:
+        target_duration = original_duration * (1 - target_reduction)
+
+    # 合并相邻片段
+    merged = merge_adjacent_segments(table, max_gap=0.3)
+
+    # 记录被判为重复的片段及其对应的保留片段（均为 SRT 序号）
+    duplicates = []
+    for i in np.flatnonzero(table.duplicate_of >= 0).tolist():
+        duplicates.append({
+            'index': int(table.index[i]),
+            'start_sec': float(table.start[i]),
+            'end_sec': float(table.end[i]),
+            'text': table.text(i),
+            'duplicate_of': int(table.index[table.duplicate_of[i]])
+        })
+
+    return {
+        'original_duration': original_duration,
+        'final_duration': final_kept_duration,
+        'compression_ratio': (1 - final_kept_duration/original_duration),
+        'global_speed': global_speed,
+        'target_duration': target_duration,
+        'target_error': None if target_duration is None else final_kept_duration - target_duration,
+        'total_segments': len(table),
+        'kept_segments': final_kept_count,
+        'high_importance_kept': int(np.count_nonzero(table.keep & (table.importance >= HIGH_IMPORTANCE))),
+        'merged_segments': len(merged),
+        'merged': merged,
+        'duplicates': duplicates,
+        'silence_trim': silence,
+        'strategy': 'speed_first' if global_speed > 1.0 else 'cut_only'
     }
 
-    for seg in kept[1:]:
-        gap = seg['start_sec'] - current['end_sec']
-        # 考虑播放速度的影响
-        effective_gap = gap / current['speed']
-
-        if effective_gap <= max_gap and seg.get('speed', 1.0) == current['speed']:
-            # 合并（相同速度）
-            current['end_sec'] = seg['end_sec']
-            current['text'] += ' ' + seg['text']
-        else:
-            merged.append(current)
-            current = {
-                'start_sec': seg['start_sec'],
-                'end_sec': seg['end_sec'],
-                'text': seg['text'],
-                'speed': seg.get('speed', 1.0)
-            }
-
-    merged.append(current)
-    return merged
+def save_result(result, result_path):
+    """保存分析结果 JSON"""
+    with open(result_path, 'w', encoding='utf-8') as f:
+        json.dump(result, f, ensure_ascii=False, indent=2)
 
-def main():
-    if len(sys.argv) < 2:
-        print("用法: python smart_cut_analysis_v2.py <srt_path> [target_reduction]")
-        print("例如: python smart_cut_analysis_v2.py video.srt 0.6")
-        print("      python smart_cut_analysis_v2.py video.srt  # 智能分析，不指定压缩比")
-        sys.exit(1)
+def run_sweep(table, original_duration, ratios, args, base_name, silence=None):
+    """压缩比扫描：第1-3层结果复用，对每个压缩比独立执行第4-5层并输出方案与汇总表"""
+    high_total = int(np.count_nonzero(table.keep & (table.importance >= HIGH_IMPORTANCE)))
+    rows = []
+    for ratio in ratios:
+        print(f"\n{'=' * 20} 压缩比 {ratio:.2f} {'=' * 20}")
+        trial = table.copy()
+        global_speed = apply_target(trial, original_duration, ratio, args)
+        result = build_result(trial, original_duration, ratio, global_speed, silence)
+        result['source_srt'] = os.path.abspath(args.srt_path)
+        result_path = f"{base_name}_cut_result_{ratio:.2f}.json"
+        save_result(result, result_path)
+        rows.append({
+            'target_reduction': ratio,
+            'final_duration': round(result['final_duration'], 2),
+            'compression_ratio': round(result['compression_ratio'], 4),
+            'global_speed': round(result['global_speed'], 3),
+            'kept_segments': result['kept_segments'],
+            'merged_segments': result['merged_segments'],
+            'high_importance_kept': result['high_importance_kept'],
+            'high_importance_total': high_total,
+            'target_error': round(result['target_error'] or 0.0, 2),
+            'result_path': result_path,
+        })
+
+    summary_path = base_name + '_sweep.csv'
+    with open(summary_path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+        writer.writeheader()
+        writer.writerows(rows)
+
+    print(f"\n=== 压缩比扫描汇总 ===")
+    print(f"{'目标':>6} {'最终时长':>10} {'平均速度':>8} {'合并片段':>8} {'高价值保留':>10} {'偏差':>8}")
+    for row in rows:
+        print(f"{row['target_reduction']:>6.2f} {row['final_duration']:>9.1f}s {row['global_speed']:>7.2f}x "
+              f"{row['merged_segments']:>8} {row['high_importance_kept']:>5}/{high_total:<4} {row['target_error']:>+7.1f}s")
+    print(f"\n汇总表已保存到 {summary_path}")
+    return summary_path
 
-    srt_path = sys.argv[1]
-    target_reduction = float(sys.argv[2]) if len(sys.argv) > 2 else None
+def run_analysis(args):
+    """按解析后的参数分析单个字幕文件并保存结果，返回 (result, result_path)
+
+    扫描模式下 result 为 None、result_path 为汇总表路径；没有字幕片段时返回 (None, None)。
+    """
+    srt_path = args.srt_path
+    target_reduction = args.target_reduction
+    dup_window = args.dup_window or None
+    ratios = parse_sweep(args.sweep) if args.sweep else None
 
     # 解析字幕
-    segments = parse_srt(srt_path)
-    print(f"总片段数: {len(segments)}")
+    table = parse_srt(srt_path)
+    print(f"总片段数: {len(table)}")
 
     # 计算原始时长
-    if segments:
-        original_duration = segments[-1]['end_sec']
+    if len(table):
+        original_duration = float(table.end[-1])
         print(f"原始时长: {original_duration:.2f}秒 ({original_duration/60:.1f}分钟)")
     else:
         print("没有找到字幕片段")
-        return
+        return None, None
 
     # 全局分析冗余内容
     print("\n=== 智能剪辑分层策略 ===")
@@ -404,18 +518,16 @@ def main():
     print("  1. 裁剪没声音部分（空白片段）")
     print("  2. 剪语气词和填充词")
     print("  3. 剪重复语义内容")
-    print("  4. 使用加速播放（最多1.5倍）")
+    speed_tiers = sorted(float(t) for t in args.speed_tiers.split(','))
+    print(f"  4. 分段加速播放（速度档位 {', '.join(f'{t:g}x' for t in speed_tiers)}，最多{speed_tiers[-1]:g}倍）")
     print("  5. 剪除低价值内容（最后手段）")
     print("\n执行第1-3层分析...")
-    segments = analyze_segments(segments)
+    engine = KeywordEngine(load_lexicon(args.lexicon))
+    table = analyze_segments(table, engine, dup_window=dup_window)
 
     # 统计初步分析结果
-    removed_count = sum(1 for s in segments if not s['keep'])
-    removed_reasons = {}
-    for s in segments:
-        if not s['keep']:
-            reason = s['reason']
-            removed_reasons[reason] = removed_reasons.get(reason, 0) + 1
+    removed_count = int(np.count_nonzero(~table.keep))
+    removed_reasons = table.reason_counts()
 
     print(f"\n第1-3层处理结果：")
     print(f"  移除片段总数: {removed_count}")
@@ -430,67 +542,67 @@ def main():
         }.get(reason, reason)
         print(f"    - {reason_name}: {count}")
 
+    # 按音频能量修剪首尾静音
+    silence = None
+    if args.audio:
+        silence = trim_silence_layer(table, args.audio, args.silence_db)
+        print(f"    - 首尾静音修剪: {silence['segments']} 个片段，额外节省 {silence['saved']:.2f}秒")
+
     # 计算初步保留时长
-    kept_duration = sum(s['end_sec'] - s['start_sec'] for s in segments if s['keep'])
+    kept_duration = table.kept_duration()
     print(f"  保留时长: {kept_duration:.2f}秒 ({kept_duration/60:.1f}分钟)")
     print(f"  压缩比: {(1 - kept_duration/original_duration)*100:.1f}%")
 
+    base_name = os.path.splitext(srt_path)[0]
+    if ratios:
+        return None, run_sweep(table, original_duration, ratios, args, base_name, silence)
+
     # 根据目标调整（优先加速）
-    if target_reduction:
-        segments, global_speed = adjust_to_target_v2(segments, original_duration, target_reduction)
-    else:
-        global_speed = 1.0
+    global_speed = apply_target(table, original_duration, target_reduction, args)
+    result = build_result(table, original_duration, target_reduction, global_speed, silence)
+    result['source_srt'] = os.path.abspath(srt_path)
 
     # 统计最终结果
-    final_kept_count = sum(1 for s in segments if s['keep'])
-    final_kept_duration = sum(
-        (s['end_sec'] - s['start_sec']) / s.get('speed', 1.0)
-        for s in segments if s['keep']
-    )
-
+    final_kept_duration = result['final_duration']
     print(f"\n=== 最终结果 ===")
-    print(f"保留片段: {final_kept_count} 个")
+    print(f"保留片段: {result['kept_segments']} 个")
     print(f"最终时长: {final_kept_duration:.2f}秒 ({final_kept_duration/60:.1f}分钟)")
     print(f"最终压缩比: {(1 - final_kept_duration/original_duration)*100:.1f}%")
     if global_speed > 1.0:
         print(f"播放速度: {global_speed:.2f}x")
-
-    # 合并相邻片段
-    merged = merge_adjacent_segments(segments, max_gap=0.3)
-    print(f"合并后片段数: {len(merged)}")
+    if result['target_duration'] is not None:
+        print(f"目标偏差: {result['target_error']:+.1f}秒")
+    print(f"合并后片段数: {result['merged_segments']}")
 
     # 输出保留的内容摘要（按重要性排序）
     print("\n=== 保留的主要内容（按重要性排序）===")
-    kept_with_importance = [(s, s['importance']) for s in segments if s['keep'] and len(s['text']) > 5]
-    kept_with_importance.sort(key=lambda x: x[1], reverse=True)
+    kept = table.kept_rows()
+    kept_with_importance = kept[table.text_len[kept] > 5]
+    order = np.argsort(-table.importance[kept_with_importance].astype(np.int16), kind='stable')
+    kept_with_importance = kept_with_importance[order]
 
-    for i, (seg, importance) in enumerate(kept_with_importance[:15]):
-        speed_mark = f" [{seg['speed']:.1f}x]" if seg.get('speed', 1.0) > 1.0 else ""
-        print(f"[重要性:{importance}]{speed_mark} [{seg['start']}] {seg['text']}")
+    for i in kept_with_importance[:15].tolist():
+        speed_mark = f" [{table.speed[i]:.1f}x]" if table.speed[i] > 1.0 else ""
+        print(f"[重要性:{table.importance[i]}]{speed_mark} [{table.start_ts(i)}] {table.text(i)}")
 
     if len(kept_with_importance) > 15:
         print(f"... 还有 {len(kept_with_importance) - 15} 条")
 
     # 保存分析结果
-    base_name = os.path.splitext(srt_path)[0]
     result_path = base_name + '_cut_result.json'
+    save_result(result, result_path)
 
-    result = {
-        'original_duration': original_duration,
-        'final_duration': final_kept_duration,
-        'compression_ratio': (1 - final_kept_duration/original_duration),
-        'global_speed': global_speed,
-        'total_segments': len(segments),
-        'kept_segments': final_kept_count,
-        'merged_segments': len(merged),
-        'merged': merged,
-        'strategy': 'speed_first' if global_speed > 1.0 else 'cut_only'
-    }
+    print(f"\n分析结果已保存到 {result_path}")
+    return result, result_path
 
-    with open(result_path, 'w', encoding='utf-8') as f:
-        json.dump(result, f, ensure_ascii=False, indent=2)
+def main():
+    if len(sys.argv) < 2:
+        print("用法: python smart_cut_analysis_v2.py <srt_path> [target_reduction] [--sweep 0.2:0.7:0.05] [--lexicon 词表.json] [--dup-window 秒]")
+        print("例如: python smart_cut_analysis_v2.py video.srt 0.6")
+        print("      python smart_cut_analysis_v2.py video.srt  # 智能分析，不指定压缩比")
+        sys.exit(1)
 
-    print(f"\n分析结果已保存到 {result_path}")
+    run_analysis(parse_args(sys.argv[1:]))
 
 if __name__ == '__main__':
     main()
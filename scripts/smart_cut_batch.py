@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+批量智能剪辑分析 - 多进程处理整个目录
+查找根目录下的所有 SRT，用进程池并行运行 V2 分析，结果 JSON 写在各自 SRT 旁边，
+并汇总出一份 CSV/JSON 报告；结果比字幕新的文件直接跳过
+"""
+import argparse
+import contextlib
+import csv
+import io
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import smart_cut_analysis_v2 as analysis
+
+# 剪辑/处理产物生成的字幕，不作为分析输入
+GENERATED_SUFFIXES = ('_cut.srt',)
+
+REPORT_FIELDS = [
+    'srt_path', 'status', 'original_duration', 'final_duration',
+    'compression_ratio', 'kept_segments', 'merged_segments', 'elapsed', 'error'
+]
+
+def find_srt_files(root):
+    """递归查找根目录下的 SRT 文件（按路径排序，跳过剪辑生成的字幕）"""
+    found = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames.sort()
+        for name in sorted(filenames):
+            if name.lower().endswith('.srt') and not name.endswith(GENERATED_SUFFIXES):
+                found.append(os.path.join(dirpath, name))
+    return found
+
+def result_path_for(srt_path):
+    """分析结果 JSON 的路径（与 smart_cut_analysis_v2 一致）"""
+    return os.path.splitext(srt_path)[0] + '_cut_result.json'
+
+def is_up_to_date(srt_path):
+    """结果文件存在且比字幕新"""
+    result_path = result_path_for(srt_path)
+    return os.path.exists(result_path) and os.path.getmtime(result_path) >= os.path.getmtime(srt_path)
+
+def report_row(srt_path, status, result=None, elapsed=0.0, error=''):
+    """生成报告中的一行"""
+    row = {field: '' for field in REPORT_FIELDS}
+    row.update({'srt_path': srt_path, 'status': status, 'elapsed': round(elapsed, 2), 'error': error})
+    if result:
+        row.update({
+            'original_duration': round(result['original_duration'], 2),
+            'final_duration': round(result['final_duration'], 2),
+            'compression_ratio': round(result['compression_ratio'], 4),
+            'kept_segments': result['kept_segments'],
+            'merged_segments': result['merged_segments'],
+        })
+    return row
+
+def analyze_one(srt_path, analysis_argv):
+    """子进程：分析单个字幕，日志写入字幕旁的 _cut_analysis.log，返回报告行"""
+    began = time.time()
+    log = io.StringIO()
+    try:
+        args = analysis.parse_args([srt_path] + analysis_argv)
+        with contextlib.redirect_stdout(log):
+            result, _ = analysis.run_analysis(args)
+        status = 'ok' if result else 'empty'
+        row = report_row(srt_path, status, result, time.time() - began)
+    except (Exception, SystemExit) as e:
+        row = report_row(srt_path, 'failed', elapsed=time.time() - began, error=f'{type(e).__name__}: {e}')
+
+    with open(os.path.splitext(srt_path)[0] + '_cut_analysis.log', 'w', encoding='utf-8') as f:
+        f.write(log.getvalue())
+    return row
+
+def load_existing(srt_path):
+    """读取已有的分析结果作为跳过文件的报告行"""
+    try:
+        with open(result_path_for(srt_path), 'r', encoding='utf-8') as f:
+            return report_row(srt_path, 'skipped', json.load(f))
+    except (OSError, ValueError, KeyError) as e:
+        return report_row(srt_path, 'skipped', error=f'读取已有结果失败: {e}')
+
+def write_report(rows, report_base):
+    """写出汇总报告（CSV + JSON），返回两个路径"""
+    csv_path = report_base + '.csv'
+    json_path = report_base + '.json'
+    with open(csv_path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=REPORT_FIELDS)
+        writer.writeheader()
+        writer.writerows(rows)
+    with open(json_path, 'w', encoding='utf-8') as f:
+        json.dump(rows, f, ensure_ascii=False, indent=2)
+    return csv_path, json_path
+
+def parse_args(argv):
+    """解析命令行参数；未识别的参数原样传给 smart_cut_analysis_v2"""
+    parser = argparse.ArgumentParser(
+        description='批量智能剪辑分析（V2），其余参数（如 --lexicon、--dup-window）原样传给单文件分析',
+        epilog='例如: python smart_cut_batch.py video 0.4 --jobs 4'
+    )
+    parser.add_argument('root', help='要扫描的根目录')
+    parser.add_argument('target_reduction', nargs='?', default=None,
+                        help='目标压缩比（0-1），不指定则只做第1-3层分析')
+    parser.add_argument('--jobs', type=int, default=os.cpu_count() or 1, help='并行进程数（默认 CPU 核数）')
+    parser.add_argument('--force', action='store_true', help='忽略已有结果，全部重新分析')
+    parser.add_argument('--report', default=None,
+                        help='汇总报告路径前缀（默认 <root>/smart_cut_report，生成 .csv 和 .json）')
+    args, analysis_argv = parser.parse_known_args(argv)
+    for flag in ('--sweep', '--audio'):
+        if any(a == flag or a.startswith(flag + '=') for a in analysis_argv):
+            parser.error(f'批量模式不支持 {flag}')
+    if args.target_reduction is not None:
+        analysis_argv = [args.target_reduction] + analysis_argv
+    return args, analysis_argv
+
+def main():
+    if len(sys.argv) < 2:
+        print("用法: python smart_cut_batch.py <root> [target_reduction] [--jobs N] [--force] [--report 路径前缀]")
+        print("例如: python smart_cut_batch.py video 0.4 --jobs 4")
+        sys.exit(1)
+
+    args, analysis_argv = parse_args(sys.argv[1:])
+    srt_files = find_srt_files(args.root)
+    if not srt_files:
+        print(f"{args.root} 下没有找到字幕文件")
+        return
+
+    pending = [p for p in srt_files if args.force or not is_up_to_date(p)]
+    rows = {p: load_existing(p) for p in srt_files if p not in pending}
+    print(f"找到字幕 {len(srt_files)} 个，待分析 {len(pending)} 个，跳过 {len(rows)} 个（结果已是最新）")
+
+    began = time.time()
+    if pending:
+        jobs = max(1, min(args.jobs, len(pending)))
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            futures = {pool.submit(analyze_one, p, analysis_argv): p for p in pending}
+            for done, future in enumerate(as_completed(futures), 1):
+                # 子进程崩溃（BrokenProcessPool 等）只记为该文件失败，其余结果照常汇总
+                try:
+                    row = future.result()
+                except Exception as e:
+                    row = report_row(futures[future], 'failed', error=f'{type(e).__name__}: {e}')
+                rows[row['srt_path']] = row
+                if row['status'] == 'ok':
+                    detail = f"{row['original_duration']:.0f}s -> {row['final_duration']:.0f}s ({row['compression_ratio']*100:.1f}%)"
+                else:
+                    detail = row['error'] or row['status']
+                print(f"[{done}/{len(pending)}] {row['srt_path']}: {detail}")
+
+    ordered = [rows.get(p) or report_row(p, 'failed', error='未返回结果') for p in srt_files]
+    report_base = args.report or os.path.join(args.root, 'smart_cut_report')
+    csv_path, json_path = write_report(ordered, report_base)
+
+    failed = [r for r in ordered if r['status'] == 'failed']
+    print(f"\n完成，用时 {time.time() - began:.1f}秒，失败 {len(failed)} 个")
+    print(f"汇总报告: {csv_path}")
+    print(f"          {json_path}")
+    if failed:
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
@@ -1,43 +1,45 @@
 #!/usr/bin/env python3
 """高效 FFmpeg 剪辑 - 使用 trim/concat 滤镜，保留原分辨率"""
+import argparse
 import json
-import subprocess
 import os
 import sys
+import time
 
-def seconds_to_timestamp(seconds):
-    """将秒数转换为 SRT 时间戳"""
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
-    secs = int(seconds % 60)
-    millis = int((seconds - int(seconds)) * 1000)
-    return f"{hours:02d}:{minutes:02d}:{secs:02d},{millis:03d}"
+from ffmpeg_runner import check_budget, run_ffmpeg, run_parallel, thread_args, write_metrics
+from media_probe import probe_duration
+from srt import SrtWriter
 
 def generate_new_srt(segments, output_srt_path):
     """为剪辑后的视频生成新字幕"""
-    new_srt = ""
     current_time = 0.0
 
-    for i, seg in enumerate(segments, 1):
-        duration = seg['end_sec'] - seg['start_sec']
-        start = seconds_to_timestamp(current_time)
-        end = seconds_to_timestamp(current_time + duration)
-
-        new_srt += f"{i}\n{start} --> {end}\n{seg['text']}\n\n"
-        current_time += duration
-
-    with open(output_srt_path, 'w', encoding='utf-8') as f:
-        f.write(new_srt)
+    with SrtWriter(output_srt_path) as writer:
+        for seg in segments:
+            duration = seg['end_sec'] - seg['start_sec']
+            writer.write(current_time, current_time + duration, seg['text'])
+            current_time += duration
 
     return output_srt_path
 
+def parse_args(argv):
+    """解析命令行参数"""
+    parser = argparse.ArgumentParser(description='智能剪辑执行')
+    parser.add_argument('result_json', help='分析脚本输出的 _cut_result.json')
+    parser.add_argument('input_video', help='源视频')
+    parser.add_argument('--jobs', type=int, default=1, help='同时编码的批次数（默认 1）')
+    parser.add_argument('--threads-per-job', type=int, default=0,
+                        help='每个编码任务的线程数（默认 0，由 FFmpeg 自动决定）')
+    return parser.parse_args(argv)
+
 def main():
     if len(sys.argv) < 3:
-        print("用法: python smart_cut_execute.py <result_json> <input_video>")
+        print("用法: python smart_cut_execute.py <result_json> <input_video> [--jobs N] [--threads-per-job M]")
         sys.exit(1)
 
-    result_path = sys.argv[1]
-    input_path = sys.argv[2]
+    args = parse_args(sys.argv[1:])
+    result_path = args.result_json
+    input_path = args.input_video
 
     # 读取分析结果
     with open(result_path, 'r', encoding='utf-8') as f:
@@ -56,6 +58,7 @@ def main():
     # 由于片段较多，分批处理
     batch_size = 20
     batch_files = []
+    tasks = []
 
     total_batches = (len(segments) + batch_size - 1) // batch_size
 
@@ -95,12 +98,25 @@ def main():
             '-map', '[outv]', '-map', '[outa]',
             '-c:v', 'libx264', '-preset', 'medium', '-crf', '18',  # 高质量
             '-c:a', 'aac', '-b:a', '192k',
-            batch_file
-        ]
-
-        print(f"处理批次 {batch_num}/{total_batches}...")
-        subprocess.run(cmd, capture_output=True)
-        print(f"  批次 {batch_num} 完成")
+        ] + thread_args(args.threads_per_job) + [batch_file]
+        batch_duration = sum(seg['end_sec'] - seg['start_sec'] for seg in batch_segments)
+        tasks.append((f"批次 {batch_num}/{total_batches}", cmd, batch_duration))
+
+    # 独立批次并发编码
+    check_budget(args.jobs, args.threads_per_job)
+    print(f"处理 {total_batches} 个批次（并发 {max(1, min(args.jobs, total_batches))}）...")
+    metrics = []
+    metrics_path = base_name + '_cut_metrics.json'
+    began = time.time()
+    failures = run_parallel(tasks, args.jobs, metrics=metrics)
+
+    # 有失败的批次时不合并，保留临时文件便于排查
+    if failures:
+        write_metrics(metrics, metrics_path, time.time() - began)
+        print(f"\n{len(failures)} 个批次失败，未合并输出（临时文件保留在 {temp_dir}）:")
+        for name, error in failures:
+            print(f"  {name}: {error}")
+        sys.exit(1)
 
     # 合并所有批次
     if len(batch_files) == 1:
@@ -118,7 +134,15 @@ def main():
             'ffmpeg', '-y', '-f', 'concat', '-safe', '0',
             '-i', concat_list, '-c', 'copy', output_path
         ]
-        subprocess.run(cmd, capture_output=True)
+        total_duration = sum(seg['end_sec'] - seg['start_sec'] for seg in segments)
+        job = run_ffmpeg(cmd, total_duration, label='合并')
+        metrics.append(job)
+        # 合并失败时不生成字幕、不清理，保留批次文件便于排查
+        if job['returncode'] != 0:
+            write_metrics(metrics, metrics_path, time.time() - began)
+            print(f"  合并失败: {job['error']}（临时文件保留在 {temp_dir}）")
+            sys.exit(1)
+    write_metrics(metrics, metrics_path, time.time() - began)
 
     # 生成同步字幕
     print("生成同步字幕...")
@@ -132,15 +156,13 @@ def main():
     print(f"\n剪辑完成！")
     print(f"输出视频: {output_path}")
     print(f"输出字幕: {output_srt}")
+    print(f"渲染指标: {metrics_path}")
 
     # 验证输出文件
     if os.path.exists(output_path):
         # 获取输出文件时长
-        probe_cmd = ['ffprobe', '-v', 'error', '-show_entries', 'format=duration',
-                     '-of', 'default=noprint_wrappers=1:nokey=1', output_path]
-        result = subprocess.run(probe_cmd, capture_output=True, text=True)
-        if result.stdout.strip():
-            duration = float(result.stdout.strip())
+        duration = probe_duration(output_path)
+        if duration is not None:
             print(f"输出文件时长: {duration:.1f}秒 ({duration/60:.1f}分钟)")
 
         # 获取文件大小
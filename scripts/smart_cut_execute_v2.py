@@ -1,48 +1,308 @@
 #!/usr/bin/env python3
 """高效 FFmpeg 剪辑 V2 - 支持加速播放"""
+import argparse
 import json
-import subprocess
+import shutil
 import os
 import sys
-
-def seconds_to_timestamp(seconds):
-    """将秒数转换为 SRT 时间戳"""
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
-    secs = int(seconds % 60)
-    millis = int((seconds - int(seconds)) * 1000)
-    return f"{hours:02d}:{minutes:02d}:{secs:02d},{millis:03d}"
-
-def generate_new_srt(segments, output_srt_path):
-    """为剪辑后的视频生成新字幕"""
-    new_srt = ""
-    current_time = 0.0
-
-    for i, seg in enumerate(segments, 1):
-        duration = seg['end_sec'] - seg['start_sec']
+import time
+
+import smart_render
+from audio_cut import AUDIO_CODECS, audio_stream, cut_audio, is_audio_only
+from ffmpeg_runner import check_budget, run_ffmpeg, run_parallel, thread_args, write_metrics
+from media_probe import probe_duration, probe_streams, probe_video_stream
+from proxy_cache import (PREVIEW_CRF, PREVIEW_PRESET, PROXY_CRF, PROXY_HEIGHT, PROXY_PRESET, get_proxy,
+                         proxy_path_for)
+from render_cache import RenderManifest, source_identity, split_batches, task_key
+from render_estimate import (audio_job, copy_job, encode_job, preset_warnings, print_plan, profile_key,
+                             record_history)
+from subtitle_remap import build_timeline, load_cues, measure_durations, write_remapped_srt
+
+# 成片视频编码参数
+VIDEO_PRESET = 'medium'
+VIDEO_CRF = 18  # 高质量
+
+def build_filter_complex(batch_segments, offset=0.0):
+    """为一个批次构建 trim/concat 滤镜图
+
+    offset 为输入端定位（-ss）的时间点，trim 时间相对该点计算。
+    """
+    filter_parts = []
+    concat_v = []
+    concat_a = []
+
+    for i, seg in enumerate(batch_segments):
+        start = seg['start_sec'] - offset
+        end = seg['end_sec'] - offset
         speed = seg.get('speed', 1.0)
 
-        # 考虑加速后的实际时长
-        actual_duration = duration / speed
-
-        start = seconds_to_timestamp(current_time)
-        end = seconds_to_timestamp(current_time + actual_duration)
-
-        new_srt += f"{i}\n{start} --> {end}\n{seg['text']}\n\n"
-        current_time += actual_duration
+        # 使用 trim 和 atrim 精确裁剪
+        if speed > 1.0:
+            # 需要加速
+            filter_parts.append(
+                f"[0:v]trim=start={start:.3f}:end={end:.3f},setpts=PTS-STARTPTS,setpts=PTS/{speed:.3f}[v{i}]"
+            )
+            filter_parts.append(
+                f"[0:a]atrim=start={start:.3f}:end={end:.3f},asetpts=PTS-STARTPTS,atempo={speed:.3f}[a{i}]"
+            )
+        else:
+            # 正常速度
+            filter_parts.append(
+                f"[0:v]trim=start={start:.3f}:end={end:.3f},setpts=PTS-STARTPTS[v{i}]"
+            )
+            filter_parts.append(
+                f"[0:a]atrim=start={start:.3f}:end={end:.3f},asetpts=PTS-STARTPTS[a{i}]"
+            )
+
+        concat_v.append(f"[v{i}]")
+        concat_a.append(f"[a{i}]")
+
+    n = len(batch_segments)
+    filter_complex = ";".join(filter_parts)
+    filter_complex += f";{''.join(concat_v)}concat=n={n}:v=1:a=0[outv]"
+    filter_complex += f";{''.join(concat_a)}concat=n={n}:v=0:a=1[outa]"
+    return filter_complex
+
+def removed_offset(segments):
+    """新时间轴偏移表达式：T 之前被删除的总时长（每进入一个片段累加它与上一片段之间的间隙）"""
+    terms = []
+    previous_end = 0.0
+    for seg in segments:
+        gap = seg['start_sec'] - previous_end
+        if gap > 0:
+            terms.append(f"gte(T,{seg['start_sec']:.3f})*{gap:.3f}")
+        previous_end = seg['end_sec']
+    return '+'.join(terms) or '0'
+
+def build_select_graph(segments):
+    """全片统一速度时的单次解码滤镜图：select/aselect 按时间逐帧筛选，帧流式通过，不需要缓存
+
+    时间戳在原 PTS 上减去之前删除的总时长，而不是按帧序号和标称帧率重建，
+    可变帧率（VFR）的录屏音视频也保持同步；aresample 补齐或裁掉剪辑点处音频帧粒度的误差。
+    """
+    ranges = '+'.join(f"between(t,{seg['start_sec']:.3f},{seg['end_sec']:.3f})" for seg in segments)
+    offset = removed_offset(segments)
+    return (
+        f"[0:v]select='{ranges}',setpts='PTS-({offset})/TB'[outv];\n"
+        f"[0:a]aselect='{ranges}',asetpts='PTS-({offset})/TB',aresample=async=1:first_pts=0[outa]"
+    )
+
+def render_single_pass(segments, input_path, temp_dir, output_path, threads=0, metrics=None,
+                       preset=VIDEO_PRESET, crf=VIDEO_CRF):
+    """单次解码渲染：整个剪辑方案写成一个滤镜脚本（-filter_complex_script），一次编码直接输出
+
+    无变速时使用 select/aselect 时间线；有变速时使用 trim/concat 滤镜图（concat 需要缓存帧，内存占用较高）。
+    返回失败列表。
+    """
+    if all(seg.get('speed', 1.0) == 1.0 for seg in segments):
+        graph = build_select_graph(segments)
+        mode = 'select/aselect'
+    else:
+        graph = build_filter_complex(segments).replace(';', ';\n')
+        mode = 'trim/concat'
+
+    script_path = f'{temp_dir}/filter_graph.txt'
+    with open(script_path, 'w', encoding='utf-8') as f:
+        f.write(graph)
+
+    cmd = [
+        'ffmpeg', '-y', '-i', input_path,
+        '-filter_complex_script', script_path,
+        '-map', '[outv]', '-map', '[outa]',
+        '-c:v', 'libx264', '-preset', preset, '-crf', str(crf),
+        '-c:a', 'aac', '-b:a', '192k',
+    ] + thread_args(threads) + ['-movflags', '+faststart', output_path]
+
+    print(f"单次解码渲染: {len(segments)} 个片段，{mode} 滤镜脚本 {script_path}")
+    expected = sum((seg['end_sec'] - seg['start_sec']) / seg.get('speed', 1.0) for seg in segments)
+    job_metrics = []
+    failures = run_parallel([('单次解码渲染', cmd, expected)], metrics=job_metrics)
+    print(f"  FFmpeg 峰值内存: {job_metrics[0]['max_rss_mb']:.0f} MB")
+    if metrics is not None:
+        metrics.extend(job_metrics)
+    return failures
+
+def render_batches(segments, input_path, temp_dir, batch_size=20, jobs=1, threads=0, manifest=None,
+                   metrics=None, preset=VIDEO_PRESET, crf=VIDEO_CRF):
+    """分批渲染（每批一个 trim/concat 滤镜图），jobs 个批次并发编码
+
+    批次文件按内容哈希命名；manifest 不为 None 时跳过已完成的批次并记录新完成的批次。
+    返回 (批次文件列表, 失败列表 [(批次名称, 错误信息)], 每个批次包含的片段序号)。
+    """
+    identity = source_identity(input_path)
+    batches = split_batches(segments, batch_size)
+    batch_files = []
+    groups = []
+    tasks = []
+    pending = {}
 
-    with open(output_srt_path, 'w', encoding='utf-8') as f:
-        f.write(new_srt)
+    for batch_num, batch_segments in enumerate(batches, 1):
+        # 输入端定位到本批第一个片段，避免每批都从头解码；
+        # 重编码时 -ss 为精确定位（从前一个关键帧解码并丢弃定位点之前的帧），trim 时间相对定位点
+        seek = round(batch_segments[0]['start_sec'], 3)
 
-    return output_srt_path
+        # 执行 FFmpeg 命令 - 保留原分辨率，使用高质量编码
+        cmd = [
+            'ffmpeg', '-y', '-ss', f'{seek:.3f}', '-i', input_path,
+            '-filter_complex', build_filter_complex(batch_segments, offset=seek),
+            '-map', '[outv]', '-map', '[outa]',
+            '-c:v', 'libx264', '-preset', preset, '-crf', str(crf),
+            '-c:a', 'aac', '-b:a', '192k',
+        ]
+        key = task_key(identity, cmd)
+        batch_file = f'{temp_dir}/batch_{key}.mp4'
+        batch_files.append(batch_file)
+        first = sum(len(group) for group in groups)
+        groups.append(list(range(first, first + len(batch_segments))))
+
+        expected = sum((seg['end_sec'] - seg['start_sec']) / seg.get('speed', 1.0) for seg in batch_segments)
+        if manifest and manifest.is_complete(key, batch_file, expected):
+            continue
+        name = f"批次 {batch_num}/{len(batches)}"
+        tasks.append((name, cmd + thread_args(threads) + [batch_file], expected))
+        pending[name] = (key, batch_file, expected)
+
+    reused = len(batches) - len(tasks)
+    print(f"处理 {len(tasks)} 个批次（共 {len(batches)} 个，复用已完成 {reused} 个，并发 {max(1, min(jobs, len(tasks) or 1))}）...")
+    record = (lambda name: manifest.record(*pending[name])) if manifest else None
+    failures = run_parallel(tasks, jobs, on_success=record, metrics=metrics)
+    return batch_files, failures, groups
+
+def render_smart(segments, input_path, temp_dir, jobs=1, threads=0, manifest=None, metrics=None,
+                 preset=VIDEO_PRESET, crf=VIDEO_CRF):
+    """关键帧感知渲染：完整 GOP 流复制，只重编码边界
+
+    小段只含视频，音频按整条时间轴单独编码一次，拼接时封装到一起。
+    返回 (小段文件列表, 失败列表, 每个小段所属的片段序号, 音轨文件)；不适用时返回 (None, [], None, None)。
+    """
+    pieces, detail = smart_render.prepare(segments, input_path, preset, crf)
+    if pieces is None:
+        print(f"  无法使用智能渲染（{detail}），改用整段重编码")
+        return None, [], None, None
+
+    copied, encoded = smart_render.summarize(pieces)
+    total = copied + encoded
+    print(f"智能渲染: {len(pieces)} 个小段")
+    print(f"  流复制: {copied:.1f}秒 ({copied / total * 100:.1f}%)")
+    print(f"  重编码: {encoded:.1f}秒 ({encoded / total * 100:.1f}%)")
+    has_audio = audio_stream(probe_streams(input_path)) is not None
+    files, audio_file, failures = smart_render.render_pieces(pieces, input_path, temp_dir, detail, jobs, threads,
+                                                             manifest, metrics, segments if has_audio else None)
+    return files, failures, [[piece['segment']] for piece in pieces], audio_file
+
+def concat_files(files, output_path, temp_dir, duration=None, metrics=None, audio=None):
+    """用 concat demuxer 无损拼接（单个 mp4 文件直接复制，缓存保留），返回是否成功
+
+    audio 为单独编码的整轨音频时，与拼接后的视频一起封装（流复制）。
+    """
+    if len(files) == 1 and files[0].endswith('.mp4') and audio is None:
+        # 只有一个批次，直接复制
+        shutil.copyfile(files[0], output_path)
+        return True
+
+    # 多个批次，使用 concat demuxer 合并
+    concat_list = f'{temp_dir}/concat_list.txt'
+    with open(concat_list, 'w') as f:
+        for bf in files:
+            f.write(f"file '{os.path.abspath(bf)}'\n")
+
+    print("合并所有批次...")
+    cmd = ['ffmpeg', '-y', '-f', 'concat', '-safe', '0', '-i', concat_list]
+    if audio:
+        cmd += ['-i', audio, '-map', '0:v:0', '-map', '1:a:0']
+    cmd += ['-c', 'copy', '-movflags', '+faststart', output_path]
+    job = run_ffmpeg(cmd, duration, label='合并')
+    if metrics is not None:
+        metrics.append(job)
+    if job['returncode'] != 0:
+        print(f"  合并失败: {job['error']}")
+    return job['returncode'] == 0
+
+def plan_render(segments, input_path, args, audio_only, height, preset=VIDEO_PRESET, crf=VIDEO_CRF):
+    """按与实际渲染相同的模式列出计划中的 FFmpeg 任务，返回 (任务列表, 高成本提示列表)"""
+    expected = sum((seg['end_sec'] - seg['start_sec']) / seg.get('speed', 1.0) for seg in segments)
+    span = (segments[0]['start_sec'], segments[-1]['end_sec'])
+    jobs = []
+    warnings = []
+    if audio_only:
+        jobs.append(audio_job('纯音频剪辑（PCM 切片）' if args.pcm else '纯音频剪辑（滤镜图）', expected, span))
+        return jobs, warnings
+
+    warnings += preset_warnings(height, preset)
+    if args.single_pass:
+        jobs.append(encode_job('单次解码渲染', expected, height, preset, crf, span))
+        if any(seg.get('speed', 1.0) != 1.0 for seg in segments):
+            warnings.append('方案包含变速片段，单次解码改用 trim/concat 滤镜图，需要缓存帧，内存占用较高')
+        return jobs, warnings
+
+    # 关键帧索引只读数据包标志，计划阶段也能很快得到可流复制的时长
+    pieces, detail = smart_render.prepare(segments, input_path, preset, crf)
+    if args.smart_render and pieces is not None:
+        jobs.append(audio_job('整轨音频', expected, span))
+        for i, piece in enumerate(pieces, 1):
+            name = f"小段 {i} ({piece['mode']})"
+            duration = (piece['end'] - piece['start']) / piece['speed']
+            source_range = (piece['start'], piece['end'])
+            if piece['mode'] == 'copy':
+                jobs.append(copy_job(name, duration, source_range))
+            else:
+                jobs.append(encode_job(name, duration, height, preset, crf, source_range))
+    else:
+        if args.smart_render:
+            warnings.append(f'无法使用智能渲染（{detail}），将整段重编码')
+        batches = split_batches(segments)
+        for batch_num, batch_segments in enumerate(batches, 1):
+            duration = sum((seg['end_sec'] - seg['start_sec']) / seg.get('speed', 1.0) for seg in batch_segments)
+            source_range = (batch_segments[0]['start_sec'], batch_segments[-1]['end_sec'])
+            jobs.append(encode_job(f"批次 {batch_num}/{len(batches)}", duration, height, preset, crf, source_range))
+        if pieces is not None:
+            copied, _ = smart_render.summarize(pieces)
+            if copied >= 0.3 * expected:
+                warnings.append(f'{copied:.0f}秒（{copied / expected * 100:.0f}%）落在完整 GOP 内可直接流复制，'
+                                f'当前会全部重编码，建议 --smart-render')
+
+    if len(jobs) > 1:
+        jobs.append(copy_job('合并', expected))
+    return jobs, warnings
+
+def parse_args(argv):
+    """解析命令行参数"""
+    parser = argparse.ArgumentParser(description='智能剪辑执行 V2（支持加速播放）')
+    parser.add_argument('result_json', help='smart_cut_analysis_v2 输出的 _cut_result.json')
+    parser.add_argument('input_video', help='源视频（纯音频文件自动走音频通道）')
+    parser.add_argument('--smart-render', action='store_true',
+                        help='完整 GOP 直接流复制，只重编码剪辑边界（变速片段仍整段重编码）')
+    parser.add_argument('--single-pass', action='store_true',
+                        help='只解码一次：整个方案写成一个滤镜脚本，一次编码输出（不分批、不拼接）')
+    parser.add_argument('--proxy', action='store_true',
+                        help='在 540p 代理上快速预览（代理按源文件哈希缓存），输出 _cut_proxy.mp4')
+    parser.add_argument('--srt', help='原字幕（默认取分析结果记录的字幕，或与源视频同名的 .srt）')
+    parser.add_argument('--audio-format', choices=sorted(AUDIO_CODECS), default='m4a',
+                        help='纯音频素材的输出格式（默认 m4a）')
+    parser.add_argument('--pcm', action='store_true',
+                        help='纯音频素材按采样点直接切片 PCM（最快，仅限无变速方案）')
+    parser.add_argument('--jobs', type=int, default=1, help='同时编码的批次数（默认 1）')
+    parser.add_argument('--threads-per-job', type=int, default=0,
+                        help='每个编码任务的线程数（默认 0，由 FFmpeg 自动决定）')
+    parser.add_argument('--no-resume', action='store_true',
+                        help='不复用 temp_batch 中已完成的批次，全部重新渲染')
+    parser.add_argument('--dry-run', action='store_true',
+                        help='只列出计划中的 FFmpeg 任务和预计耗时（按本机吞吐历史估算），不渲染')
+    parser.add_argument('--clean', action='store_true',
+                        help='完成后删除 temp_batch（默认保留已完成的批次，下次运行可直接复用）')
+    args = parser.parse_args(argv)
+    if args.smart_render and args.single_pass:
+        parser.error('--smart-render 与 --single-pass 不能同时使用')
+    return args
 
 def main():
     if len(sys.argv) < 3:
-        print("用法: python smart_cut_execute_v2.py <result_json> <input_video>")
+        print("用法: python smart_cut_execute_v2.py <result_json> <input_video> [--smart-render | --single-pass] [--proxy] [--audio-format m4a|opus|wav] [--pcm] [--jobs N] [--threads-per-job M] [--dry-run]")
         sys.exit(1)
 
-    result_path = sys.argv[1]
-    input_path = sys.argv[2]
+    args = parse_args(sys.argv[1:])
+    result_path = args.result_json
+    input_path = args.input_video
 
     # 读取分析结果
     with open(result_path, 'r', encoding='utf-8') as f:
@@ -55,119 +315,127 @@ def main():
     if global_speed > 1.0:
         print(f"全局加速: {global_speed:.2f}x")
 
+    # 探测输入流：没有视频流（或只有封面图）时走纯音频通道
+    streams = probe_streams(input_path)
+    audio_only = is_audio_only(streams)
+    if audio_only and args.proxy:
+        print("纯音频素材无需代理，忽略 --proxy")
+        args.proxy = False
+
     # 生成输出路径
     base_name = os.path.splitext(input_path)[0]
-    output_path = base_name + '_cut.mp4'
-    output_srt = base_name + '_cut.srt'
+    suffix = '_cut_proxy' if args.proxy else '_cut'
+    output_path = base_name + suffix + ('.' + args.audio_format if audio_only else '.mp4')
+    output_srt = base_name + suffix + '.srt'
     temp_dir = os.path.dirname(input_path) + '/temp_batch'
 
-    os.makedirs(temp_dir, exist_ok=True)
-
-    # 由于片段较多，分批处理
-    batch_size = 20
-    batch_files = []
-
-    total_batches = (len(segments) + batch_size - 1) // batch_size
-
-    for batch_idx in range(0, len(segments), batch_size):
-        batch_num = batch_idx // batch_size + 1
-        batch_segments = segments[batch_idx:batch_idx + batch_size]
-        batch_file = f'{temp_dir}/batch_{batch_idx:04d}.mp4'
-        batch_files.append(batch_file)
+    # 预览模式：同一剪辑方案渲染到代理上（时间轴与源视频一致），使用快速编码参数
+    preset, crf = VIDEO_PRESET, VIDEO_CRF
+    height = 0
+    if not audio_only:
+        height = int((probe_video_stream(input_path) or {}).get('height') or 0)
+    if args.dry_run:
+        jobs = []
+        if args.proxy and not os.path.exists(proxy_path_for(input_path)):
+            jobs.append(encode_job('生成代理', probe_duration(input_path) or 0.0, height, PROXY_PRESET, PROXY_CRF))
+        elif args.proxy:
+            input_path = proxy_path_for(input_path)
+        if args.proxy:
+            height, preset, crf = PROXY_HEIGHT, PREVIEW_PRESET, PREVIEW_CRF
+        planned, warnings = plan_render(segments, input_path, args, audio_only, height, preset, crf)
+        check_budget(args.jobs, args.threads_per_job)
+        print_plan(jobs + planned, 1 if args.single_pass or audio_only else args.jobs, warnings)
+        return
+    if args.proxy:
+        input_path = get_proxy(input_path)
+        height, preset, crf = PROXY_HEIGHT, PREVIEW_PRESET, PREVIEW_CRF
 
-        # 构建 filter_complex
-        filter_parts = []
-        concat_v = []
-        concat_a = []
-
-        for i, seg in enumerate(batch_segments):
-            start = seg['start_sec']
-            end = seg['end_sec']
-            speed = seg.get('speed', 1.0)
-
-            # 使用 trim 和 atrim 精确裁剪
-            if speed > 1.0:
-                # 需要加速
-                filter_parts.append(
-                    f"[0:v]trim=start={start:.3f}:end={end:.3f},setpts=PTS-STARTPTS,setpts=PTS/{speed:.3f}[v{i}]"
-                )
-                filter_parts.append(
-                    f"[0:a]atrim=start={start:.3f}:end={end:.3f},asetpts=PTS-STARTPTS,atempo={speed:.3f}[a{i}]"
-                )
-            else:
-                # 正常速度
-                filter_parts.append(
-                    f"[0:v]trim=start={start:.3f}:end={end:.3f},setpts=PTS-STARTPTS[v{i}]"
-                )
-                filter_parts.append(
-                    f"[0:a]atrim=start={start:.3f}:end={end:.3f},asetpts=PTS-STARTPTS[a{i}]"
-                )
-
-            concat_v.append(f"[v{i}]")
-            concat_a.append(f"[a{i}]")
-
-        n = len(batch_segments)
-        filter_complex = ";".join(filter_parts)
-        filter_complex += f";{''.join(concat_v)}concat=n={n}:v=1:a=0[outv]"
-        filter_complex += f";{''.join(concat_a)}concat=n={n}:v=0:a=1[outa]"
-
-        # 执行 FFmpeg 命令 - 保留原分辨率，使用高质量编码
-        cmd = [
-            'ffmpeg', '-y', '-i', input_path,
-            '-filter_complex', filter_complex,
-            '-map', '[outv]', '-map', '[outa]',
-            '-c:v', 'libx264', '-preset', 'medium', '-crf', '18',  # 高质量
-            '-c:a', 'aac', '-b:a', '192k',
-            batch_file
-        ]
+    os.makedirs(temp_dir, exist_ok=True)
 
-        print(f"处理批次 {batch_num}/{total_batches}...")
-        result = subprocess.run(cmd, capture_output=True, text=True)
-        if result.returncode != 0:
-            print(f"  警告: 批次 {batch_num} 处理出错")
-            print(f"  错误信息: {result.stderr[-500:]}")  # 只显示最后500字符
-        else:
-            print(f"  批次 {batch_num} 完成")
+    # 续跑清单：已完成且校验通过的批次直接复用
+    manifest = None if args.no_resume else RenderManifest(temp_dir)
+
+    # 每个 FFmpeg 任务的耗时指标（墙钟时间、实时倍率、CPU 时间）
+    metrics = []
+    metrics_path = base_name + suffix + '_metrics.json'
+    began = time.time()
+    expected_duration = sum((seg['end_sec'] - seg['start_sec']) / seg.get('speed', 1.0) for seg in segments)
+
+    check_budget(args.jobs, args.threads_per_job)
+    files = None
+    groups = None
+    audio_track = None
+    failures = []
+    if audio_only:
+        if not cut_audio(segments, input_path, output_path, temp_dir, audio_stream(streams),
+                         args.audio_format, args.pcm, metrics):
+            failures = [('纯音频剪辑', '见上方输出')]
+        files = []
+    elif args.single_pass:
+        failures = render_single_pass(segments, input_path, temp_dir, output_path,
+                                      args.threads_per_job, metrics, preset, crf)
+        files = []
+    elif args.smart_render:
+        files, failures, groups, audio_track = render_smart(segments, input_path, temp_dir, args.jobs,
+                                                            args.threads_per_job, manifest, metrics, preset, crf)
+    if files is None:
+        # 由于片段较多，分批处理
+        files, failures, groups = render_batches(segments, input_path, temp_dir, jobs=args.jobs,
+                                                 threads=args.threads_per_job, manifest=manifest,
+                                                 metrics=metrics, preset=preset, crf=crf)
+
+    # 有失败的批次时不合并，保留临时文件便于排查
+    if failures:
+        write_metrics(metrics, metrics_path, time.time() - began)
+        print(f"\n{len(failures)} 个任务失败，未合并输出（临时文件保留在 {temp_dir}）:")
+        for name, error in failures:
+            print(f"  {name}: {error}")
+        sys.exit(1)
 
     # 合并所有批次
-    if len(batch_files) == 1:
-        # 只有一个批次，直接重命名
-        os.rename(batch_files[0], output_path)
-    else:
-        # 多个批次，使用 concat demuxer 合并
-        concat_list = f'{temp_dir}/concat_list.txt'
-        with open(concat_list, 'w') as f:
-            for bf in batch_files:
-                f.write(f"file '{bf}'\n")
-
-        print("合并所有批次...")
-        cmd = [
-            'ffmpeg', '-y', '-f', 'concat', '-safe', '0',
-            '-i', concat_list, '-c', 'copy', output_path
-        ]
-        subprocess.run(cmd, capture_output=True)
+    if files and not concat_files(files, output_path, temp_dir, expected_duration, metrics, audio_track):
+        write_metrics(metrics, metrics_path, time.time() - began)
+        sys.exit(1)
+    write_metrics(metrics, metrics_path, time.time() - began)
+    if not audio_only:
+        # 记录本机编码吞吐，供之后 --dry-run 预估耗时
+        record_history(metrics, profile_key(height, preset, crf))
 
-    # 生成同步字幕
+    # 生成同步字幕：按每个输出文件的实测时长把原字幕映射到新时间轴（无需对成片再做一次语音识别）
     print("生成同步字幕...")
-    generate_new_srt(segments, output_srt)
-
-    # 清理临时文件
-    print("清理临时文件...")
-    import shutil
-    shutil.rmtree(temp_dir, ignore_errors=True)
+    if files:
+        outputs = list(zip(files, groups))
+    else:
+        outputs = [(output_path, list(range(len(segments))))]
+    durations = measure_durations(segments, outputs)
+    cues = load_cues(args.srt or result.get('source_srt') or base_name + '.srt', segments)
+    written, dropped = write_remapped_srt(cues, build_timeline(segments, durations), output_srt)
+    print(f"  字幕 {written} 条，删除 {dropped} 条；实测时长与理论时长相差 {durations.sum() - expected_duration:+.3f}秒")
+
+    # 清理临时文件（默认保留已完成的批次，供下次运行复用；当前方案不再引用的旧批次删除）
+    if files and not args.clean:
+        removed, freed = (manifest or RenderManifest(temp_dir)).prune(files + ([audio_track] if audio_track else []))
+        if removed:
+            print(f"删除过期缓存 {removed} 个（{freed / (1 << 20):.0f} MB）")
+    if args.clean:
+        print("清理临时文件...")
+        shutil.rmtree(temp_dir, ignore_errors=True)
+    else:
+        concat_list = f'{temp_dir}/concat_list.txt'
+        if os.path.exists(concat_list):
+            os.remove(concat_list)
+        print(f"已完成的批次保留在 {temp_dir}（--clean 可删除）")
 
     print(f"\n剪辑完成！")
-    print(f"输出视频: {output_path}")
+    print(f"输出{'音频' if audio_only else '视频'}: {output_path}")
     print(f"输出字幕: {output_srt}")
+    print(f"渲染指标: {metrics_path}")
 
     # 验证输出文件
     if os.path.exists(output_path):
         # 获取输出文件时长
-        probe_cmd = ['ffprobe', '-v', 'error', '-show_entries', 'format=duration',
-                     '-of', 'default=noprint_wrappers=1:nokey=1', output_path]
-        result = subprocess.run(probe_cmd, capture_output=True, text=True)
-        if result.stdout.strip():
-            duration = float(result.stdout.strip())
+        duration = probe_duration(output_path)
+        if duration is not None:
             print(f"输出文件时长: {duration:.1f}秒 ({duration/60:.1f}分钟)")
 
         # 获取文件大小
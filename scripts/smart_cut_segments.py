@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+逐段剪辑执行 - 取代生成的 smart_cut_execute.sh
+每个保留片段单独提取为一个文件（输入端 -ss 精确定位 + -t），有界并发执行；
+失败或时长校验不通过的片段自动重试，全部通过后用 concat demuxer 直接拼接，不再整体重编码
+"""
+import argparse
+import json
+import os
+import shutil
+import sys
+import time
+
+import smart_cut_execute_v2 as execute
+from ffmpeg_runner import check_budget, run_parallel, thread_args, write_metrics
+from media_probe import probe_duration, probe_video_stream
+from render_cache import DURATION_TOLERANCE, RenderManifest, source_identity, task_key
+from render_estimate import profile_key, record_history
+from subtitle_remap import build_timeline, load_cues, measure_durations, write_remapped_srt
+
+# 与原脚本一致的逐段编码参数
+SEGMENT_PRESET = 'fast'
+SEGMENT_CRF = 23
+RETRIES = 2
+
+def segment_command(input_path, seg, preset=SEGMENT_PRESET, crf=SEGMENT_CRF):
+    """提取单个片段的命令（不含输出路径）"""
+    start = seg['start_sec']
+    duration = seg['end_sec'] - start
+    speed = seg.get('speed', 1.0)
+    # -t 放在 -i 之前限定源区间长度；放在输出端时变速片段会多截取 speed 倍的源内容
+    cmd = ['ffmpeg', '-y', '-ss', f'{start:.3f}', '-t', f'{duration:.3f}', '-i', input_path]
+    if speed != 1.0:
+        cmd += ['-filter:v', f'setpts=PTS/{speed:.3f}', '-filter:a', f'atempo={speed:.3f}']
+    cmd += [
+        '-c:v', 'libx264', '-preset', preset, '-crf', str(crf),
+        '-c:a', 'aac', '-b:a', '128k',
+    ]
+    return cmd
+
+def verify_output(output_file, expected, tolerance=DURATION_TOLERANCE):
+    """校验片段文件时长，返回错误信息（通过时为空字符串）"""
+    duration = probe_duration(output_file) if os.path.exists(output_file) else None
+    if duration is None:
+        return '无法读取输出时长'
+    if abs(duration - expected) > tolerance:
+        return f'输出时长 {duration:.3f}秒 与预期 {expected:.3f}秒 不符'
+    return ''
+
+def run_with_retries(tasks, jobs=1, retries=RETRIES, manifest=None, metrics=None):
+    """执行片段任务 [(名称, cmd, 预计时长, 输出文件, 缓存键)]，失败或校验不通过的重试 retries 次
+
+    返回最终仍失败的列表 [(名称, 错误信息)]。
+    """
+    by_name = {task[0]: task for task in tasks}
+    pending = list(tasks)
+    failed = {}
+    for attempt in range(retries + 1):
+        if attempt:
+            print(f"重试 {len(pending)} 个失败片段（第 {attempt}/{retries} 次）...")
+        invalid = {}
+
+        def verify(name):
+            _, _, expected, output_file, key = by_name[name]
+            error = verify_output(output_file, expected)
+            if error:
+                invalid[name] = error
+                print(f"  {name} 校验失败: {error}")
+            elif manifest:
+                manifest.record(key, output_file, expected)
+
+        failures = run_parallel([task[:3] for task in pending], jobs, on_success=verify, metrics=metrics)
+        failed = dict(failures)
+        failed.update(invalid)
+        pending = [task for task in pending if task[0] in failed]
+        if not pending:
+            return []
+    return [(task[0], failed[task[0]]) for task in pending]
+
+def parse_args(argv):
+    """解析命令行参数"""
+    parser = argparse.ArgumentParser(description='逐段剪辑执行（有界并发 + 重试 + 时长校验 + 无损拼接）')
+    parser.add_argument('result_json', help='smart_cut_analysis_v2 输出的 _cut_result.json')
+    parser.add_argument('input_video', help='源视频')
+    parser.add_argument('--jobs', type=int, default=max(1, (os.cpu_count() or 2) // 2),
+                        help='同时提取的片段数（默认 CPU 核数的一半）')
+    parser.add_argument('--threads-per-job', type=int, default=0,
+                        help='每个编码任务的线程数（默认 0，由 FFmpeg 自动决定）')
+    parser.add_argument('--retries', type=int, default=RETRIES, help=f'失败片段的重试次数（默认 {RETRIES}）')
+    parser.add_argument('--preset', default=SEGMENT_PRESET, help=f'x264 preset（默认 {SEGMENT_PRESET}）')
+    parser.add_argument('--crf', type=int, default=SEGMENT_CRF, help=f'x264 CRF（默认 {SEGMENT_CRF}）')
+    parser.add_argument('--srt', help='原字幕（默认取分析结果记录的字幕，或与源视频同名的 .srt）')
+    parser.add_argument('--clean', action='store_true',
+                        help='完成后删除 temp_segments（默认保留，下次运行可直接复用已完成的片段）')
+    return parser.parse_args(argv)
+
+def main():
+    if len(sys.argv) < 3:
+        print("用法: python smart_cut_segments.py <result_json> <input_video> [--jobs N] [--retries N] [--preset fast] [--crf 23]")
+        sys.exit(1)
+
+    args = parse_args(sys.argv[1:])
+    input_path = args.input_video
+    with open(args.result_json, 'r', encoding='utf-8') as f:
+        result = json.load(f)
+    segments = result['merged']
+
+    base_name = os.path.splitext(input_path)[0]
+    output_path = base_name + '_cut.mp4'
+    output_srt = base_name + '_cut.srt'
+    metrics_path = base_name + '_cut_metrics.json'
+    temp_dir = os.path.join(os.path.dirname(os.path.abspath(input_path)), 'temp_segments')
+    os.makedirs(temp_dir, exist_ok=True)
+
+    # 片段文件按内容哈希命名，已完成且校验通过的直接复用
+    manifest = RenderManifest(temp_dir)
+    identity = source_identity(input_path)
+    files = []
+    tasks = []
+    for i, seg in enumerate(segments):
+        cmd = segment_command(input_path, seg, args.preset, args.crf)
+        key = task_key(identity, cmd)
+        output_file = os.path.join(temp_dir, f'seg_{key}.mp4')
+        files.append(output_file)
+        expected = (seg['end_sec'] - seg['start_sec']) / seg.get('speed', 1.0)
+        if manifest.is_complete(key, output_file, expected):
+            continue
+        name = f"片段 {i + 1}/{len(segments)}"
+        tasks.append((name, cmd + thread_args(args.threads_per_job) + [output_file], expected, output_file, key))
+
+    check_budget(args.jobs, args.threads_per_job)
+    print(f"提取 {len(tasks)} 个片段（共 {len(segments)} 个，复用已完成 {len(segments) - len(tasks)} 个，并发 {args.jobs}）...")
+    metrics = []
+    began = time.time()
+    failures = run_with_retries(tasks, args.jobs, args.retries, manifest, metrics)
+    if failures:
+        write_metrics(metrics, metrics_path, time.time() - began)
+        print(f"\n{len(failures)} 个片段重试后仍失败，未合并输出（临时文件保留在 {temp_dir}）:")
+        for name, error in failures:
+            print(f"  {name}: {error}")
+        sys.exit(1)
+
+    # 各片段编码参数一致，concat demuxer 直接拼接，不再重编码
+    expected_duration = sum((seg['end_sec'] - seg['start_sec']) / seg.get('speed', 1.0) for seg in segments)
+    if not execute.concat_files(files, output_path, temp_dir, expected_duration, metrics):
+        write_metrics(metrics, metrics_path, time.time() - began)
+        sys.exit(1)
+    write_metrics(metrics, metrics_path, time.time() - began)
+    height = int((probe_video_stream(input_path) or {}).get('height') or 0)
+    record_history(metrics, profile_key(height, args.preset, args.crf))
+
+    print("生成同步字幕...")
+    durations = measure_durations(segments, [(path, [i]) for i, path in enumerate(files)])
+    cues = load_cues(args.srt or result.get('source_srt') or base_name + '.srt', segments)
+    written, dropped = write_remapped_srt(cues, build_timeline(segments, durations), output_srt)
+    print(f"  字幕 {written} 条，删除 {dropped} 条")
+
+    if not args.clean:
+        removed, freed = manifest.prune(files)
+        if removed:
+            print(f"删除过期缓存 {removed} 个（{freed / (1 << 20):.0f} MB）")
+    if args.clean:
+        print("清理临时文件...")
+        shutil.rmtree(temp_dir, ignore_errors=True)
+    else:
+        concat_list = os.path.join(temp_dir, 'concat_list.txt')
+        if os.path.exists(concat_list):
+            os.remove(concat_list)
+        print(f"已完成的片段保留在 {temp_dir}（--clean 可删除）")
+
+    print(f"\n剪辑完成！")
+    print(f"输出视频: {output_path}")
+    print(f"输出字幕: {output_srt}")
+    print(f"渲染指标: {metrics_path}")
+    duration = probe_duration(output_path)
+    if duration is not None:
+        print(f"输出文件时长: {duration:.1f}秒 ({duration/60:.1f}分钟)")
+
+if __name__ == '__main__':
+    main()
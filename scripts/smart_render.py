@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+关键帧感知的智能渲染 - 只重编码剪辑边界
+每个保留区间内完整的 GOP（两个关键帧之间）直接流复制，
+只有区间首尾不完整的 GOP 按源视频参数重编码；变速片段整段重编码。
+所有小片段只含视频，输出为 MPEG-TS（参数集随关键帧携带），最后用 concat demuxer 无损拼接；
+音频按整条时间轴用 atrim/concat 一次编码，拼接时封装到一起，避免每个接缝处 AAC 编码器预延迟累积漂移
+"""
+import bisect
+import os
+
+from audio_cut import build_audio_graph
+from ffmpeg_runner import run_parallel, thread_args
+from media_probe import probe_keyframes, probe_video_stream
+from render_cache import source_identity, task_key
+
+# 源视频编码 -> 重编码边界时使用的编码器
+ENCODERS = {'h264': 'libx264', 'hevc': 'libx265'}
+
+# ffprobe 的 profile 名称 -> 编码器的 -profile:v 参数
+PROFILES = {
+    'Constrained Baseline': 'baseline',
+    'Baseline': 'baseline',
+    'Main': 'main',
+    'High': 'high',
+    'High 10': 'high10',
+    'High 4:2:2': 'high422',
+    'High 4:4:4 Predictive': 'high444',
+    'Main 10': 'main10',
+}
+
+MIN_COPY = 1.0   # 可复制的完整 GOP 区间短于该值（秒）时整段重编码，避免碎片过多
+EPSILON = 1e-3   # 起止时间与关键帧的重合容差（秒）
+DEFAULT_FRAME = 1 / 30  # 读不到帧率时假定的帧时长（秒）
+
+def frame_duration(stream):
+    """一帧的时长（秒），取 r_frame_rate（可变帧率时为最高帧率，得到最短帧时长）"""
+    for key in ('r_frame_rate', 'avg_frame_rate'):
+        num, _, den = str(stream.get(key) or '').partition('/')
+        try:
+            rate = float(num) / float(den or 1)
+        except (ValueError, ZeroDivisionError):
+            continue
+        if rate > 0:
+            return 1.0 / rate
+    return DEFAULT_FRAME
+
+def plan_pieces(segments, keyframes, min_copy=MIN_COPY, frame=DEFAULT_FRAME):
+    """把剪辑片段拆分为流复制 / 重编码的小段
+
+    返回 [{'mode': 'copy'|'encode', 'start', 'end', 'speed', 'segment'}]，按输出顺序排列；
+    流复制小段另带 'pad'（半帧时长），见 piece_command。
+    """
+    pieces = []
+    for k, seg in enumerate(segments):
+        start = seg['start_sec']
+        end = seg['end_sec']
+        speed = seg.get('speed', 1.0)
+
+        first_key = last_key = None
+        if speed == 1.0 and keyframes:
+            lo = bisect.bisect_left(keyframes, start - EPSILON)
+            hi = bisect.bisect_right(keyframes, end + EPSILON) - 1
+            if lo < len(keyframes) and hi >= lo:
+                first_key = keyframes[lo]
+                last_key = min(keyframes[hi], end)
+
+        if first_key is None or last_key - first_key < min_copy:
+            pieces.append({'mode': 'encode', 'start': start, 'end': end, 'speed': speed, 'segment': k})
+            continue
+
+        if first_key - start > EPSILON:
+            pieces.append({'mode': 'encode', 'start': start, 'end': first_key, 'speed': 1.0, 'segment': k})
+        pieces.append({'mode': 'copy', 'start': first_key, 'end': last_key, 'speed': 1.0, 'segment': k,
+                       'pad': frame / 2})
+        if end - last_key > EPSILON:
+            pieces.append({'mode': 'encode', 'start': last_key, 'end': end, 'speed': 1.0, 'segment': k})
+    return pieces
+
+def encoder_args(stream, preset='medium', crf=18):
+    """与源视频流参数一致的视频编码参数；源编码不支持时返回 None"""
+    encoder = ENCODERS.get(stream.get('codec_name'))
+    if encoder is None:
+        return None
+    args = ['-c:v', encoder, '-preset', preset, '-crf', str(crf)]
+    if stream.get('pix_fmt'):
+        args += ['-pix_fmt', stream['pix_fmt']]
+    if stream.get('profile') in PROFILES:
+        args += ['-profile:v', PROFILES[stream['profile']]]
+    if stream.get('r_frame_rate') not in (None, '0/0'):
+        args += ['-r', stream['r_frame_rate']]
+    for key, option in (('color_primaries', '-color_primaries'),
+                        ('color_transfer', '-color_trc'),
+                        ('color_space', '-colorspace')):
+        if stream.get(key) and stream[key] != 'unknown':
+            args += [option, stream[key]]
+    return args
+
+def piece_command(input_path, piece, output_file, video_args):
+    """生成单个小段的 FFmpeg 命令（输入端定位，只输出视频，音频见 audio_task）
+
+    流复制小段的关键帧时间来自 ffprobe 四舍五入后的 pts_time，可能略小于真实 PTS，
+    直接定位会落到前一个关键帧、多复制一整个 GOP；因此定位到关键帧后半帧，
+    并在下一个关键帧前半帧结束。
+    """
+    start = piece['start']
+    duration = piece['end'] - start
+    if piece['mode'] == 'copy':
+        start += piece['pad']
+        duration -= 2 * piece['pad']
+    cmd = [
+        'ffmpeg', '-y', '-ss', f"{start:.6f}", '-t', f"{duration:.6f}", '-i', input_path,
+        '-map', '0:v:0', '-an'
+    ]
+    if piece['mode'] == 'copy':
+        cmd += ['-c:v', 'copy']
+    else:
+        speed = piece['speed']
+        if speed != 1.0:
+            cmd += ['-filter:v', f'setpts=PTS/{speed:.3f}']
+        cmd += video_args
+    cmd += ['-f', 'mpegts', output_file]
+    return cmd
+
+def audio_task(segments, input_path, temp_dir, identity):
+    """整条时间轴的音轨：一次解码、一次 AAC 编码，返回 (cmd, 输出文件, 缓存键, 预计时长)
+
+    滤镜图写入脚本文件，缓存键包含滤镜图内容。
+    """
+    graph = build_audio_graph(segments)
+    cmd = ['ffmpeg', '-y', '-i', input_path, '-vn', '-map', '[outa]', '-c:a', 'aac', '-b:a', '192k']
+    key = task_key(identity, cmd + [graph])
+    script_path = os.path.join(temp_dir, f"audio_graph_{key}.txt")
+    with open(script_path, 'w', encoding='utf-8') as f:
+        f.write(graph)
+    output_file = os.path.join(temp_dir, f"audio_{key}.m4a")
+    cmd = cmd[:5] + ['-filter_complex_script', script_path] + cmd[5:] + [output_file]
+    expected = sum((seg['end_sec'] - seg['start_sec']) / seg.get('speed', 1.0) for seg in segments)
+    return cmd, output_file, key, expected
+
+def prepare(segments, input_path, preset='medium', crf=18):
+    """读取关键帧索引并规划小段，返回 (pieces, video_args)；源视频不适用时返回 (None, 原因)"""
+    stream = probe_video_stream(input_path)
+    if stream is None:
+        return None, '没有视频流'
+    video_args = encoder_args(stream, preset, crf)
+    if video_args is None:
+        return None, f"不支持的视频编码 {stream.get('codec_name')}"
+    keyframes = probe_keyframes(input_path)
+    if not keyframes:
+        return None, '读取关键帧失败'
+    return plan_pieces(segments, keyframes, frame=frame_duration(stream)), video_args
+
+def summarize(pieces):
+    """统计流复制与重编码的源时长（秒）"""
+    copied = sum(p['end'] - p['start'] for p in pieces if p['mode'] == 'copy')
+    encoded = sum(p['end'] - p['start'] for p in pieces if p['mode'] == 'encode')
+    return copied, encoded
+
+def render_pieces(pieces, input_path, temp_dir, video_args, jobs=1, threads=0, manifest=None, metrics=None,
+                  segments=None):
+    """渲染全部小段（jobs 个并发），返回 (小段文件列表, 音轨文件, 失败列表)
+
+    小段按内容哈希命名；manifest 不为 None 时跳过已完成的小段并记录新完成的小段。
+    segments 不为 None 时同时渲染整条时间轴的音轨，否则音轨文件为 None（源视频没有音频）。
+    """
+    identity = source_identity(input_path)
+    files = []
+    tasks = []
+    pending = {}
+    for i, piece in enumerate(pieces):
+        cmd = piece_command(input_path, piece, None, video_args)[:-1]
+        key = task_key(identity, cmd)
+        output_file = os.path.join(temp_dir, f"piece_{key}.ts")
+        files.append(output_file)
+        expected = (piece['end'] - piece['start']) / piece['speed']
+        if manifest and manifest.is_complete(key, output_file, expected):
+            continue
+        name = f"小段 {i + 1} ({piece['mode']} {piece['start']:.3f}-{piece['end']:.3f})"
+        tasks.append((name, cmd + thread_args(threads) + [output_file], expected))
+        pending[name] = (key, output_file, expected)
+
+    if len(tasks) < len(pieces):
+        print(f"  复用已完成的小段 {len(pieces) - len(tasks)} 个")
+
+    audio_file = None
+    if segments is not None:
+        cmd, audio_file, key, expected = audio_task(segments, input_path, temp_dir, identity)
+        if not (manifest and manifest.is_complete(key, audio_file, expected)):
+            tasks.insert(0, ('整轨音频', cmd, expected))  # 音轨覆盖全片、耗时最长，最先开始
+            pending['整轨音频'] = (key, audio_file, expected)
+
+    record = (lambda name: manifest.record(*pending[name])) if manifest else None
+    return files, audio_file, run_parallel(tasks, jobs, on_success=record, metrics=metrics)
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+分段变速规划 - 少量速度档位 + 最少速度切换
+低重要性的段落走高速档，信息密集的讲解保持 1.0x；
+先按时间平滑重要性，再合并过短的速度段，使 merged 片段和执行批次保持精简
+"""
+import numpy as np
+
+SPEED_TIERS = (1.0, 1.15, 1.3, 1.5)
+SMOOTH_WINDOW = 9      # 平滑重要性的窗口（片段数，奇数）
+MIN_RUN_SECONDS = 8.0  # 同一速度段的最短时长（原始时长，秒）
+
+def _smoothed_rank(importance, durations, window):
+    """按时长加权平滑重要性，并换算为时长加权百分位（0=最不重要，1=最重要）"""
+    weights = np.ones(window)
+    num = np.convolve(importance * durations, weights, mode='same')
+    den = np.convolve(durations, weights, mode='same')
+    score = num / np.maximum(den, 1e-9)
+
+    order = np.argsort(score, kind='stable')
+    cumulative = np.cumsum(durations[order])
+    total = cumulative[-1] if len(cumulative) else 1.0
+    rank = np.empty(len(score))
+    rank[order] = (cumulative - durations[order] / 2) / max(total, 1e-9)
+    return rank
+
+def _merge_short_runs(tier_index, durations, min_run):
+    """把时长不足 min_run 的速度段并入前一段（开头的短段并入后一段）"""
+    n = len(tier_index)
+    if n == 0:
+        return tier_index
+    bounds = np.concatenate(([0], np.flatnonzero(np.diff(tier_index)) + 1, [n]))
+    run_tiers = tier_index[bounds[:-1]].tolist()
+    run_durations = np.add.reduceat(durations, bounds[:-1]).tolist()
+
+    merged = []  # [档位, 累计时长, 包含的原始段下标]
+    for k, (tier, duration) in enumerate(zip(run_tiers, run_durations)):
+        if merged and (duration < min_run or merged[-1][0] == tier):
+            merged[-1][1] += duration
+            merged[-1][2].append(k)
+        elif merged and merged[-1][1] < min_run:
+            # 开头的短段：改用当前段的档位
+            merged[-1][0] = tier
+            merged[-1][1] += duration
+            merged[-1][2].append(k)
+        else:
+            merged.append([tier, duration, [k]])
+
+    result = np.empty_like(tier_index)
+    for tier, _, runs in merged:
+        for k in runs:
+            result[bounds[k]:bounds[k + 1]] = tier
+    return result
+
+def count_transitions(speeds):
+    """相邻片段之间的速度切换次数"""
+    speeds = np.asarray(speeds)
+    return int(np.count_nonzero(speeds[1:] != speeds[:-1])) if len(speeds) > 1 else 0
+
+def plan_speeds(importance, durations, target_duration, tiers=SPEED_TIERS,
+                window=SMOOTH_WINDOW, min_run=MIN_RUN_SECONDS, iterations=40):
+    """为每个保留片段选择速度档位，使总时长不超过 target_duration
+
+    使用单一「压力」参数 p：片段档位 = ceil((p - 百分位) * 档位数)，p 越大越多片段提速；
+    二分查找满足目标的最小 p。返回 (speeds, info)。
+    """
+    tiers = np.asarray(sorted(tiers), dtype=np.float64)
+    importance = np.asarray(importance, dtype=np.float64)
+    durations = np.asarray(durations, dtype=np.float64)
+    top = len(tiers) - 1
+    info = {'pressure': 0.0, 'transitions': 0, 'reachable': True}
+    if len(durations) == 0:
+        return np.ones(0), info
+
+    window = min(window, len(durations))
+    window = max(1, window if window % 2 else window - 1)
+    rank = _smoothed_rank(importance, durations, window)
+
+    def assign(p):
+        index = np.clip(np.ceil((p - rank) * top), 0, top).astype(np.int64)
+        index = _merge_short_runs(index, durations, min_run)
+        speeds = tiers[index]
+        return speeds, float(np.sum(durations / speeds))
+
+    speeds, total = assign(0.0)
+    if total > target_duration:
+        lo, hi = 0.0, 2.0
+        if assign(hi)[1] > target_duration:
+            # 全部最高档仍达不到目标，交给后续剪除
+            speeds = np.full(len(durations), tiers[-1])
+            info['reachable'] = False
+        else:
+            for _ in range(iterations):
+                mid = (lo + hi) / 2
+                if assign(mid)[1] <= target_duration:
+                    hi = mid
+                else:
+                    lo = mid
+            speeds, total = assign(hi)
+        info['pressure'] = hi
+
+    info['transitions'] = count_transitions(speeds)
+    return speeds, info
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+SRT 字幕读写公共模块
+逐行流式解析（生成器），兼容 UTF-8 BOM / UTF-16 / CRLF，并提供配套的流式写入器
+"""
+import codecs
+import re
+
+TIMING_PATTERN = re.compile(
+    r'(\d{1,2}:\d{2}:\d{2}[,.]\d{1,3})\s*-->\s*(\d{1,2}:\d{2}:\d{2}[,.]\d{1,3})'
+)
+
+def timestamp_to_seconds(ts):
+    """将时间戳转换为秒数（支持 HH:MM:SS,mmm / MM:SS / 纯秒数）"""
+    ts = ts.strip().replace(',', '.')
+    parts = ts.split(':')
+    if len(parts) == 3:
+        h, m, s = parts
+        return int(h) * 3600 + int(m) * 60 + float(s)
+    elif len(parts) == 2:
+        m, s = parts
+        return int(m) * 60 + float(s)
+    else:
+        return float(ts)
+
+def seconds_to_timestamp(seconds):
+    """将秒数转换为 SRT 时间戳（按毫秒四舍五入，避免浮点截断误差）"""
+    total_ms = max(0, int(round(seconds * 1000)))
+    hours, rest = divmod(total_ms, 3600 * 1000)
+    minutes, rest = divmod(rest, 60 * 1000)
+    secs, millis = divmod(rest, 1000)
+    return f"{hours:02d}:{minutes:02d}:{secs:02d},{millis:03d}"
+
+def _detect_encoding(raw_head):
+    """根据 BOM 判断文件编码，无 BOM 时按 UTF-8 处理"""
+    if raw_head.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+        return 'utf-16'
+    return 'utf-8-sig'
+
+def open_srt(srt_path):
+    """以文本方式打开 SRT 文件（自动处理 BOM 与换行符）"""
+    with open(srt_path, 'rb') as f:
+        head = f.read(4)
+    return open(srt_path, 'r', encoding=_detect_encoding(head), newline=None)
+
+def _build_cue(block, fallback_index):
+    """把一个字幕块（若干行）转换为片段字典，格式不合法时返回 None"""
+    timing_pos = None
+    for pos, line in enumerate(block[:2]):
+        if '-->' in line:
+            timing_pos = pos
+            break
+    if timing_pos is None:
+        return None
+
+    match = TIMING_PATTERN.search(block[timing_pos])
+    if not match:
+        return None
+
+    index = fallback_index
+    if timing_pos == 1 and block[0].strip().isdigit():
+        index = int(block[0].strip())
+
+    start, end = match.groups()
+    start = start.replace('.', ',')
+    end = end.replace('.', ',')
+    return {
+        'index': index,
+        'start': start,
+        'end': end,
+        'start_sec': timestamp_to_seconds(start),
+        'end_sec': timestamp_to_seconds(end),
+        'text': '\n'.join(block[timing_pos + 1:]).strip()
+    }
+
+def iter_srt(source):
+    """逐条解析 SRT，生成片段字典
+
+    source 可以是文件路径，也可以是已打开的文本流。
+    每个片段包含 index / start / end / start_sec / end_sec / text。
+    """
+    if isinstance(source, (str, bytes)) or hasattr(source, '__fspath__'):
+        with open_srt(source) as f:
+            yield from iter_srt(f)
+        return
+
+    block = []
+    count = 0
+    for line in source:
+        line = line.rstrip('\r\n').lstrip('\ufeff')
+        if line.strip():
+            block.append(line)
+            continue
+        if block:
+            cue = _build_cue(block, count + 1)
+            if cue is not None:
+                count += 1
+                yield cue
+            block = []
+
+    if block:
+        cue = _build_cue(block, count + 1)
+        if cue is not None:
+            yield cue
+
+def parse_srt(srt_path):
+    """解析 SRT 文件，返回片段列表"""
+    return list(iter_srt(srt_path))
+
+class SrtWriter:
+    """流式 SRT 写入器，自动编号，逐条写盘
+
+    用法:
+        with SrtWriter(path) as writer:
+            writer.write(0.0, 1.5, '字幕')
+    """
+
+    def __init__(self, output_path, encoding='utf-8'):
+        self.output_path = output_path
+        self.encoding = encoding
+        self.count = 0
+        self._file = None
+
+    def __enter__(self):
+        self._file = open(self.output_path, 'w', encoding=self.encoding, newline='\n')
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+    def write(self, start_sec, end_sec, text):
+        """写入一条字幕，返回其序号"""
+        self.count += 1
+        start = seconds_to_timestamp(start_sec)
+        end = seconds_to_timestamp(end_sec)
+        self._file.write(f"{self.count}\n{start} --> {end}\n{text}\n\n")
+        return self.count
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+def write_srt(cues, output_path):
+    """将片段（含 start_sec / end_sec / text）流式写入 SRT，返回写入条数"""
+    with SrtWriter(output_path) as writer:
+        for cue in cues:
+            writer.write(cue['start_sec'], cue['end_sec'], cue['text'])
+    return writer.count
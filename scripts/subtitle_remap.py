@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+剪辑后字幕重映射 - 按实测输出时长把原字幕映射到新时间轴
+每个渲染产物（批次 / 小段 / 单次输出）渲染完成后读取实际时长，
+片段在输出中的位置由实测时长累加得到，不再累加理论时长，帧取整和编码器延迟不会逐段累积成漂移。
+原字幕逐条映射：与保留片段无交集的删除，跨越剪辑点的裁剪到保留部分。
+"""
+import os
+
+import numpy as np
+
+from media_probe import probe_duration
+from srt import SrtWriter, iter_srt
+
+MIN_CUE = 0.2   # 映射后短于该时长（秒）的字幕碎片丢弃
+
+def expected_durations(segments):
+    """每个片段按速度换算后的理论输出时长"""
+    return np.array([(seg['end_sec'] - seg['start_sec']) / seg.get('speed', 1.0) for seg in segments],
+                    dtype=np.float64)
+
+def measure_durations(segments, outputs):
+    """读取每个输出文件的实际时长，分摊到片段，返回每个片段的实测输出时长
+
+    outputs 为 [(文件路径, 片段序号列表)]：一个批次包含多个片段时按理论时长比例分摊；
+    一个片段拆成多个小段（智能渲染）时各小段时长累加。无法读取时长的文件按理论时长计。
+    """
+    expected = expected_durations(segments)
+    durations = np.zeros(len(segments), dtype=np.float64)
+    for path, indices in outputs:
+        idx = np.asarray(indices, dtype=np.int64)
+        planned = expected[idx].sum()
+        measured = probe_duration(path) if os.path.exists(path) else None
+        if measured is None:
+            measured = planned
+        share = expected[idx] / planned if planned > 0 else np.full(len(idx), 1.0 / len(idx))
+        np.add.at(durations, idx, measured * share)
+    return durations
+
+def build_timeline(segments, durations):
+    """源时间 -> 输出时间的分段线性映射：(源起点, 源终点, 输出起点, 缩放系数) 四个数组"""
+    src_start = np.array([seg['start_sec'] for seg in segments], dtype=np.float64)
+    src_end = np.array([seg['end_sec'] for seg in segments], dtype=np.float64)
+    durations = np.asarray(durations, dtype=np.float64)
+    out_start = np.concatenate(([0.0], np.cumsum(durations)[:-1]))
+    scale = durations / np.maximum(src_end - src_start, 1e-9)
+    return src_start, src_end, out_start, scale
+
+def remap_cues(cues, timeline, min_cue=MIN_CUE):
+    """把原字幕映射到输出时间轴，返回 [(开始, 结束, 文本)]
+
+    字幕两端裁剪到首尾两个有交集的保留片段内；中间被删掉的内容在输出中本就首尾相接，
+    因此跨越剪辑点的字幕仍为一条，不会在剪辑点处闪烁。
+    """
+    src_start, src_end, out_start, scale = timeline
+    if not cues or len(src_start) == 0:
+        return []
+
+    a = np.array([cue['start_sec'] for cue in cues], dtype=np.float64)
+    b = np.array([cue['end_sec'] for cue in cues], dtype=np.float64)
+
+    # 第一个结束晚于字幕开始的片段、最后一个开始早于字幕结束的片段
+    first = np.searchsorted(src_end, a, side='right')
+    last = np.searchsorted(src_start, b, side='left') - 1
+    valid = first <= last
+    first = np.minimum(first, len(src_start) - 1)
+    last = np.maximum(last, 0)
+
+    start = out_start[first] + (np.maximum(a, src_start[first]) - src_start[first]) * scale[first]
+    end = out_start[last] + (np.minimum(b, src_end[last]) - src_start[last]) * scale[last]
+    keep = valid & (end - start >= min_cue)
+
+    return [(float(start[i]), float(end[i]), cues[i]['text']) for i in np.flatnonzero(keep).tolist()]
+
+def load_cues(srt_path, segments):
+    """读取原字幕；找不到原字幕时以剪辑方案中的片段文本作为字幕"""
+    if srt_path and os.path.exists(srt_path):
+        return list(iter_srt(srt_path))
+    return segments
+
+def write_remapped_srt(cues, timeline, output_srt_path, min_cue=MIN_CUE):
+    """写出映射后的字幕，返回 (写入条数, 删除条数)"""
+    remapped = remap_cues(cues, timeline, min_cue)
+    with SrtWriter(output_srt_path) as writer:
+        for start, end, text in remapped:
+            writer.write(start, end, text)
+    return len(remapped), len(cues) - len(remapped)
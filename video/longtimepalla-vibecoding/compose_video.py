@@ -5,6 +5,16 @@
 
 import os
 import subprocess
+import sys
+import time
+
+# 复用 scripts/ 下的公共 FFmpeg 执行模块（进度、剩余时间、耗时指标）
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "scripts"))
+from ffmpeg_runner import run_ffmpeg, write_metrics
+from media_probe import probe_video_stream
+from proxy_cache import (PREVIEW_CRF, PREVIEW_PRESET, PREVIEW_VIDEO_ARGS, PROXY_CRF, PROXY_HEIGHT, PROXY_PRESET,
+                         get_proxy, proxy_path_for)
+from render_estimate import copy_job, encode_job, preset_warnings, print_plan, profile_key, record_history
 
 def get_duration(file_path):
     cmd = ['ffprobe', '-v', 'error', '-show_entries', 'format=duration',
@@ -15,6 +25,21 @@ def get_duration(file_path):
     except:
         return 0
 
+def get_height(file_path):
+    stream = probe_video_stream(file_path) or {}
+    return int(stream.get('height') or 0)
+
+def resolve_proxy(file_path, dry_run, plan):
+    """--proxy 时换成代理；--dry-run 时不生成代理，未缓存的计入计划"""
+    if not dry_run:
+        return get_proxy(file_path)
+    cached = proxy_path_for(file_path)
+    if os.path.exists(cached):
+        return cached
+    plan.append(encode_job(f"生成代理 {os.path.basename(file_path)}", get_duration(file_path),
+                           get_height(file_path), PROXY_PRESET, PROXY_CRF))
+    return file_path
+
 def format_time(seconds):
     """将秒数转换为分:秒格式"""
     m = int(seconds // 60)
@@ -22,6 +47,12 @@ def format_time(seconds):
     return f"{m}分{s}秒"
 
 def main():
+    # --proxy：用 540p 代理快速预览合成效果（代理按源文件哈希缓存），转场时间点不变
+    use_proxy = '--proxy' in sys.argv[1:]
+    # --dry-run：只列出计划中的 FFmpeg 任务和预计耗时，不渲染
+    dry_run = '--dry-run' in sys.argv[1:]
+    plan = []
+
     main_video = "并行长时间使用codex_cut_cn_final.mp4"
     transitions_dir = "transitions_4k"
     
@@ -32,6 +63,9 @@ def main():
         (45, f"{transitions_dir}/解决方案_4k.mp4", "解决方案"),
         (240, f"{transitions_dir}/任务处理流程_4k.mp4", "任务处理流程"),  # 调整到4分钟
     ]
+    if use_proxy:
+        main_video = resolve_proxy(main_video, dry_run, plan)
+        transitions = [(at, resolve_proxy(path, dry_run, plan), name) for at, path, name in transitions]
     
     main_dur = get_duration(main_video)
     print(f"主视频时长: {main_dur:.2f}s ({format_time(main_dur)})\n")
@@ -46,8 +80,11 @@ def main():
         trans_dur = get_duration(trans_file)
         print(f"  {i+1}. {name} - {insert_at}s ({format_time(insert_at)}) - 时长{trans_dur:.2f}s")
     
-    temp_dir = "temp_4k_compose_v2"
-    os.makedirs(temp_dir, exist_ok=True)
+    temp_dir = "temp_4k_compose_v2_proxy" if use_proxy else "temp_4k_compose_v2"
+    if not dry_run:
+        os.makedirs(temp_dir, exist_ok=True)
+    metrics = []
+    began = time.time()
     
     # 准备输入文件列表
     input_files = []
@@ -78,9 +115,12 @@ def main():
                 '-avoid_negative_ts', 'make_zero',
                 main_segment
             ]
-            subprocess.run(cmd)
+            if dry_run:
+                plan.append(copy_job(f"切分主视频 {i+1}", seg_dur, (last_end, insert_at)))
+            else:
+                metrics.append(run_ffmpeg(cmd, seg_dur, label=f"切分主视频 {i+1}"))
             
-            if os.path.exists(main_segment) and os.path.getsize(main_segment) > 10000:
+            if dry_run or (os.path.exists(main_segment) and os.path.getsize(main_segment) > 10000):
                 input_files.append(main_segment)
                 filter_parts.append(f"[{input_idx}:v:0][{input_idx}:a:0]")
                 input_idx += 1
@@ -109,9 +149,12 @@ def main():
             '-avoid_negative_ts', 'make_zero',
             final_segment
         ]
-        subprocess.run(cmd)
+        if dry_run:
+            plan.append(copy_job("切分结尾段", final_dur, (last_end, main_dur)))
+        else:
+            metrics.append(run_ffmpeg(cmd, final_dur, label="切分结尾段"))
         
-        if os.path.exists(final_segment) and os.path.getsize(final_segment) > 10000:
+        if dry_run or (os.path.exists(final_segment) and os.path.getsize(final_segment) > 10000):
             input_files.append(final_segment)
             filter_parts.append(f"[{input_idx}:v:0][{input_idx}:a:0]")
             segment_count += 1
@@ -130,6 +173,20 @@ def main():
         inputs.extend(['-i', f])
     
     output = "video_final_4k_adjusted.mp4"
+    preset, crf = 'slow', 18
+    video_args = [
+        '-c:v', 'libx264',
+        '-pix_fmt', 'yuv420p',
+        '-profile:v', 'high',
+        '-level:v', '5.2',
+        '-crf', str(crf),
+        '-preset', preset,
+    ]
+    if use_proxy:
+        output = "video_final_4k_adjusted_proxy.mp4"
+        preset, crf = PREVIEW_PRESET, PREVIEW_CRF
+        video_args = PREVIEW_VIDEO_ARGS + ['-pix_fmt', 'yuv420p']
+    height = PROXY_HEIGHT if use_proxy else get_height(main_video)
     
     cmd = [
         'ffmpeg', '-y', '-hide_banner',
@@ -137,12 +194,7 @@ def main():
         '-filter_complex', filter_complex,
         '-map', '[outv]',
         '-map', '[outa]',
-        '-c:v', 'libx264',
-        '-pix_fmt', 'yuv420p',
-        '-profile:v', 'high',
-        '-level:v', '5.2',
-        '-crf', '18',
-        '-preset', 'slow',
+    ] + video_args + [
         '-r', '30',
         '-g', '60',
         '-c:a', 'aac',
@@ -150,10 +202,22 @@ def main():
         output
     ]
     
+    if dry_run:
+        plan.append(encode_job("合成", main_dur + trans_total, height, preset, crf))
+        warnings = preset_warnings(height, preset)
+        warnings.append(f"主视频 {main_dur:.0f}秒已流复制切分，concat 滤镜仍会全部重编码；"
+                        f"转场与主视频编码参数一致时可改用 concat demuxer 直接拼接")
+        print_plan(plan, 1, warnings)
+        return
+
     print("开始渲染（这可能需要几分钟）...")
-    result = subprocess.run(cmd, capture_output=True, text=True)
+    job = run_ffmpeg(cmd, main_dur + trans_total, label="合成")
+    metrics.append(job)
+    metrics_path = os.path.splitext(output)[0] + "_metrics.json"
+    write_metrics(metrics, metrics_path, time.time() - began)
     
-    if result.returncode == 0:
+    if job['returncode'] == 0:
+        record_history(metrics, profile_key(height, preset, crf))
         out_dur = get_duration(output)
         file_size = os.path.getsize(output) / 1024 / 1024
         
@@ -163,6 +227,8 @@ def main():
         print(f"输出文件: {output}")
         print(f"视频时长: {out_dur:.2f}s ({format_time(out_dur)})")
         print(f"文件大小: {file_size:.1f}MB")
+        print(f"渲染用时: {job['wall_time']:.1f}s（{job['realtime_factor']:.2f}x 实时，CPU {job['cpu_time']:.0f}s）")
+        print(f"渲染指标: {metrics_path}")
         
         # 验证分辨率
         cmd = ['ffprobe', '-v', 'error', '-select_streams', 'v:0',
@@ -173,7 +239,7 @@ def main():
         
     else:
         print(f"\n❌ 合成失败!")
-        print(f"错误: {result.stderr[:500]}")
+        print(f"错误: {job['error']}")
 
 if __name__ == "__main__":
     main()
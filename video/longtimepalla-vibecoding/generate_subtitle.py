@@ -11,6 +11,10 @@ import json
 import tempfile
 import sys
 
+# 复用 scripts/ 下的公共 SRT 模块
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "scripts"))
+from srt import SrtWriter
+
 # ==================== 配置 ====================
 
 VIDEO_FILE = "video_final_4k.mp4"
@@ -350,28 +354,16 @@ def contextual_llm_optimize(segments):
 
 # ==================== 步骤 6: 生成 SRT ====================
 
-def format_time(seconds):
-    """格式化时间"""
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
-    secs = int(seconds % 60)
-    millis = int((seconds % 1) * 1000)
-    return f"{hours:02d}:{minutes:02d}:{secs:02d},{millis:03d}"
-
 def generate_srt(segments, output_path):
     """生成 SRT"""
     print(f"\n📝 生成 SRT...")
     
-    with open(output_path, 'w', encoding='utf-8') as f:
-        idx = 1
+    with SrtWriter(output_path) as writer:
         for seg in segments:
             text = seg['text'].strip()
             if not text:
                 continue
             
-            start = format_time(seg['start'])
-            end = format_time(seg['end'])
-            
             # 长文本换行
             if len(text) > 30:
                 mid = len(text) // 2
@@ -380,8 +372,7 @@ def generate_srt(segments, output_path):
                         text = text[:j+1] + '\n' + text[j+1:]
                         break
             
-            f.write(f"{idx}\n{start} --> {end}\n{text}\n\n")
-            idx += 1
+            writer.write(seg['start'], seg['end'], text)
     
     size = os.path.getsize(output_path) / 1024
     print(f"   ✅ 已生成: {output_path} ({size:.1f}KB)")